@@ -2,92 +2,159 @@
 import numpy as np  # Библиотека для численных вычислений и работы с многомерными массивами
 import matplotlib.pyplot as plt  # Библиотека для создания статических, анимированных и интерактивных визуализаций
 from matplotlib.animation import FuncAnimation  # Класс для создания анимации
+import os  # Пути к файлам
+import sys  # Системные операции
 
-def heart_curve(t):
-    """
-    Функция генерации точек кривой сердца
-    
-    Параметры:
-    - t: параметрический массив углов от 0 до 2π
-    
-    Возвращает:
-    - x: массив x-координат сердца
-    - y: массив y-координат сердца
-    """
-    # Параметрические уравнения сердца
-    # Математическая формула, создающая контур сердца
-    x = 16 * np.sin(t)**3  # X-координата
-    y = 13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)  # Y-координата
-    
-    return x, y
+# Корень репозитория, чтобы импортировать общий движок heart_engine
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from heart_engine import heart_contour  # Параметрическое уравнение сердца
+
+# Кадры анимации: номера кадров одного цикла
+FRAMES = np.arange(100)
+
+# Угол поворота каждого кадра (кадр - точка на окружности, сердце поворачивается на десятую часть угла)
+FRAME_ANGLES = np.linspace(0, 2*np.pi, len(FRAMES)) / 10
+
+# Количество точек кривой сердца (для гладкости)
+CURVE_POINTS = 200
 
 def rotate_heart(t, angle):
     """
     Функция поворота сердца на заданный угол
-    
+
     Параметры:
     - t: параметрический массив углов от 0 до 2π
     - angle: угол поворота
-    
+
     Возвращает:
     - rotated[:, 0]: повернутые x-координаты
     - rotated[:, 1]: повернутые y-координаты
     """
     # Получаем исходные координаты сердца
-    x, y = heart_curve(t)
-    
+    x, y = heart_contour(t)
+
     # Создаем матрицу поворота
     # Матрица поворота для 2D пространства
     rotation_matrix = np.array([
         [np.cos(angle), -np.sin(angle)],  # Первая строка матрицы поворота
         [np.sin(angle), np.cos(angle)]    # Вторая строка матрицы поворота
     ])
-    
+
     # Применяем поворот
     # Объединяем координаты в матрицу и умножаем на транспонированную матрицу поворота
     rotated = np.dot(np.column_stack([x, y]), rotation_matrix.T)
-    
+
     return rotated[:, 0], rotated[:, 1]
 
-def animate(frame):
+def rotation_matrices(angles):
+    """
+    Матрицы поворота 2D для массива углов
+
+    Параметр:
+    - angles: углы поворота (K,)
+
+    Возвращает массив матриц (K, 2, 2)
+    """
+    cos, sin = np.cos(angles), np.sin(angles)
+    return np.stack([np.stack([cos, -sin], axis=-1), np.stack([sin, cos], axis=-1)], axis=-2)
+
+class HeartCurve:
+    """
+    Вращающаяся кривая сердца на постоянных объектах matplotlib
+
+    Кривая считается один раз, на осях остается одна линия Line2D: кадр
+    поворачивает кривую в заранее выделенный массив и передает его в
+    set_data. Заголовок, подписи и сетка рисуются один раз, границы осей
+    постоянные (по описанной окружности сердца), поэтому при блиттинге
+    каждый кадр перерисовывается только линия.
+
+    С таблицей поворотов (rotation_table=True) повернутые кривые всех
+    кадров считаются заранее, и кадр только выбирает строку таблицы
+    по номеру кадра.
+    """
+
+    def __init__(self, ax, rotation_table=False):
+        """
+        Параметры:
+        - ax: оси matplotlib
+        - rotation_table: заранее повернуть кривую для всех кадров FRAME_ANGLES
+        """
+        x, y = heart_contour(np.linspace(0, 2*np.pi, CURVE_POINTS))
+        self.curve = np.column_stack([x, y])  # Исходная кривая (N, 2)
+        self.rotated = np.empty((2, CURVE_POINTS))  # Повернутые x и y кадра
+
+        # Таблица (кадры, 2, N): строки x и y повернутой кривой каждого кадра
+        self.table = None
+        if rotation_table:
+            self.table = rotation_matrices(FRAME_ANGLES) @ self.curve.T
+
+        # Постоянные границы: при любом повороте кривая остается в описанной окружности
+        radius = np.max(np.hypot(x, y)) * 1.05
+        ax.set_xlim(-radius, radius)
+        ax.set_ylim(-radius, radius)
+        ax.set_aspect('equal', adjustable='box')  # Одинаковый масштаб осей
+
+        # Настройка параметров графика
+        ax.set_title('Вращающееся сердце')  # Заголовок
+        ax.set_xlabel('X')  # Подпись оси X
+        ax.set_ylabel('Y')  # Подпись оси Y
+        ax.grid(True)  # Включение сетки
+
+        # Построение кривой сердца: линия создается один раз
+        self.line, = ax.plot(x, y, color='red')  # Красный цвет линии
+
+    def animate(self, frame):
+        """
+        Функция анимации для каждого кадра
+
+        Параметр:
+        - frame: номер текущего кадра
+
+        Возвращает изменившиеся объекты для блиттинга
+        """
+        frame = int(frame) % len(FRAME_ANGLES)
+        if self.table is not None:
+            x, y = self.table[frame]
+        else:
+            # Вращение сердца: угол поворота зависит от номера кадра
+            rotation = rotation_matrices(FRAME_ANGLES[frame])
+            np.dot(rotation, self.curve.T, out=self.rotated)
+            x, y = self.rotated
+        self.line.set_data(x, y)
+        return [self.line]
+
+def create_animation(rotation_table=False):
     """
-    Функция анимации для каждого кадра
-    
+    Фигура и функция кадра (для окна и для экспорта heart_engine.export)
+
     Параметр:
-    - frame: номер текущего кадра
+    - rotation_table: заранее повернуть кривую для всех кадров
+
+    Возвращает фигуру и функцию animate(frame) -> изменившиеся объекты
+    """
+    # Создание графического окна
+    fig, ax = plt.subplots(figsize=(8, 6))  # Размер окна 8x6 дюймов
+    heart = HeartCurve(ax, rotation_table)
+    return fig, heart.animate
+
+def main():
+    """
+    Запуск анимации: python Heart-1X.py [table] - таблица поворотов всех кадров
     """
-    # Очистка текущего графика
-    plt.clf()
-    
-    # Создание параметрического массива углов
-    # 200 точек для гладкости кривой
-    t = np.linspace(0, 2*np.pi, 200)
-    
-    # Вращение сердца
-    # Угол поворота зависит от номера кадра
-    x, y = rotate_heart(t, frame/10)
-    
-    # Построение кривой сердца
-    plt.plot(x, y, color='red')  # Красный цвет линии
-    
-    # Настройка параметров графика
-    plt.title('Вращающееся сердце')  # Заголовок
-    plt.xlabel('X')  # Подпись оси X
-    plt.ylabel('Y')  # Подпись оси Y
-    plt.axis('equal')  # Одинаковый масштаб осей
-    plt.grid(True)  # Включение сетки
-
-# Создание графического окна
-fig = plt.figure(figsize=(8, 6))  # Размер окна 8x6 дюймов
-
-# Создание анимации
-anim = FuncAnimation(
-    fig,                                     # Фигура для анимации
-    animate,                                 # Функция анимации
-    frames=np.linspace(0, 2*np.pi, 100),     # Кадры (углы поворота)
-    interval=50,                             # Интервал между кадрами (мс)
-    repeat=True                              # Повторение анимации
-)
-
-# Отображение анимации
-plt.show()
\ No newline at end of file
+    fig, animate = create_animation(rotation_table='table' in sys.argv[1:])
+
+    # Создание анимации
+    anim = FuncAnimation(
+        fig,                                     # Фигура для анимации
+        animate,                                 # Функция анимации
+        frames=FRAMES,                           # Кадры (номера кадров)
+        interval=50,                             # Интервал между кадрами (мс)
+        repeat=True,                             # Повторение анимации
+        blit=True                                # Перерисовка только линии поверх кэшированного фона
+    )
+
+    # Отображение анимации
+    plt.show()
+
+if __name__ == "__main__":
+    main()
@@ -1,144 +1,206 @@
 # Импорт необходимых библиотек
 import numpy as np  # Библиотека для численных вычислений и работы с многомерными массивами
-import matplotlib.pyplot as plt  # Библиотека для создания статических, анимированных и интерактивных визуализаций
-from matplotlib.animation import FuncAnimation  # Класс для создания анимации
 import colorsys  # Модуль для преобразования цветовых пространств (HSV в RGB)
-import math  # Математические функции (синус, косинус и др.)
+import os  # Пути к файлам
+import sys  # Системные операции
 
-def rotate_points(points, angle_y):
-    """
-    Функция поворота точек вокруг оси Y в трехмерном пространстве
-    
-    Параметры:
-    - points: массив трехмерных точек для поворота
-    - angle_y: угол поворота вокруг оси Y в радианах
-    
-    Возвращает массив повернутых точек
-    """
-    # Создаем матрицу поворота вокруг оси Y
-    Ry = np.array([
-        [np.cos(angle_y), 0, np.sin(angle_y)],     # Первая строка матрицы поворота
-        [0, 1, 0],                                 # Вторая строка (ось Y не меняется)
-        [-np.sin(angle_y), 0, np.cos(angle_y)]     # Третья строка матрицы поворота
-    ])
-    
-    # Умножаем точки на транспонированную матрицу поворота
-    return np.dot(points, Ry.T)
-
-def create_heart_points(scale=5, num_points=1000, num_layers=30):
+# Корень репозитория, чтобы импортировать общий движок heart_engine
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from heart_engine import generate_heart_points, rotation_matrix, Pulse  # Облако точек сердца, поворот и пульсация
+from heart_engine.splat import SplatCanvas, marker_diameter  # Растровый вывод точек без matplotlib
+
+# matplotlib импортируется только для окна и экспорта Agg (create_animation и main):
+# растровый экспорт create_splat обходится без него и не тратит время на импорт
+
+def create_heart_points(scale=5, num_points=1000, num_layers=30, seed=None):
     """
     Создание точек для формирования 3D-сердца
-    
+
     Параметры:
     - scale: масштаб сердца
     - num_points: количество точек на контуре
     - num_layers: количество слоев для объемности
-    
+    - seed: зерно генератора случайных чисел (None - случайное)
+
     Возвращает массив точек сердца
     """
-    # Создаем параметрический массив для генерации контура сердца
-    t = np.linspace(0, 2*np.pi, num_points)
-    
-    # Параметрические уравнения сердца (математическая формула контура)
-    x = 16 * np.sin(t)**3  # X-координата
-    y = 13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)  # Y-координата
-    z = np.zeros_like(x)  # Z-координата (изначально нулевая)
-
-    points = []
-
-    # Создание слоев для объемности сердца
-    for i in range(num_layers):
-        factor = 1 - i/num_layers  # Коэффициент уменьшения размера слоя
-        layer_x = factor * x  # X-координаты слоя
-        layer_y = factor * y  # Y-координаты слоя
-        layer_z = np.full_like(x, -i/2)  # Z-координаты слоя (смещение вглубь)
-        points.extend(zip(layer_x, layer_y, layer_z))  # Добавление точек слоя
-
-    # Добавление внутренних точек для большей реалистичности
-    for _ in range(num_points // 2):
-        # Случайные сферические координаты
-        r = np.random.random() * 0.8  # Радиус
-        theta = np.random.random() * 2 * np.pi  # Азимутальный угол
-        phi = np.random.random() * np.pi  # Полярный угол
-        
-        # Вычисление декартовых координат
-        x = r * 16 * np.sin(theta)**3 * np.sin(phi)
-        y = r * (13 * np.cos(theta) - 5 * np.cos(2*theta) - 
-                2 * np.cos(3*theta) - np.cos(4*theta)) * np.sin(phi)
-        z = r * 15 * np.cos(phi)
-        points.append((x, y, z))
-
-    # Масштабирование и преобразование в numpy-массив
-    return scale * np.array(points)
-
-def pulsating_effect(time):
-    """
-    Создание эффекта пульсации с использованием синусоиды
-    
-    Параметр:
-    - time: текущее время для анимации
-    
-    Возвращает коэффициент масштабирования
+    # Слои для объемности (смещение вглубь) и внутренние точки для реалистичности
+    return generate_heart_points(scale, num_points, num_layers,
+                                 interior_points=num_points // 2, interior_radius=0.8, interior_depth=15,
+                                 seed=seed)
+
+# Пульсация сердца: масштаб 1 + 0.05 * sin(2t)
+pulsating_effect = Pulse(0.05, 2)
+
+# Слои объемного эффекта: масштаб слоя, прозрачность и размер точек
+SCATTER_LAYERS = [(1 - i * 0.1, 0.5 - i * 0.05, 10 - i) for i in range(10)]
+
+# Кадры анимации: 200 значений времени за 10 оборотов
+FRAMES = np.linspace(0, 2*np.pi*10, 200)
+
+def heart_limits(heart_points):
+    """
+    Постоянные границы осей по наибольшему размаху пульсирующего сердца
+
+    При повороте вокруг оси Y точка удаляется от оси не дальше sqrt(x^2 + z^2),
+    а пульсация увеличивает сердце до 1 + amplitude.
+
+    Возвращает границы по X и по Y
+    """
+    peak = 1 + pulsating_effect.amplitude
+    radius = np.max(np.hypot(heart_points[:, 0], heart_points[:, 2])) * peak
+    bottom, top = np.min(heart_points[:, 1]) * peak, np.max(heart_points[:, 1]) * peak
+    margin = 0.05 * radius
+    return (-radius - margin, radius + margin), (bottom - margin, top + margin)
+
+def project_heart(heart_points, frame, out):
+    """
+    Пульсация и поворот вокруг оси Y одной матрицей: нужны только строки x и y
+
+    Параметры:
+    - heart_points: массив точек сердца (N, 3)
+    - frame: значение кадра
+    - out: массив (N, 2) для координат x, y
+
+    Возвращает out
+    """
+    transform = rotation_matrix(angle_y=frame/10)[:2] * pulsating_effect(frame/10)
+    return np.dot(heart_points, transform.T, out=out)
+
+def heart_color(frame):
+    """
+    Динамическое изменение цвета: циклическое изменение оттенка
+
+    Возвращает цвет RGB в 0..1
+    """
+    hue = (frame/100) % 1.0
+    return colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+
+class HeartAnimation:
+    """
+    Анимация сердца на постоянных объектах matplotlib
+
+    Облако точек, слои scatter, сетка и счетчик кадров создаются один раз.
+    Каждый кадр только пересчитывает координаты слоев в заранее выделенные
+    массивы и передает их в set_offsets, а цвет - в set_color. Границы осей
+    постоянные (по наибольшему размаху пульсирующего сердца), поэтому фон
+    с сеткой рисуется один раз и при блиттинге только восстанавливается.
     """
-    return 1 + 0.05 * math.sin(time * 2)
 
-def animate(frame):
+    def __init__(self, ax, heart_points):
+        """
+        Параметры:
+        - ax: оси matplotlib
+        - heart_points: массив точек сердца (N, 3)
+        """
+        self.heart_points = heart_points
+        count = len(heart_points)
+        self.projection = np.empty((count, 2))  # Координаты x, y повернутого сердца
+        self.offsets = np.empty((len(SCATTER_LAYERS), count, 2))  # Координаты точек каждого слоя
+        self.color = np.zeros(3)  # Цвет кадра (прозрачность у каждого слоя своя)
+
+        # Постоянные границы: фон с сеткой рисуется один раз
+        xlim, ylim = heart_limits(heart_points)
+        ax.set_xlim(*xlim)
+        ax.set_ylim(*ylim)
+        ax.set_aspect('equal', adjustable='box')  # Равномерный масштаб осей
+        ax.grid(True, linestyle='--', alpha=0.3)  # Сетка графика
+
+        # Слои scatter создаются один раз, дальше меняются только координаты и цвет
+        self.layers = [ax.scatter(np.zeros(count), np.zeros(count), alpha=alpha, s=size)
+                       for _, alpha, size in SCATTER_LAYERS]
+        # Счетчик кадров внутри осей: блиттинг восстанавливает фон только в границах осей,
+        # заголовок над осями не стирался бы и накладывался сам на себя
+        self.frame_text = ax.text(0.5, 0.98, '', transform=ax.transAxes, ha='center', va='top', fontsize=12)
+        self.artists = self.layers + [self.frame_text]
+
+    def animate(self, frame):
+        """
+        Функция анимации для каждого кадра
+
+        Параметр:
+        - frame: номер текущего кадра
+
+        Возвращает изменившиеся объекты для блиттинга
+        """
+        project_heart(self.heart_points, frame, out=self.projection)
+        self.color[:] = heart_color(frame)
+
+        # Обновление слоев объемного эффекта
+        for layer, offsets, (scale_layer, _, _) in zip(self.layers, self.offsets, SCATTER_LAYERS):
+            np.multiply(self.projection, scale_layer, out=offsets)
+            layer.set_offsets(offsets)
+            layer.set_color(self.color)
+
+        self.frame_text.set_text(f'Animated Heart (Frame: {frame})')
+        return self.artists
+
+def create_animation(seed=None):
     """
-    Функция анимации для каждого кадра
-    
+    Фигура и функция кадра (для окна и для экспорта heart_engine.export)
+
     Параметр:
-    - frame: номер текущего кадра
-    """
-    # Очистка текущего графика
-    plt.clf()
-    
-    # Создание начальных точек сердца
-    heart_points = create_heart_points(scale=8)
-    
-    # Применение эффекта пульсации
-    scale = pulsating_effect(frame/10)
-    scaled_points = heart_points * scale
-    
-    # Поворот сердца вокруг оси Y
-    rotated_points = rotate_points(scaled_points, frame/10)
-    
-    # Извлечение координат
-    x = rotated_points[:, 0]  # X-координаты
-    y = rotated_points[:, 1]  # Y-координаты
-    z = rotated_points[:, 2]  # Z-координаты
-    
-    # Динамическое изменение цвета
-    hue = (frame/100) % 1.0  # Циклическое изменение оттенка
-    # Преобразование HSV в RGB
-    r, g, b = [int(x * 255) for x in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
-    color = (r/255, g/255, b/255)  # Нормализация цвета
-    
-    # Создание объемного эффекта через многослойный scatter
-    for i in range(10):
-        scale_layer = 1 - i * 0.1  # Уменьшение размера слоя
-        plt.scatter(
-            x * scale_layer,  # X-координаты слоя
-            y * scale_layer,  # Y-координаты слоя
-            c=[color],  # Цвет точек
-            alpha=0.5 - i * 0.05,  # Прозрачность слоя
-            s=10-i  # Размер точек
-        )
-    
-    # Настройка заголовка и параметров графика
-    plt.title(f'Animated Heart (Frame: {frame})')
-    plt.axis('equal')  # Равномерный масштаб осей
-    plt.grid(True, linestyle='--', alpha=0.3)  # Сетка графика
-
-# Настройка графического окна
-plt.figure(figsize=(10, 8))  # Размер окна
-plt.style.use('dark_background')  # Темный стиль
-
-# Создание анимации
-anim = FuncAnimation(
-    plt.gcf(),  # Текущая фигура
-    animate,  # Функция анимации
-    frames=np.linspace(0, 2*np.pi*10, 200),  # Кад ровое пространство для анимации
-    interval=50  # Интервал между кадрами в миллисекундах
-)
-
-plt.show()  # Отображение анимации на экране
\ No newline at end of file
+    - seed: зерно облака точек (None - случайное)
+
+    Возвращает фигуру и функцию animate(frame) -> изменившиеся объекты
+    """
+    import matplotlib.pyplot as plt  # Библиотека для создания статических, анимированных и интерактивных визуализаций
+
+    plt.style.use('dark_background')  # Темный стиль (до создания окна, чтобы фон окна тоже был темным)
+    fig, ax = plt.subplots(figsize=(10, 8))  # Размер окна
+    heart = HeartAnimation(ax, create_heart_points(scale=8, seed=seed))
+    return fig, heart.animate
+
+def create_splat(seed=None, dpi=100):
+    """
+    Растровый кадр без matplotlib (для экспорта heart_engine.export --backend splat)
+
+    Те же слои точек, что и в окне, в тех же границах накладываются
+    в изображение RGBA размером с фигуру окна (10x8 дюймов);
+    сетка и заголовок не рисуются.
+
+    Параметры:
+    - seed: зерно облака точек (None - случайное)
+    - dpi: точек на дюйм
+
+    Возвращает холст SplatCanvas и функцию draw(frame), рисующую кадр на холсте
+    """
+    heart_points = create_heart_points(scale=8, seed=seed)
+    canvas = SplatCanvas(int(10 * dpi), int(8 * dpi))  # Черный фон, как у dark_background
+    canvas.set_view(*heart_limits(heart_points))
+    projection = np.empty((len(heart_points), 2))  # Координаты x, y повернутого сердца
+    offsets = np.empty((len(SCATTER_LAYERS), len(heart_points), 2))  # Координаты точек каждого слоя
+    layer_scales = np.array([scale_layer for scale_layer, _, _ in SCATTER_LAYERS])[:, np.newaxis, np.newaxis]
+    layers = [(layer_offsets, alpha, marker_diameter(size, dpi))
+              for layer_offsets, (_, alpha, size) in zip(offsets, SCATTER_LAYERS)]
+
+    def draw(frame):
+        project_heart(heart_points, frame, out=projection)
+        np.multiply(projection, layer_scales, out=offsets)
+        canvas.clear()
+        canvas.splat_layers(layers, heart_color(frame))  # Все слои одного цвета: один проход
+
+    return canvas, draw
+
+def main():
+    """
+    Запуск анимации в окне matplotlib с блиттингом
+    """
+    import matplotlib.pyplot as plt  # Окно анимации
+    from matplotlib.animation import FuncAnimation  # Класс для создания анимации
+
+    fig, animate = create_animation()
+
+    # Создание анимации: с blit=True перерисовываются только слои и счетчик кадров поверх кэшированного фона
+    anim = FuncAnimation(
+        fig,  # Фигура
+        animate,  # Функция анимации (первый кадр рисуется до кэширования фона)
+        frames=FRAMES,  # Кадровое пространство для анимации
+        interval=50,  # Интервал между кадрами в миллисекундах
+        blit=True  # Перерисовка только изменившихся объектов
+    )
+
+    plt.show()  # Отображение анимации на экране
+
+if __name__ == "__main__":
+    main()
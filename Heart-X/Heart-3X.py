@@ -1,154 +1,240 @@
 import numpy as np  # Библиотека для работы с многомерными массивами и научных вычислений
-import matplotlib.pyplot as plt  # Библиотека для создания статических, анимированных и интерактивных визуализаций
-from matplotlib.animation import FuncAnimation  # Класс для создания анимации
 import colorsys  # Модуль для преобразования цветовых пространств
-import math  # Математические функции
+import os  # Пути к файлам
+import sys  # Системные операции
 
-def rotate_points(points, angle_y):
-    """
-    Функция поворота точек вокруг оси Y
-    
-    Параметры:
-    - points: массив точек для поворота
-    - angle_y: угол поворота
-    
-    Возвращает повернутые точки
-    """
-    # Создаем матрицу поворота вокруг оси Y
-    Ry = np.array([
-        [np.cos(angle_y), 0, np.sin(angle_y)],     # Первая строка матрицы поворота
-        [0, 1, 0],                                 # Вторая строка матрицы (без изменений по Y)
-        [-np.sin(angle_y), 0, np.cos(angle_y)]     # Третья строка матрицы поворота
-    ])
-    # Умножаем точки на транспонированную матрицу поворота
-    return np.dot(points, Ry.T)
-
-def create_heart_points(scale=5, num_points=1000, num_layers=30):
+# Корень репозитория, чтобы импортировать общий движок heart_engine
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from heart_engine import generate_heart_points, rotation_matrix, Pulse  # Облако точек сердца, поворот и пульсация
+from heart_engine.splat import SplatCanvas, marker_diameter  # Растровый вывод точек без matplotlib
+
+# matplotlib импортируется только для окна и экспорта Agg (create_animation и main):
+# растровый экспорт create_splat обходится без него и не тратит время на импорт
+
+def create_heart_points(scale=5, num_points=1000, num_layers=30, seed=None):
     """
     Создание точек для формирования сердца
-    
+
     Параметры:
     - scale: масштаб сердца
     - num_points: количество точек на контуре
     - num_layers: количество слоев для объемности
-    
+    - seed: зерно генератора случайных чисел (None - случайное)
+
     Возвращает массив точек сердца
     """
-    # Создаем параметрический массив для генерации контура сердца
-    t = np.linspace(0, 2*np.pi, num_points)
-    
-    # Параметрические уравнения сердца
-    x = 16 * np.sin(t)**3
-    y = 13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)
-    z = np.zeros_like(x)
-
-    points = []
-
-    # Создание слоев для объемности сердца
-    for i in range(num_layers):
-        factor = 1 - i/num_layers
-        layer_x = factor * x
-        layer_y = factor * y
-        layer_z = np.full_like(x, -i/2)
-        points.extend(zip(layer_x, layer_y, layer_z))
-
-    # Добавление внутренних точек для большей реалистичности
-    for _ in range(num_points // 2):
-        r = np.random.random() * 0.8
-        theta = np.random.random() * 2 * np.pi
-        phi = np.random.random() * np.pi
-        
-        # Вычисление координат внутренних точек с использованием сферических координат
-        x = r * 16 * np.sin(theta)**3 * np.sin(phi)
-        y = r * (13 * np.cos(theta) - 5 * np.cos(2*theta) - 
-                2 * np.cos(3*theta) - np.cos(4*theta)) * np.sin(phi)
-        z = r * 15 * np.cos(phi)
-        points.append((x, y, z))
-
-    # Масштабирование и преобразование в numpy-массив
-    return scale * np.array(points)
-
-def pulsating_effect(time):
-    """
-    Создание эффекта пульсации с использованием синусоиды
-    
-    Параметр:
-    - time: текущее время для анимации
-    
-    Возвращает коэффициент масштабирования
+    # Слои для объемности и внутренние точки для реалистичности
+    return generate_heart_points(scale, num_points, num_layers,
+                                 interior_points=num_points // 2, interior_radius=0.8, interior_depth=15,
+                                 seed=seed)
+
+# Пульсация сердца: масштаб 1 + 0.05 * sin(2t)
+pulsating_effect = Pulse(0.05, 2)
+
+# Слои объемного эффекта: масштаб слоя, прозрачность и размер точек
+SCATTER_LAYERS = [(1 - i * 0.1, 0.5 - i * 0.05, 10 - i) for i in range(10)]
+
+# Кадры анимации: 200 значений времени за 10 оборотов
+FRAMES = np.linspace(0, 2*np.pi*10, 200)
+
+def heart_bounds(heart_points):
+    """
+    Постоянные границы осей по описанной сфере сердца
+
+    При любом повороте вокруг начала координат точки остаются внутри сферы
+    радиуса max|p|, а пульсация увеличивает ее до 1 + amplitude.
+
+    Возвращает полуразмах осей
+    """
+    radius = np.max(np.linalg.norm(heart_points, axis=1))
+    return radius * (1 + pulsating_effect.amplitude) * 1.1
+
+def create_heart_layers(ax, count):
+    """
+    Слои сердца отдельными scatter: у каждого слоя один цвет и один размер точек
+
+    Параметры:
+    - ax: оси matplotlib
+    - count: количество точек сердца
+
+    Возвращает список слоев и функцию обновления update(offsets, color)
     """
-    return 1 + 0.05 * math.sin(time * 2)
+    layers = [ax.scatter(np.zeros(count), np.zeros(count), alpha=alpha, s=size)
+              for _, alpha, size in SCATTER_LAYERS]
+
+    def update(offsets, color):
+        for layer, layer_offsets in zip(layers, offsets):
+            layer.set_offsets(layer_offsets)
+            layer.set_color(color)
 
-# Кэширование базовых точек сердца для оптимизации
-BASE_HEART_POINTS = create_heart_points(scale=8)
+    return layers, update
+
+def create_heart_collection(ax, count):
+    """
+    Все слои сердца одним PathCollection с цветом RGBA и размером каждой точки
+
+    Параметры:
+    - ax: оси matplotlib
+    - count: количество точек сердца
+
+    Возвращает список из одной коллекции и функцию обновления update(offsets, color)
+    """
+    _, alphas, sizes = (np.array(column, dtype=float) for column in zip(*SCATTER_LAYERS))
+    colors = np.zeros((len(SCATTER_LAYERS) * count, 4))
+    colors[:, 3] = np.repeat(alphas, count)  # Прозрачность слоя в цвете каждой точки
+    # Слои идут подряд, поэтому рисуются в том же порядке, что и отдельные scatter
+    collection = ax.scatter(np.zeros(len(colors)), np.zeros(len(colors)), s=np.repeat(sizes, count), c=colors)
 
-# Настройка графического окна
-fig, ax = plt.subplots(figsize=(10, 8))  # Создание фигуры и осей
-plt.style.use('dark_background')  # Темный фон
-ax.set_axis_off()  # Убираем оси
+    def update(offsets, color):
+        collection.set_offsets(offsets.reshape(-1, 2))
+        colors[:, :3] = color  # Прозрачность слоев в colors не меняется
+        collection.set_facecolor(colors)  # Контур точек берет цвет заливки (edgecolors='face')
 
-# Создание scatter plots для многослойности
-scatter_layers = []
-for _ in range(10):
-    scatter = ax.scatter([], [], c='red', alpha=0.5, s=10)
-    scatter_layers.append(scatter)
+    return [collection], update
 
-def animate(frame):
+def heart_frame(heart_points):
     """
-    Функция анимации для каждого кадра
-    
+    Расчет кадра без matplotlib: координаты точек всех слоев и цвет
+
     Параметр:
-    - frame: номер текущего кадра
-    
-    Возвращает список обновленных scatter plots
-    """
-    # Применение эффекта пульсации
-    scale = pulsating_effect(frame/10)
-    scaled_points = BASE_HEART_POINTS * scale
-    
-    # Поворот сердца
-    rotated_points = rotate_points(scaled_points, frame/10)
-    
-    # Проекция 3D точек на 2D плоскость
-    x = rotated_points[:, 0]
-    y = rotated_points[:, 1]
-    
-    # Динамическое изменение цвета
-    hue = (frame/100) % 1.0
-    r, g, b = [int(x * 255) for x in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
-    color = (r/255, g/255, b/255)
-    
-    # Обновление scatter plots для создания объемного эффекта
-    updated_scatters = []
-    for i, scatter in enumerate(scatter_layers):
-        scale_layer = 1 - i * 0.1
-        layer_x = x * scale_layer
-        layer_y = y * scale_layer
-        
-        # Обновление параметров scatter plot
-        scatter.set_offsets(np.column_stack([layer_x, layer_y]))
-        scatter.set_color(color)
-        scatter.set_alpha(0.5 - i * 0.05)
-        scatter.set_sizes([10-i])
-        
-        updated_scatters.append(scatter)
-    
-    # Настройка заголовка и осей
-    ax.set_title(f'Animated Heart (Frame: {frame})')
-    ax.set_xlim(x.min() * 1.1, x.max() * 1.1)
-    ax.set_ylim(y.min() * 1.1, y.max() * 1.1)
+    - heart_points: массив точек сердца (N, 3)
+
+    Возвращает функцию project(frame) -> (координаты слоев (слои, N, 2), цвет RGB);
+    координаты пересчитываются в один и тот же заранее выделенный массив
+    """
+    count = len(heart_points)
+    projection = np.empty((count, 2))  # Координаты x, y повернутого сердца
+    offsets = np.empty((len(SCATTER_LAYERS), count, 2))  # Координаты точек каждого слоя
+    layer_scales = np.array([scale_layer for scale_layer, _, _ in SCATTER_LAYERS])[:, np.newaxis, np.newaxis]
+
+    def project(frame):
+        # Пульсация и поворот одной матрицей: нужны только строки x и y
+        transform = rotation_matrix(angle_y=frame/10)[:2] * pulsating_effect(frame/10)
+        np.dot(heart_points, transform.T, out=projection)
+
+        # Координаты всех слоев: слой - то же сердце, уменьшенное в scale_layer раз
+        np.multiply(projection, layer_scales, out=offsets)
+
+        # Динамическое изменение цвета
+        hue = (frame/100) % 1.0
+        return offsets, colorsys.hsv_to_rgb(hue, 1.0, 1.0)
+
+    return project
+
+def setup_heart(ax, heart_points, single_collection=False):
+    """
+    Постоянные объекты анимации: границы осей, слои точек и счетчик кадров
+
+    Все объекты создаются один раз, а кадр только пересчитывает координаты
+    в заранее выделенные массивы. Границы осей не меняются, поэтому фон
+    кэшируется и при блиттинге каждый кадр - частичная перерисовка.
+
+    Параметры:
+    - ax: оси matplotlib
+    - heart_points: массив точек сердца (N, 3)
+    - single_collection: все слои одним PathCollection (иначе 10 scatter)
+
+    Возвращает функцию кадра animate(frame) -> изменившиеся объекты
+    """
+    # Границы и масштаб осей задаются один раз
+    bound = heart_bounds(heart_points)
+    ax.set_xlim(-bound, bound)
+    ax.set_ylim(-bound, bound)
     ax.set_aspect('equal')
-    
-    return updated_scatters
-
-# Создание анимации
-anim = FuncAnimation(
-    fig,                       # Фигура для анимации
-    animate,                   # Функция для каждого кадра
-    frames=np.linspace(0, 2*np.pi*10, 200),  # Количество и диапазон кадров
-    interval=50,               # Интервал между кадрами (мс)
-    blit=True                  # Оптимизация перерисовки
-)
-
-plt.tight_layout()  # Автоматическая компоновка
-plt.show()  # Отображение анимации
\ No newline at end of file
+
+    count = len(heart_points)
+    create_points = create_heart_collection if single_collection else create_heart_layers
+    artists, update_points = create_points(ax, count)
+    # Счетчик кадров - тоже объект блиттинга (заголовок осей перерисовывал бы всю фигуру);
+    # он внутри осей: блиттинг восстанавливает фон только в их границах
+    frame_text = ax.text(0.5, 0.98, '', transform=ax.transAxes, ha='center', va='top', fontsize=12)
+    artists = artists + [frame_text]
+
+    project = heart_frame(heart_points)
+
+    def animate(frame):
+        """
+        Функция анимации для каждого кадра
+
+        Параметр:
+        - frame: номер текущего кадра
+
+        Возвращает изменившиеся объекты для блиттинга
+        """
+        update_points(*project(frame))
+
+        frame_text.set_text(f'Animated Heart (Frame: {frame})')
+        return artists
+
+    return animate
+
+def create_animation(seed=None, single_collection=False):
+    """
+    Фигура и функция кадра (для окна и для экспорта heart_engine.export)
+
+    Параметры:
+    - seed: зерно облака точек (None - случайное)
+    - single_collection: все слои одним PathCollection (иначе 10 scatter)
+
+    Возвращает фигуру и функцию animate(frame) -> изменившиеся объекты
+    """
+    import matplotlib.pyplot as plt  # Библиотека для создания статических, анимированных и интерактивных визуализаций
+
+    plt.style.use('dark_background')  # Темный фон (до создания окна, чтобы фон окна тоже был темным)
+    fig, ax = plt.subplots(figsize=(10, 8))  # Создание фигуры и осей
+    ax.set_axis_off()  # Убираем оси
+    animate = setup_heart(ax, create_heart_points(scale=8, seed=seed), single_collection)
+    fig.tight_layout()  # Автоматическая компоновка (до кэширования фона)
+    return fig, animate
+
+def create_splat(seed=None, dpi=100):
+    """
+    Растровый кадр без matplotlib (для экспорта heart_engine.export --backend splat)
+
+    Те же слои точек, что и в окне, накладываются в изображение RGBA
+    размером с фигуру окна (10x8 дюймов); счетчик кадров не рисуется.
+
+    Параметры:
+    - seed: зерно облака точек (None - случайное)
+    - dpi: точек на дюйм
+
+    Возвращает холст SplatCanvas и функцию draw(frame), рисующую кадр на холсте
+    """
+    heart_points = create_heart_points(scale=8, seed=seed)
+    bound = heart_bounds(heart_points)
+    canvas = SplatCanvas(int(10 * dpi), int(8 * dpi))  # Черный фон, как у dark_background
+    canvas.set_view((-bound, bound), (-bound, bound))
+    project = heart_frame(heart_points)
+    diameters = [marker_diameter(size, dpi) for _, _, size in SCATTER_LAYERS]
+
+    def draw(frame):
+        offsets, color = project(frame)
+        canvas.clear()
+        # Все слои одного цвета: накладываются за один проход
+        canvas.splat_layers([(layer_offsets, alpha, diameter) for layer_offsets, (_, alpha, _), diameter
+                             in zip(offsets, SCATTER_LAYERS, diameters)], color)
+
+    return canvas, draw
+
+def main():
+    """
+    Запуск анимации: python Heart-3X.py [collection] - все слои одним PathCollection
+    """
+    import matplotlib.pyplot as plt  # Окно анимации
+    from matplotlib.animation import FuncAnimation  # Класс для создания анимации
+
+    fig, animate = create_animation(single_collection='collection' in sys.argv[1:])
+
+    # Создание анимации
+    anim = FuncAnimation(
+        fig,                       # Фигура для анимации
+        animate,                   # Функция для каждого кадра
+        frames=FRAMES,             # Количество и диапазон кадров
+        interval=50,               # Интервал между кадрами (мс)
+        blit=True                  # Перерисовка только точек и счетчика поверх кэшированного фона
+    )
+
+    plt.show()  # Отображение анимации
+
+if __name__ == "__main__":
+    main()
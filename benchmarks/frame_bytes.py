@@ -0,0 +1,99 @@
+"""
+Замер размера кадра в байтах до и после склейки цветовых участков
+
+Для каждого скрипта прогоняется его вариант анимации (PRESET) с первого шага,
+а размер кадра считается тремя способами:
+    по ячейкам  - каждая цветная ячейка обернута в свой цвет и сброс (как было раньше)
+    полный кадр - цвет выводится только на границах одноцветных участков
+    разница     - DiffWriter: только изменившиеся участки (как в самих скриптах)
+
+Запуск:
+    python benchmarks/frame_bytes.py
+    python benchmarks/frame_bytes.py --frames 300 Heart-Terminal/Heart-13.py
+"""
+import argparse  # Разбор аргументов командной строки
+import io  # Буфер вместо терминала
+import os  # Работа с путями
+import sys  # Системные операции
+
+import numpy as np  # Математические операции и работа с массивами
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from heart_engine import HuePalette, RESET, DiffWriter
+from heart_engine.offline import load_script
+
+# Скрипты по умолчанию
+DEFAULT_SCRIPTS = ('Heart-Terminal/Heart-12.py', 'Heart-Terminal/Heart-13.py')
+
+
+class _NullStream:
+    """
+    Поток вывода, который только копит байты
+    """
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def flush(self):
+        pass
+
+
+def per_cell_size(framebuffer, palette):
+    """
+    Размер кадра при обертке каждой цветной ячейки в цвет и сброс цвета
+    """
+    glyph_lengths = np.array([1] + [len(char.encode('utf-8')) for char in framebuffer.shading_chars])
+    color_lengths = np.array([0] + [len(sequence) + len(RESET) for sequence in palette.sequences])
+    visible = framebuffer.glyph != 0
+    cells = glyph_lengths[framebuffer.glyph] + np.where(visible, color_lengths[framebuffer.color], 0)
+    return len(b'\033[H') + int(cells.sum()) + framebuffer.height - 1
+
+
+def measure(path, frames, size=None):
+    """
+    Прогон анимации скрипта и подсчет байт на кадр
+
+    Args:
+        path (str): Путь к скрипту варианта
+        frames (int): Количество кадров
+        size (tuple): Размер экрана в символах (None - screen_size варианта)
+
+    Returns:
+        dict: Средний размер кадра для каждого способа вывода
+    """
+    preset = load_script(path)
+    heart_points = preset.load_points()
+    # Варианты без цвета рисуют только символы, таблица нужна для подсчета по ячейкам
+    palette = preset.create_palette() or HuePalette()
+    framebuffer = preset.create_framebuffer('text', palette, size)
+    stream = _NullStream()
+    writer = DiffWriter(stream, blank=True)
+
+    totals = {'per_cell': 0, 'full': 0, 'diff': 0}
+    for frame in range(frames):
+        preset.draw_frame(frame, heart_points, framebuffer, palette)
+
+        totals['per_cell'] += per_cell_size(framebuffer, palette)
+        totals['full'] += len(framebuffer.encode())
+        totals['diff'] += writer.write(framebuffer)
+
+    return {key: value / frames for key, value in totals.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Размер кадра в байтах до и после склейки цветовых участков")
+    parser.add_argument('scripts', nargs='*', help="Скрипты (по умолчанию Heart-12 и Heart-13)")
+    parser.add_argument('--frames', type=int, default=150, help="Количество кадров")
+    parser.add_argument('--size', type=int, nargs=2, metavar=('WIDTH', 'HEIGHT'), help="Размер экрана (по умолчанию размер варианта)")
+    args = parser.parse_args()
+
+    print(f"{'Скрипт':<32}{'по ячейкам':>12}{'полный кадр':>13}{'разница':>10}")
+    for script in args.scripts or DEFAULT_SCRIPTS:
+        result = measure(os.path.join(ROOT, script), args.frames, args.size)
+        print(f"{script:<32}{result['per_cell']:>12.0f}{result['full']:>13.0f}{result['diff']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Замер кадров в секунду анимаций Heart-X без окна (backend Agg)
+
+Способы рисовать кадр:
+    Heart-1X clf        - прежний скрипт: plt.clf(), новая кривая, новая матрица поворота,
+                          plt.plot, заголовок, подписи и сетка каждый кадр
+    Heart-1X line       - HeartCurve: кривая посчитана заранее, одна Line2D (set_data)
+                          поверх кэшированного фона
+    Heart-1X table      - то же, но повернутые кривые всех кадров взяты из таблицы
+    Heart-2X clf        - прежний скрипт: plt.clf(), новое облако точек, 10 новых
+                          scatter и перерисовка всей фигуры каждый кадр
+    Heart-2X blit       - HeartAnimation: постоянные слои scatter (set_offsets/set_color)
+                          поверх кэшированного фона, как FuncAnimation(blit=True)
+    Heart-3X full       - прежний скрипт: заголовок и границы осей меняются каждый
+                          кадр, поэтому фигура перерисовывается целиком
+    Heart-3X layers     - постоянные границы, 10 scatter и счетчик кадров блиттингом
+    Heart-3X collection - то же, но все слои одним PathCollection с цветом и
+                          размером каждой точки
+    Heart-2X/3X splat   - create_splat: те же слои точек наложены в RGBA float32
+                          средствами NumPy (heart_engine.splat), без matplotlib
+Время кадра включает растеризацию Agg, поэтому FPS близок к окну
+на той же машине без учета вывода на экран. Для splat время кадра
+включает перевод в RGB uint8 - кадр готов к записи в PNG.
+
+Запуск:
+    python benchmarks/heart_x.py
+    python benchmarks/heart_x.py --frames 100
+    python benchmarks/heart_x.py --only "Heart-3X layers"
+"""
+import argparse  # Разбор аргументов командной строки
+import colorsys  # Преобразование HSV в RGB для прежнего кадра
+import importlib.util  # Загрузка скриптов Heart-X по пути
+import os  # Работа с путями
+import sys  # Системные операции
+import time  # Таймер perf_counter
+
+import matplotlib
+import numpy as np  # Математические операции и работа с массивами
+
+matplotlib.use('Agg')  # Без окна: кадры растеризуются в память
+import matplotlib.pyplot as plt  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from heart_engine import rotate_points  # noqa: E402
+
+# Кадры анимаций Heart-2X и Heart-3X: 200 значений времени за 10 оборотов
+FRAMES = np.linspace(0, 2 * np.pi * 10, 200)
+
+# Кадры Heart-1X: номера кадров цикла из 100 углов поворота
+FRAMES_1X = np.arange(100)
+
+
+def load_heart_x(name):
+    """
+    Загрузка скрипта Heart-X как модуля (анимация не запускается)
+    """
+    path = os.path.join(ROOT, 'Heart-X', name + '.py')
+    spec = importlib.util.spec_from_file_location(name.replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_1x_frame(module, frame):
+    """
+    Кадр прежнего Heart-1X: очистка фигуры, новая кривая и новый график с подписями
+    """
+    plt.clf()
+    t = np.linspace(0, 2*np.pi, 200)
+    x, y = module.rotate_heart(t, module.FRAME_ANGLES[frame])
+    plt.plot(x, y, color='red')
+    plt.title('Вращающееся сердце')
+    plt.xlabel('X')
+    plt.ylabel('Y')
+    plt.axis('equal')
+    plt.grid(True)
+
+
+def legacy_2x_frame(module, frame):
+    """
+    Кадр прежнего Heart-2X: очистка фигуры, новое облако и 10 новых scatter
+    """
+    plt.clf()
+    heart_points = module.create_heart_points(scale=8)
+    scale = module.pulsating_effect(frame/10)
+    rotated_points = rotate_points(heart_points * scale, angle_y=frame/10)
+    x, y = rotated_points[:, 0], rotated_points[:, 1]
+    hue = (frame/100) % 1.0
+    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+    color = (r/255, g/255, b/255)
+    for i in range(10):
+        scale_layer = 1 - i * 0.1
+        plt.scatter(x * scale_layer, y * scale_layer, c=[color], alpha=0.5 - i * 0.05, s=10-i)
+    plt.title(f'Animated Heart (Frame: {frame})')
+    plt.axis('equal')
+    plt.grid(True, linestyle='--', alpha=0.3)
+
+
+def legacy_3x_setup(module, ax):
+    """
+    Прежний Heart-3X: 10 scatter, а заголовок и границы осей меняются каждый кадр
+
+    Returns:
+        callable: Кадр animate(frame)
+    """
+    heart_points = module.create_heart_points(scale=8)
+    ax.set_axis_off()
+    scatter_layers = [ax.scatter([], [], c='red', alpha=0.5, s=10) for _ in range(10)]
+
+    def animate(frame):
+        rotated_points = rotate_points(heart_points * module.pulsating_effect(frame/10), angle_y=frame/10)
+        x, y = rotated_points[:, 0], rotated_points[:, 1]
+        hue = (frame/100) % 1.0
+        r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0)]
+        color = (r/255, g/255, b/255)
+        for i, scatter in enumerate(scatter_layers):
+            scale_layer = 1 - i * 0.1
+            scatter.set_offsets(np.column_stack([x * scale_layer, y * scale_layer]))
+            scatter.set_color(color)
+            scatter.set_alpha(0.5 - i * 0.05)
+            scatter.set_sizes([10-i])
+        ax.set_title(f'Animated Heart (Frame: {frame})')
+        ax.set_xlim(x.min() * 1.1, x.max() * 1.1)
+        ax.set_ylim(y.min() * 1.1, y.max() * 1.1)
+        ax.set_aspect('equal')
+        return scatter_layers
+
+    return animate
+
+
+def measure_full(setup, frames_values):
+    """
+    Кадры с перерисовкой всей фигуры (canvas.draw)
+
+    Args:
+        setup (callable): Подготовка осей: setup(ax) -> animate(frame)
+        frames_values (np.array): Значения кадров
+
+    Returns:
+        float: Кадров в секунду
+    """
+    plt.style.use('dark_background')
+    fig, ax = plt.subplots(figsize=(10, 8))
+    animate = setup(ax)
+    started = time.perf_counter()
+    for frame in frames_values:
+        animate(frame)
+        fig.canvas.draw()
+    elapsed = time.perf_counter() - started
+    plt.close(fig)
+    return len(frames_values) / elapsed
+
+
+def measure_blit(setup, frames_values):
+    """
+    Кадры с блиттингом: фон восстанавливается, рисуются только изменившиеся объекты
+
+    Args:
+        setup (callable): Подготовка осей: setup(ax) -> animate(frame) -> объекты
+        frames_values (np.array): Значения кадров
+
+    Returns:
+        float: Кадров в секунду
+    """
+    plt.style.use('dark_background')
+    fig, ax = plt.subplots(figsize=(10, 8))
+    animate = setup(ax)
+    canvas = fig.canvas
+    # Как FuncAnimation._init_draw: анимируемые объекты не попадают в фон
+    for artist in animate(frames_values[0]):
+        artist.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    started = time.perf_counter()
+    for frame in frames_values:
+        canvas.restore_region(background)
+        for artist in animate(frame):
+            ax.draw_artist(artist)
+        canvas.blit(fig.bbox)
+    elapsed = time.perf_counter() - started
+    plt.close(fig)
+    return len(frames_values) / elapsed
+
+
+def measure_splat(setup, frames_values):
+    """
+    Кадры растрового вывода heart_engine.splat: наложение слоев и перевод в RGB uint8
+
+    Args:
+        setup (callable): Подготовка холста: setup() -> (SplatCanvas, draw(frame))
+        frames_values (np.array): Значения кадров
+
+    Returns:
+        float: Кадров в секунду
+    """
+    canvas, draw = setup()
+    rgb = np.empty((canvas.height, canvas.width, 3), dtype=np.uint8)
+    started = time.perf_counter()
+    for frame in frames_values:
+        draw(frame)
+        canvas.to_rgb(out=rgb)
+    elapsed = time.perf_counter() - started
+    return len(frames_values) / elapsed
+
+
+def create_cases():
+    """
+    Замеры: (название, способ замера, подготовка осей, кадры, название прежнего способа для сравнения)
+    """
+    heart_1x = load_heart_x('Heart-1X')
+    heart_2x = load_heart_x('Heart-2X')
+    heart_3x = load_heart_x('Heart-3X')
+
+    def legacy_1x(ax):
+        plt.sca(ax)
+        return lambda frame: legacy_1x_frame(heart_1x, frame)
+
+    def line_1x(ax):
+        return heart_1x.HeartCurve(ax).animate
+
+    def table_1x(ax):
+        return heart_1x.HeartCurve(ax, rotation_table=True).animate
+
+    def legacy_2x(ax):
+        plt.sca(ax)
+        return lambda frame: legacy_2x_frame(heart_2x, frame)
+
+    def blit_2x(ax):
+        return heart_2x.HeartAnimation(ax, heart_2x.create_heart_points(scale=8)).animate
+
+    def layers_3x(ax):
+        ax.set_axis_off()
+        return heart_3x.setup_heart(ax, heart_3x.create_heart_points(scale=8))
+
+    def collection_3x(ax):
+        ax.set_axis_off()
+        return heart_3x.setup_heart(ax, heart_3x.create_heart_points(scale=8), single_collection=True)
+
+    return [
+        ('Heart-1X clf', measure_full, legacy_1x, FRAMES_1X, None),
+        ('Heart-1X line', measure_blit, line_1x, FRAMES_1X, 'Heart-1X clf'),
+        ('Heart-1X table', measure_blit, table_1x, FRAMES_1X, 'Heart-1X clf'),
+        ('Heart-2X clf', measure_full, legacy_2x, FRAMES, None),
+        ('Heart-2X blit', measure_blit, blit_2x, FRAMES, 'Heart-2X clf'),
+        ('Heart-2X splat', measure_splat, lambda: heart_2x.create_splat(seed=0), FRAMES, 'Heart-2X clf'),
+        ('Heart-3X full', measure_full, lambda ax: legacy_3x_setup(heart_3x, ax), FRAMES, None),
+        ('Heart-3X layers', measure_blit, layers_3x, FRAMES, 'Heart-3X full'),
+        ('Heart-3X collection', measure_blit, collection_3x, FRAMES, 'Heart-3X full'),
+        ('Heart-3X splat', measure_splat, lambda: heart_3x.create_splat(seed=0), FRAMES, 'Heart-3X full'),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Кадры в секунду анимаций Heart-X без окна")
+    parser.add_argument('--frames', type=int, default=30, help="Количество кадров на замер")
+    parser.add_argument('--only', nargs='+', help="Замерить только эти способы (например, \"Heart-3X layers\")")
+    args = parser.parse_args()
+
+    print(f"{'Способ':<22}{'FPS':>8}{'мс/кадр':>10}{'ускорение':>11}")
+    results = {}
+    for name, measure, setup, frames_values, baseline in create_cases():
+        if args.only and name not in args.only:
+            continue
+        fps = results[name] = measure(setup, frames_values[:args.frames])
+        speedup = f"{fps / results[baseline]:>10.1f}x" if baseline in results else ""
+        print(f"{name:<22}{fps:>8.1f}{1000 / fps:>10.1f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
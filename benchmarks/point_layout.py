@@ -0,0 +1,104 @@
+"""
+Замер раскладки облака точек: (N, 3) float64 против структуры массивов (3, N) float32
+
+Для облаков растущего размера прогоняется этап преобразования кадра
+(пульсация, поворот, отражение оси Y и проекция на экран) двумя способами:
+    float64 (N, 3) - transform_points и project_points, новые массивы каждый кадр
+    float32 (3, N) - PointTransform: одно умножение в переиспользуемые буферы
+и печатаются время кадра, пропускная способность и память облака на точку.
+
+Запуск:
+    python benchmarks/point_layout.py
+    python benchmarks/point_layout.py --frames 50 --sizes 100000 1000000
+"""
+import argparse  # Разбор аргументов командной строки
+import math  # Математические функции
+import os  # Работа с путями
+import sys  # Системные операции
+import time  # Таймер perf_counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from heart_engine import (generate_heart_points, pack_points, transform_points, project_points,
+                          model_matrix, PointTransform)
+
+# Размер экрана и число слоев облака
+SCREEN_SIZE = (100, 50)
+NUM_LAYERS = 50
+
+
+def create_cloud(count, seed=0):
+    """
+    Облако сердца примерно из count точек: половина - слои контура, половина - внутренние точки
+    """
+    return generate_heart_points(scale=10, num_points=max(count // (2 * NUM_LAYERS), 1), num_layers=NUM_LAYERS,
+                                 interior_points=count // 2, seed=seed)
+
+
+def frame_parameters(frame):
+    """
+    Углы и масштаб кадра (как у Heart-13: покачивание, вращение и пульсация)
+    """
+    time_val = frame / 30
+    angles = (0.2 * math.sin(time_val * 0.5), frame * 0.04, 0.1 * math.cos(time_val * 0.3))
+    return angles, 1 + 0.08 * math.sin(time_val * 1.5)
+
+
+def measure_legacy(points, frames):
+    """
+    Кадры в раскладке (N, 3) float64
+
+    Returns:
+        float: Среднее время кадра в миллисекундах
+    """
+    started = time.perf_counter()
+    for frame in range(frames):
+        angles, scale = frame_parameters(frame)
+        rotated = transform_points(points, angles, scale, flip_y=True)
+        project_points(rotated, SCREEN_SIZE)
+    return (time.perf_counter() - started) / frames * 1000
+
+
+def measure_packed(points, frames):
+    """
+    Кадры в раскладке (3, N) float32 с переиспользуемыми буферами
+
+    Returns:
+        float: Среднее время кадра в миллисекундах
+    """
+    transform = PointTransform(points)
+    started = time.perf_counter()
+    for frame in range(frames):
+        angles, scale = frame_parameters(frame)
+        transform.apply(model_matrix(angles, scale, flip_y=True))
+        transform.project(SCREEN_SIZE)
+    return (time.perf_counter() - started) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Раскладка облака точек: (N, 3) float64 против (3, N) float32")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 30000, 100000, 300000, 1000000],
+                        help="Размеры облаков в точках")
+    parser.add_argument('--frames', type=int, default=30, help="Количество кадров на замер")
+    args = parser.parse_args()
+
+    print(f"{'':>9}{'--- float64 (N, 3) ---':>35}{'--- float32 (3, N) ---':>35}")
+    print(f"{'Точек':>9}{'байт/точку':>12}{'мс/кадр':>10}{'млн точек/с':>13}"
+          f"{'байт/точку':>12}{'мс/кадр':>10}{'млн точек/с':>13}{'ускорение':>11}")
+    for size in args.sizes:
+        legacy = create_cloud(size)
+        packed = pack_points(legacy)
+        count = len(legacy)
+        # Прогрев: первые кадры платят за страницы памяти и кэши BLAS
+        measure_legacy(legacy, 2)
+        measure_packed(packed, 2)
+        legacy_ms = measure_legacy(legacy, args.frames)
+        packed_ms = measure_packed(packed, args.frames)
+        print(f"{count:>9}{legacy.nbytes / count:>12.0f}{legacy_ms:>10.2f}{count / legacy_ms / 1000:>13.1f}"
+              f"{packed.nbytes / count:>12.0f}{packed_ms:>10.2f}{count / packed_ms / 1000:>13.1f}"
+              f"{legacy_ms / packed_ms:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
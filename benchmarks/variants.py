@@ -0,0 +1,198 @@
+"""
+Сравнение всех вариантов Heart-Terminal без терминала
+
+Из каждого скрипта берется его вариант анимации PRESET (анимация не
+запускается). Облако точек строится с фиксированным seed, кадры рисуются
+для шагов симуляции подряд, а вывод уходит в пустой поток.
+Для каждого варианта замеряются этапы кадра:
+    transform - пульсация, поворот и отражение оси Y
+    raster    - z-буфер, выбор символов и цветов
+    encode    - байты кадра (DiffWriter.encode)
+    output    - запись байт в пустой поток
+Результат пишется в JSON для дашбордов.
+
+Запуск:
+    python benchmarks/variants.py --output variants.json
+    python benchmarks/variants.py --frames 300 Heart-Terminal/Heart-13.py Heart-Terminal/Heart-7.py
+"""
+import argparse  # Разбор аргументов командной строки
+import glob  # Поиск скриптов вариантов
+import inspect  # Параметры генератора облака точек
+import json  # Отчет для дашбордов
+import os  # Работа с путями
+import platform  # Описание машины в отчете
+import re  # Сортировка вариантов по номеру
+import sys  # Системные операции
+import time  # Таймер perf_counter_ns
+
+import numpy as np  # Математические операции и работа с массивами
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from heart_engine import DiffWriter, pack_points
+from heart_engine.offline import load_script
+
+STAGES = ('transform', 'raster', 'encode', 'output')
+
+
+class _NullSink:
+    """
+    Поток вывода, который только считает байты
+    """
+
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, data):
+        self.bytes += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def variant_scripts():
+    """
+    Скрипты Heart-Terminal по порядку номеров
+    """
+    paths = glob.glob(os.path.join(ROOT, 'Heart-Terminal', 'Heart-*.py'))
+    return sorted(paths, key=lambda path: int(re.search(r'Heart-(\d+)', os.path.basename(path)).group(1)))
+
+
+def create_points(preset, seed):
+    """
+    Облако точек варианта (3, N) float32 с фиксированным зерном (без кэша на диске)
+    """
+    if 'seed' in inspect.signature(preset.generator).parameters:
+        return pack_points(preset.generator(**preset.points, seed=seed))
+    return pack_points(preset.generator(**preset.points))
+
+
+def summarize(samples):
+    """
+    Среднее и перцентили времени этапа в миллисекундах
+    """
+    values = np.array(samples, dtype=np.float64) / 1e6
+    return {
+        'mean_ms': float(values.mean()),
+        'p50_ms': float(np.percentile(values, 50)),
+        'p95_ms': float(np.percentile(values, 95)),
+        'max_ms': float(values.max()),
+        'total_s': float(values.sum() / 1000),
+    }
+
+
+def measure(path, frames, seed, time_limit=None, mode='text'):
+    """
+    Прогон одного варианта
+
+    Прогон можно ограничить по времени: тогда в отчет попадает число реально
+    нарисованных кадров.
+
+    Returns:
+        dict: Время этапов, точки в секунду, байты на кадр и описание варианта
+    """
+    preset = load_script(path)
+
+    started = time.perf_counter_ns()
+    heart_points = create_points(preset, seed)
+    points_ms = (time.perf_counter_ns() - started) / 1e6
+
+    palette = preset.create_palette()
+    framebuffer = preset.create_framebuffer(mode, palette)
+    writer = DiffWriter(blank=True)
+    sink = _NullSink()
+    samples = {stage: [] for stage in STAGES}
+
+    # Варианты со случайным выбором символов каждый прогон получают одинаковую последовательность
+    np.random.seed(seed)
+    deadline = time.perf_counter_ns() + time_limit * 1e9 if time_limit else None
+    for frame in range(frames):
+        if deadline is not None and frame > 0 and time.perf_counter_ns() > deadline:
+            break
+        clock = preset.clock(frame)
+        moments = [time.perf_counter_ns()]
+        frame_points = preset.transform(heart_points, clock)
+        moments.append(time.perf_counter_ns())
+        preset.rasterize(frame_points, framebuffer, palette, clock)
+        moments.append(time.perf_counter_ns())
+        data = writer.encode(framebuffer)[0]
+        moments.append(time.perf_counter_ns())
+        sink.write(data)
+        sink.flush()
+        moments.append(time.perf_counter_ns())
+        for stage, begin, end in zip(STAGES, moments, moments[1:]):
+            samples[stage].append(end - begin)
+
+    frames = len(samples['output'])
+    frame_ns = np.sum([samples[stage] for stage in STAGES], axis=0)
+    total_s = float(frame_ns.sum()) / 1e9
+    return {
+        'script': os.path.relpath(path, ROOT),
+        'points': int(heart_points.shape[1]),
+        'bytes_per_point': heart_points.nbytes / max(heart_points.shape[1], 1),
+        'points_ms': points_ms,
+        'mode': mode,
+        'width': framebuffer.width,
+        'height': framebuffer.height,
+        'frames': frames,
+        'stages': {stage: summarize(samples[stage]) for stage in STAGES},
+        'frame': summarize(frame_ns),
+        'fps': frames / total_s if total_s > 0 else None,
+        'points_per_second': heart_points.shape[1] * frames / total_s if total_s > 0 else None,
+        'bytes_per_frame': sink.bytes / frames,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Сравнение вариантов Heart-Terminal без терминала")
+    parser.add_argument('scripts', nargs='*', help="Скрипты (по умолчанию все Heart-Terminal/Heart-*.py)")
+    parser.add_argument('--frames', type=int, default=60, help="Количество кадров на вариант")
+    parser.add_argument('--time-limit', type=float, default=10.0, help="Наибольшее время прогона одного варианта, с (0 - без ограничения)")
+    parser.add_argument('--seed', type=int, default=0, help="Зерно облака точек и случайных эффектов")
+    parser.add_argument('--mode', default='text', help="Режим растеризации: text, braille или halfblock")
+    parser.add_argument('--output', help="Файл JSON (по умолчанию вывод в stdout)")
+    args = parser.parse_args()
+
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'frames': args.frames,
+        'time_limit_s': args.time_limit or None,
+        'seed': args.seed,
+        'mode': args.mode,
+        'machine': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+            'cpu_count': os.cpu_count(),
+        },
+        'variants': {},
+    }
+
+    scripts = [os.path.abspath(script) for script in args.scripts] or variant_scripts()
+    for path in scripts:
+        name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            result = measure(path, args.frames, args.seed, args.time_limit, args.mode)
+        except Exception as error:
+            # Один сломанный вариант не должен ронять весь отчет
+            result = {'script': os.path.relpath(path, ROOT), 'error': f"{type(error).__name__}: {error}"}
+            print(f"{name:<16} ошибка: {result['error']}", file=sys.stderr)
+        else:
+            print(f"{name:<16}{result['points']:>8} точек {result['frame']['mean_ms']:>9.2f} мс/кадр "
+                  f"{result['points_per_second'] / 1e6:>7.2f} млн точек/с {result['bytes_per_frame']:>9.0f} байт/кадр",
+                  file=sys.stderr)
+        report['variants'][name] = result
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output:
+            output.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
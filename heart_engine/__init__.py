@@ -0,0 +1,46 @@
+"""
+Общий движок для терминальных версий 3D сердца
+
+Модули:
+    geometry: облако точек сердца, построенное целыми массивами, и его раскладка float32 (3, N)
+        в расслоенном порядке
+    pointcache: кэш облаков точек на диске с отображением в память
+    transform: поворот, пульсация и отражение облака точек одной матрицей 3x4 в переиспользуемые буферы
+    lod: уровни детализации облака - наименьший префикс, который покрывает экран
+    raster: проекция, выбор символов, векторный z-буфер и упаковка точек в символы Брайля
+    effects: пульсация, покачивание, движение, цвет и текст под сердцем
+    preset: вариант анимации как набор параметров и эффектов с общим циклом вывода
+    resize: размер терминала по SIGWINCH с подавлением дребезга и расположение кадра
+    framebuffer: кадровый буфер из числовых плоскостей, режимы растеризации и кодирование в байты
+    color: квантованная таблица цветов HSV -> ANSI
+    output: вывод кадров в терминал, в том числе только изменившихся ячеек
+    scheduler: темп кадров по абсолютным дедлайнам
+    cache: общий период анимации и кэш закодированных кадров
+    pipeline: подготовка кадров в фоновом потоке во время вывода
+    offline: офлайн-рендер пулом процессов с облаком точек и кадрами в общей памяти
+        (модуль запуска python -m heart_engine.offline, в пакет не импортируется)
+    asciicast: запись кадров в файл asciicast v2 и воспроизведение без NumPy
+    profiler: замер этапов кадра в кольцевых буферах с перцентилями задержек
+    splat: растровый вывод точек в RGBA float32 без matplotlib и запись PNG через zlib
+    export: экспорт анимаций Heart-X без окна (Agg или splat) пулом процессов в GIF, APNG или PNG
+        (модуль запуска, в пакет не импортируется: зависит от matplotlib и Pillow)
+"""
+from .geometry import (generate_heart_points, heart_contour, heart_outline, heart_sphere, pack_points,
+                       stratified_order, GENERATOR_VERSION, POINT_DTYPE)
+from .pointcache import PointCloudCache, default_cache_dir
+from .transform import rotation_matrix, rotate_points, model_matrix, transform_points, PointTransform, ROTATION_ORDERS
+from .lod import LevelOfDetail
+from .raster import (front_most_points, project_points, draw_heart, rasterize,
+                     depth_shading, shadow_shading, lighting_shading, random_shading)
+from .framebuffer import Framebuffer, RESET, RENDER_MODES, create_framebuffer
+from .color import HuePalette
+from .output import write_frame, DiffWriter
+from .scheduler import FrameScheduler, SKIP, RENDER_LATE, calculate_fps
+from .cache import AnimationCycle, FrameCache
+from .pipeline import FramePipeline
+from .asciicast import AsciicastRecorder, AsciicastPlayer
+from .profiler import FrameProfiler, NULL_PROFILER
+from .splat import SplatCanvas, marker_diameter, encode_png, write_png
+from .effects import Pulse, Sway, VerticalMotion, Rainbow, Flicker, Shade, Banner
+from .preset import HeartPreset
+from .resize import ScreenLayout, TerminalResize
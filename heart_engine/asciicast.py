@@ -0,0 +1,354 @@
+"""
+Запись и воспроизведение терминальных анимаций в формате asciicast v2
+
+Файл asciicast v2 - это строка заголовка JSON и по одной строке на событие
+вывода: [время в секундах, "o", "текст"]. Такие записи открывает asciinema
+и его веб-плеер, а проигрыватель ниже выводит их без NumPy и без пересчета
+кадров - только чтение файла и запись байт в терминал.
+
+Модуль использует только стандартную библиотеку и не импортирует остальной
+движок, поэтому на киоске его можно запускать прямо файлом:
+    python heart_engine/asciicast.py play heart.cast --speed 2 --loop
+    python heart_engine/asciicast.py record heart.cast -- python Heart-Terminal/Heart-7.py
+"""
+import argparse  # Разбор аргументов командной строки
+import codecs  # Пошаговое декодирование UTF-8 (символ может прийти по частям)
+import json  # Заголовок и события asciicast
+import mmap  # Отображение записи в память при воспроизведении
+import os  # Процессы и файловые дескрипторы
+import shutil  # Размер терминала
+import signal  # Передача Ctrl+C записываемому процессу
+import sys  # Системные операции
+import time  # Таймер perf_counter и сон
+
+# Очистка экрана и курсор в начало: с нее начинается запись и каждый проход плеера
+CLEAR_SCREEN = '\033[2J\033[H'
+
+
+class AsciicastRecorder:
+    """
+    Запись вывода в файл asciicast v2 по мере появления кадров
+
+    Каждый вызов write() сразу дописывает одно событие в файл, поэтому сессия
+    любой длины не копится в памяти. Объект подходит как поток вывода для
+    DiffWriter (у него есть buffer и flush), а с tee=sys.stdout кадры
+    одновременно выводятся и в терминал.
+
+    Запись начинается с очистки экрана (первый кадр DiffWriter - разница
+    с пустым экраном), а перевод строки в событиях пишется как CR LF:
+    в терминале LF дополняет до CR LF драйвер, а плеер asciinema выводит
+    события как есть.
+    """
+
+    def __init__(self, path, width, height, tee=None, clock=None, title=None):
+        """
+        Args:
+            path (str): Файл записи
+            width (int): Ширина терминала записи в символах
+            height (int): Высота терминала записи в строках
+            tee: Текстовый поток, куда вывод дублируется (например, sys.stdout)
+            clock (callable): Источник времени в секундах (по умолчанию perf_counter
+                от момента создания записи)
+            title (str): Заголовок записи
+        """
+        self.tee = tee
+        self.frames = 0
+        self.bytes = 0
+        self._start = time.perf_counter()
+        self._clock = clock or (lambda: time.perf_counter() - self._start)
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        self._file = open(path, 'w', encoding='utf-8', newline='\n')
+
+        header = {'version': 2, 'width': int(width), 'height': int(height), 'timestamp': int(time.time()),
+                  'env': {'TERM': os.environ.get('TERM', 'xterm-256color'), 'SHELL': os.environ.get('SHELL', '')}}
+        if title:
+            header['title'] = title
+        self._file.write(json.dumps(header) + '\n')
+        self._event(0.0, CLEAR_SCREEN)
+        self._file.flush()
+
+    @property
+    def buffer(self):
+        """
+        Байтовый поток (как sys.stdout.buffer), в который пишет write_frame
+        """
+        return self
+
+    def write(self, data, timestamp=None):
+        """
+        Запись одного события вывода
+
+        Args:
+            data (bytes): Байты, выведенные в терминал
+            timestamp (float): Время события в секундах (None - по часам записи)
+
+        Returns:
+            int: Количество записанных байт
+        """
+        if self.tee is not None:
+            self.tee.buffer.write(data)
+        text = self._decoder.decode(data)
+        if text:
+            self._event(self._clock() if timestamp is None else timestamp, text)
+        self.frames += 1
+        self.bytes += len(data)
+        return len(data)
+
+    def resize(self, width, height, timestamp=None):
+        """
+        Событие изменения размера терминала: следующие кадры записаны для нового размера
+
+        Args:
+            width (int): Ширина терминала в символах
+            height (int): Высота терминала в строках
+            timestamp (float): Время события в секундах (None - по часам записи)
+        """
+        moment = self._clock() if timestamp is None else timestamp
+        self._file.write(f"[{moment:.6f}, \"r\", \"{int(width)}x{int(height)}\"]\n")
+
+    def flush(self):
+        """
+        Сброс записанных событий на диск (и вывода в терминал при tee)
+        """
+        self._file.flush()
+        if self.tee is not None:
+            self.tee.flush()
+            self.tee.buffer.flush()
+
+    def close(self):
+        """
+        Завершение записи
+        """
+        if not self._file.closed:
+            tail = self._decoder.decode(b'', final=True)
+            if tail:
+                self._event(self._clock(), tail)
+            self._file.close()
+
+    def _event(self, moment, text):
+        """
+        Строка события вывода; LF без CR дополняется до CR LF (вывод из
+        псевдотерминала уже переведен драйвером и не меняется)
+        """
+        text = text.replace('\r\n', '\n').replace('\n', '\r\n')
+        self._file.write(f"[{moment:.6f}, \"o\", {json.dumps(text, ensure_ascii=False)}]\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+class AsciicastPlayer:
+    """
+    Воспроизведение файла asciicast v2 с исходным темпом
+
+    Файл отображается в память и читается по одной строке события, поэтому
+    запуск не зависит от длины записи. События изменения размера ("r")
+    пропускаются: размер своего терминала плеер не меняет. Время вывода каждого события считается
+    от начала воспроизведения (start + t / speed), и ошибки сна не копятся.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Файл записи asciicast v2
+        """
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        end = self._map.find(b'\n')
+        self.header = json.loads(self._map[:end if end >= 0 else len(self._map)])
+        if self.header.get('version') != 2:
+            raise ValueError(f"{path}: поддерживается только asciicast v2")
+        self._events_start = end + 1 if end >= 0 else len(self._map)
+
+        # Статистика последнего воспроизведения
+        self.frames = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    def events(self):
+        """
+        События вывода по порядку
+
+        Yields:
+            tuple: Время события в секундах и байты для терминала
+        """
+        position = self._events_start
+        size = len(self._map)
+        while position < size:
+            end = self._map.find(b'\n', position)
+            if end < 0:
+                end = size
+            line = self._map[position:end]
+            position = end + 1
+            if not line.strip():
+                continue
+            moment, kind, text = json.loads(line)
+            if kind == 'o':
+                yield moment, text.encode('utf-8')
+
+    def play(self, stream=None, speed=1.0, idle_limit=None, spin=0.002):
+        """
+        Вывод записи в терминал с исходным темпом
+
+        Args:
+            stream: Текстовый поток вывода (по умолчанию sys.stdout)
+            speed (float): Множитель скорости (2 - вдвое быстрее)
+            idle_limit (float): Наибольшая пауза между событиями в секундах записи
+                (None - без ограничения)
+            spin (float): Сколько секунд перед событием ждать активно, а не во сне
+
+        Returns:
+            dict: frames, bytes, seconds и bytes_per_second - выдержанный поток байт
+        """
+        stream = stream or sys.stdout
+        output = stream.buffer
+        stream.flush()
+        started = time.perf_counter()
+        shift = 0.0  # Сокращенное время пауз (idle_limit)
+        previous = 0.0
+        self.frames = self.bytes = 0
+        try:
+            for moment, data in self.events():
+                if idle_limit is not None and moment - previous > idle_limit:
+                    shift += moment - previous - idle_limit
+                previous = moment
+
+                deadline = started + (moment - shift) / speed
+                now = time.perf_counter()
+                if deadline - now > spin:
+                    time.sleep(deadline - now - spin)
+                while time.perf_counter() < deadline:
+                    pass
+
+                output.write(data)
+                output.flush()
+                self.frames += 1
+                self.bytes += len(data)
+        finally:
+            self.elapsed = time.perf_counter() - started
+        return self.stats()
+
+    def stats(self):
+        """
+        Статистика последнего воспроизведения
+        """
+        return {
+            'frames': self.frames,
+            'bytes': self.bytes,
+            'seconds': self.elapsed,
+            'bytes_per_second': self.bytes / self.elapsed if self.elapsed > 0 else 0.0,
+        }
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+
+def record_command(path, command, width=None, height=None):
+    """
+    Запись вывода другой программы (например, любого скрипта Heart-Terminal)
+
+    Программа запускается в псевдотерминале нужного размера, ее вывод
+    показывается в текущем терминале и одновременно пишется в файл.
+    Ctrl+C передается программе, запись завершается вместе с ней.
+
+    Args:
+        path (str): Файл записи
+        command (list): Команда и аргументы
+        width (int): Ширина терминала (None - как у текущего)
+        height (int): Высота терминала (None - как у текущего)
+
+    Returns:
+        int: Код завершения программы
+    """
+    import pty  # Псевдотерминал (только POSIX)
+    import fcntl
+    import struct
+    import termios
+
+    size = shutil.get_terminal_size()
+    width, height = width or size.columns, height or size.lines
+    pid, master = pty.fork()
+    if pid == 0:
+        os.execvp(command[0], command)
+
+    fcntl.ioctl(master, termios.TIOCSWINSZ, struct.pack('HHHH', height, width, 0, 0))
+    with AsciicastRecorder(path, width, height, tee=sys.stdout, title=' '.join(command)) as recorder:
+        while True:
+            try:
+                data = os.read(master, 65536)
+            except KeyboardInterrupt:
+                os.kill(pid, signal.SIGINT)
+                continue
+            except OSError:
+                # Программа завершилась и закрыла терминал
+                break
+            if not data:
+                break
+            recorder.write(data)
+            recorder.flush()
+    os.close(master)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Запись и воспроизведение анимаций в формате asciicast v2")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    play = commands.add_parser('play', help="Воспроизвести запись")
+    play.add_argument('path', help="Файл .cast")
+    play.add_argument('--speed', type=float, default=1.0, help="Множитель скорости")
+    play.add_argument('--idle-limit', type=float, default=None, help="Наибольшая пауза между кадрами, с")
+    play.add_argument('--loop', action='store_true', help="Повторять запись по кругу (для киоска)")
+
+    record = commands.add_parser('record', help="Записать вывод программы")
+    record.add_argument('path', help="Файл .cast")
+    record.add_argument('--cols', type=int, default=None, help="Ширина терминала записи")
+    record.add_argument('--rows', type=int, default=None, help="Высота терминала записи")
+    # Команда для записи идет после --, ее аргументы argparse не разбирает
+    argv = sys.argv[1:]
+    program = argv[argv.index('--') + 1:] if '--' in argv else []
+    args = parser.parse_args(argv[:argv.index('--')] if '--' in argv else argv)
+
+    if args.command == 'record':
+        if not program:
+            parser.error("нужна команда для записи, например: -- python Heart-Terminal/Heart-7.py")
+        sys.exit(record_command(args.path, program, args.cols, args.rows))
+
+    sys.stdout.write('\033[?25l')  # Скрытие курсора
+    stats = {'frames': 0, 'bytes': 0, 'seconds': 0.0}
+    with AsciicastPlayer(args.path) as player:
+        try:
+            while True:
+                sys.stdout.write(CLEAR_SCREEN)  # Каждый проход начинается с чистого экрана
+                result = player.play(speed=args.speed, idle_limit=args.idle_limit)
+                for key in stats:
+                    stats[key] += result[key]
+                if not args.loop:
+                    break
+        except KeyboardInterrupt:
+            result = player.stats()
+            for key in stats:
+                stats[key] += result[key]
+        finally:
+            sys.stdout.write('\033[0m\033[?25h\n')  # Сброс цвета и курсор
+            sys.stdout.flush()
+    rate = stats['bytes'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+    print(f"Кадров: {stats['frames']} за {stats['seconds']:.2f} с | "
+          f"{rate / 1024:.1f} КБ/с ({rate * 8 / 1e6:.2f} Мбит/с)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
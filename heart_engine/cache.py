@@ -0,0 +1,145 @@
+"""
+Кэш закодированных кадров периодической анимации
+"""
+import math  # Округление числа повторов
+
+
+class AnimationCycle:
+    """
+    Общий период нескольких периодических движений
+
+    Поворот, пульсация и смена цвета имеют разные периоды, и точный общий период
+    (НОК) у них обычно бесконечен. Цикл подбирает наименьшее число кадров frames,
+    в которое каждое движение укладывается целое число раз с погрешностью
+    периода не больше tolerance, и слегка подправляет скорости движений.
+    После этого кадр с номером n совпадает с кадром n + frames.
+    """
+
+    def __init__(self, steps, periods, tolerance=0.03, max_frames=5000):
+        """
+        Args:
+            steps (list): Приращение каждого движения за кадр (радианы, секунды и т.п.)
+            periods (list): Период каждого движения в тех же единицах
+            tolerance (float): Допустимое относительное изменение скорости движений
+            max_frames (int): Наибольшая длина цикла в кадрах
+        """
+        self.periods = list(periods)
+        # Период каждого движения в кадрах
+        frame_periods = [period / step for step, period in zip(steps, periods)]
+
+        for frames in range(1, max_frames + 1):
+            repeats = [max(1, round(frames / period)) for period in frame_periods]
+            if all(abs(frames / count - period) <= tolerance * period
+                   for count, period in zip(repeats, frame_periods)):
+                break
+        else:
+            raise ValueError(f"Нет общего периода до {max_frames} кадров с погрешностью {tolerance:.0%}")
+
+        self.frames = frames
+        self.repeats = repeats
+        # Подправленные приращения за кадр
+        self.steps = [count * period / frames for count, period in zip(repeats, periods)]
+
+    def values(self, frame):
+        """
+        Значения всех движений для кадра (с учетом периодичности)
+
+        Args:
+            frame (int): Номер кадра
+
+        Returns:
+            list: Значение каждого движения в пределах его периода
+        """
+        index = frame % self.frames
+        return [math.fmod(index * step, period) for step, period in zip(self.steps, self.periods)]
+
+
+# База кадра "только что очищенный экран": разница с пустым экраном (первый
+# кадр после запуска или изменения размера), выводится только сразу после очистки
+BLANK_SCREEN = -1
+
+
+class FrameCache:
+    """
+    Кэш закодированных кадров одного цикла анимации
+
+    Кадр хранится вместе с номером кадра, относительно которого он закодирован
+    (DiffWriter выводит только разницу с прошлым кадром), или None, если это
+    полная перерисовка. Такой кадр можно воспроизвести только после своего
+    базового кадра; полную перерисовку - после любого. Разница с пустым
+    экраном хранится с базой BLANK_SCREEN и подходит только сразу после очистки.
+    """
+
+    def __init__(self, frames, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            frames (int): Длина цикла в кадрах
+            max_bytes (int): Ограничение памяти на байты кадров
+        """
+        self.frames = frames
+        self.max_bytes = max_bytes
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = [None] * frames
+
+    @property
+    def hit_rate(self):
+        """
+        Доля кадров, взятых из кэша
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, index, previous):
+        """
+        Поиск кадра, который можно вывести после кадра previous
+
+        Args:
+            index (int): Номер кадра в цикле
+            previous (int): Номер выведенного перед ним кадра
+                (BLANK_SCREEN - экран только что очищен, None - неизвестен)
+
+        Returns:
+            bytes: Байты кадра или None, если кадр нужно отрисовать
+        """
+        entry = self._entries[index]
+        if entry is not None and (entry[0] is None or entry[0] == previous):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, index, data, base):
+        """
+        Сохранение отрисованного кадра
+
+        Args:
+            index (int): Номер кадра в цикле
+            data (bytes): Байты кадра
+            base (int): Номер кадра, относительно которого закодирована разница
+                (BLANK_SCREEN - разница с очищенным экраном, None - полная перерисовка)
+
+        Returns:
+            bool: False, если кадр не поместился в ограничение памяти
+        """
+        entry = self._entries[index]
+        released = len(entry[1]) if entry is not None else 0
+        if self.memory - released + len(data) > self.max_bytes:
+            return False
+        self._entries[index] = (base, data)
+        self.memory += len(data) - released
+        return True
+
+    def clear(self):
+        """
+        Очистка кэша (например, после изменения размера экрана)
+        """
+        self._entries = [None] * self.frames
+        self.memory = 0
+
+    def summary(self):
+        """
+        Короткая строка состояния кэша
+        """
+        return f"Cache: {self.hit_rate:.0%} hit, {self.memory / (1024 * 1024):.1f}/{self.max_bytes / (1024 * 1024):.0f} MB"
@@ -0,0 +1,85 @@
+"""
+Квантованная таблица цветов HSV -> ANSI
+"""
+import colorsys  # Преобразование цветов (только при построении таблицы)
+
+import numpy as np  # Математические операции и работа с массивами
+
+
+class HuePalette:
+    """
+    Таблица готовых ANSI-последовательностей цвета, построенная один раз при запуске
+
+    Оттенок квантуется на steps ступеней, насыщенность и яркость - до ближайшего
+    уровня из saturations и values. В цикле кадров colorsys больше не вызывается:
+    индекс цвета для всех ячеек считается одним векторным выражением.
+    Индексы начинаются с 1, как цвета в Framebuffer (0 - ячейка без цвета).
+    """
+
+    def __init__(self, steps=256, saturations=(1.0,), values=(1.0,)):
+        """
+        Args:
+            steps (int): Количество различимых ступеней оттенка
+            saturations (tuple): Уровни насыщенности (0-1)
+            values (tuple): Уровни яркости (0-1)
+        """
+        self.steps = steps
+        self.saturations = np.asarray(saturations, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+
+        # Порядок: насыщенность -> яркость -> оттенок.
+        # Те же цвета для фона нужны режиму полублоков
+        self.sequences = []
+        self.background_sequences = []
+        for saturation in self.saturations:
+            for value in self.values:
+                for step in range(steps):
+                    r, g, b = [int(c * 255) for c in colorsys.hsv_to_rgb(step / steps, saturation, value)]
+                    self.sequences.append(f"\033[38;2;{r};{g};{b}m".encode())
+                    self.background_sequences.append(f"\033[48;2;{r};{g};{b}m".encode())
+
+        if len(self.sequences) > np.iinfo(np.uint16).max:
+            raise ValueError("Слишком много цветов для uint16: уменьшите steps или количество уровней")
+
+    def codes(self, hue, saturation=None, value=None):
+        """
+        Векторный перевод HSV в индексы палитры
+
+        Args:
+            hue (np.array): Цветовой тон (0-1)
+            saturation (np.array): Насыщенность (по умолчанию первый уровень)
+            value (np.array): Яркость (по умолчанию первый уровень)
+
+        Returns:
+            np.array: Индексы цветов (uint16, начиная с 1)
+        """
+        hue = np.clip(hue, 0.0, 1.0)
+        # Оттенки 0 и 1 - один и тот же красный цвет
+        codes = np.rint(hue * self.steps).astype(np.int64) % self.steps
+        if saturation is not None and len(self.saturations) > 1:
+            codes += _nearest_level(self.saturations, saturation) * (len(self.values) * self.steps)
+        if value is not None and len(self.values) > 1:
+            codes += _nearest_level(self.values, value) * self.steps
+        return (codes + 1).astype(np.uint16)
+
+    def sequence(self, hue, saturation=None, value=None):
+        """
+        ANSI-последовательность для одного цвета (например, для букв текста)
+
+        Args:
+            hue (float): Цветовой тон (0-1)
+            saturation (float): Насыщенность
+            value (float): Яркость
+
+        Returns:
+            bytes: ANSI-последовательность цвета текста
+        """
+        return self.sequences[int(self.codes(hue, saturation, value)) - 1]
+
+
+def _nearest_level(levels, values):
+    """
+    Индекс ближайшего уровня для каждого значения
+    """
+    values = np.asarray(values, dtype=float)
+    return np.abs(values[..., np.newaxis] - levels).argmin(axis=-1)
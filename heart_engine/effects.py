@@ -0,0 +1,274 @@
+"""
+Эффекты анимации: пульсация, покачивание, движение, цвет и текст под сердцем
+
+Каждый эффект - небольшой объект с параметрами варианта. Эффекты, которые
+меняются со временем, знают свой период (period), поэтому кэш кадров
+(AnimationCycle) может подобрать общий период всей анимации.
+"""
+import math  # Математические функции
+
+import numpy as np  # Математические операции и работа с массивами
+
+from .color import HuePalette
+from .framebuffer import ERASE_LINE, RESET
+
+
+class Pulse:
+    """
+    Пульсация: масштаб 1 + amplitude * sin(frequency * t)
+    """
+
+    def __init__(self, amplitude=0.05, frequency=2.0):
+        """
+        Args:
+            amplitude (float): Размах пульсации (0.05 - от 0.95 до 1.05)
+            frequency (float): Угловая частота, радиан в секунду
+        """
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.period = 2 * math.pi / frequency
+
+    def __call__(self, time_val):
+        return 1 + self.amplitude * math.sin(time_val * self.frequency)
+
+
+class Sway:
+    """
+    Покачивание вокруг осей X и Z (Heart-13, Heart-14, Heart-19)
+    """
+
+    def __init__(self, x_amplitude=0.2, x_frequency=0.5, z_amplitude=0.1, z_frequency=0.3):
+        """
+        Args:
+            x_amplitude (float): Наибольший угол вокруг оси X
+            x_frequency (float): Угловая частота покачивания вокруг X
+            z_amplitude (float): Наибольший угол вокруг оси Z
+            z_frequency (float): Угловая частота покачивания вокруг Z
+        """
+        self.x_amplitude = x_amplitude
+        self.x_frequency = x_frequency
+        self.z_amplitude = z_amplitude
+        self.z_frequency = z_frequency
+        self.periods = (2 * math.pi / x_frequency, 2 * math.pi / z_frequency)
+
+    def __call__(self, x_time, z_time):
+        """
+        Args:
+            x_time (float): Время покачивания вокруг X
+            z_time (float): Время покачивания вокруг Z
+
+        Returns:
+            tuple: Углы вокруг осей X и Z
+        """
+        return (self.x_amplitude * math.sin(x_time * self.x_frequency),
+                self.z_amplitude * math.cos(z_time * self.z_frequency))
+
+
+class VerticalMotion:
+    """
+    Движение сердца вверх и вниз (Heart-22, Heart-23)
+    """
+
+    def __init__(self, amplitude=10.0, frequency=2.0):
+        """
+        Args:
+            amplitude (float): Наибольший сдвиг по оси Y
+            frequency (float): Угловая частота движения
+        """
+        self.amplitude = amplitude
+        self.frequency = frequency
+        self.period = 2 * math.pi / frequency
+
+    def __call__(self, time_val):
+        """
+        Returns:
+            np.array: Сдвиг точек (x, y, z)
+        """
+        return np.array([0.0, self.amplitude * math.sin(time_val * self.frequency), 0.0])
+
+
+def _ramp(level, depth):
+    """
+    Уровень насыщенности или яркости: число или диапазон (дальние, ближние точки)
+    """
+    if isinstance(level, tuple):
+        return level[0] + (level[1] - level[0]) * depth
+    return level
+
+
+def _levels(level, count):
+    """
+    Уровни таблицы цветов для числа или диапазона
+    """
+    if isinstance(level, tuple):
+        return tuple(np.linspace(level[0], level[1], count))
+    return (level,)
+
+
+class Rainbow:
+    """
+    Радужный цвет по глубине: оттенок (speed * t + глубина) бежит по кругу
+    """
+
+    def __init__(self, speed=0.1, saturation=1.0, value=1.0, levels=8):
+        """
+        Args:
+            speed (float): Оборотов цветового круга в секунду
+            saturation (float | tuple): Насыщенность или диапазон (дальние, ближние точки)
+            value (float | tuple): Яркость или диапазон (дальние, ближние точки)
+            levels (int): Сколько уровней таблицы цветов на диапазон
+        """
+        self.speed = speed
+        self.saturation = saturation
+        self.value = value
+        self.levels = levels
+        self.period = 1 / speed if speed else None
+
+    def palette(self):
+        """
+        Таблица цветов с нужными уровнями насыщенности и яркости
+        """
+        return HuePalette(saturations=_levels(self.saturation, self.levels),
+                          values=_levels(self.value, self.levels))
+
+    def hue(self, depth, time_val):
+        return (time_val * self.speed + depth) % 1.0
+
+    def __call__(self, depth, time_val):
+        """
+        Args:
+            depth (np.array): Нормализованная глубина точек (0 - дальние, 1 - ближние)
+            time_val (float): Время анимации в секундах
+
+        Returns:
+            tuple: Оттенок, насыщенность и яркость точек
+        """
+        return self.hue(depth, time_val), _ramp(self.saturation, depth), _ramp(self.value, depth)
+
+
+class Flicker(Rainbow):
+    """
+    Радуга с мерцанием: оттенок умножается на яркость 0.5 + 0.5 * sin (Heart-15)
+    """
+
+    def hue(self, depth, time_val):
+        phase = (time_val * self.speed) % 1.0
+        brightness = 0.5 + 0.5 * math.sin(phase * 2 * math.pi)
+        return ((phase + depth) % 1.0 * brightness) % 1.0
+
+
+class Shade:
+    """
+    Один оттенок, яркость которого растет к зрителю (Heart-14)
+    """
+
+    period = None  # Цвет не меняется со временем
+
+    def __init__(self, hue=0.0, saturation=1.0, value=(0.3, 1.0), levels=32):
+        """
+        Args:
+            hue (float): Оттенок (0 - красный)
+            saturation (float | tuple): Насыщенность или диапазон (дальние, ближние точки)
+            value (float | tuple): Яркость или диапазон (дальние, ближние точки)
+            levels (int): Сколько уровней таблицы цветов на диапазон
+        """
+        self.hue = hue
+        self.saturation = saturation
+        self.value = value
+        self.levels = levels
+
+    def palette(self):
+        return HuePalette(steps=1, saturations=_levels(self.saturation, self.levels),
+                          values=_levels(self.value, self.levels))
+
+    def __call__(self, depth, time_val):
+        return np.full(len(depth), self.hue), _ramp(self.saturation, depth), _ramp(self.value, depth)
+
+
+# Большие буквы для текста под сердцем
+BIG_LETTERS = {
+    'I': ["█████",
+          "  █  ",
+          "  █  ",
+          "  █  ",
+          "█████"],
+    'L': ["█    ",
+          "█    ",
+          "█    ",
+          "█    ",
+          "█████"],
+    'O': ["█████",
+          "█   █",
+          "█   █",
+          "█   █",
+          "█████"],
+    'V': ["█   █",
+          "█   █",
+          "█   █",
+          " █ █ ",
+          "  █  "],
+    'E': ["█████",
+          "█    ",
+          "████ ",
+          "█    ",
+          "█████"],
+    'M': ["█   █",
+          "██ ██",
+          "█ █ █",
+          "█   █",
+          "█   █"],
+    ' ': ["     ",
+          "     ",
+          "     ",
+          "     ",
+          "     "],
+}
+
+
+class Banner:
+    """
+    Текст большими цветными буквами под сердцем (I-LOVE-MOM)
+    """
+
+    def __init__(self, text="I LOVE MOM", hue_speed=0.5, wave=0, spacing=1):
+        """
+        Args:
+            text (str): Текст (буквы из BIG_LETTERS)
+            hue_speed (float): Оборотов цветового круга в секунду
+            wave (int): Размах волны строк по горизонтали в символах (0 - без волны)
+            spacing (int): Пробелов между буквами
+        """
+        self.text = text
+        self.hue_speed = hue_speed
+        self.wave = wave
+        self.spacing = spacing
+        # Строки букв кодируются один раз
+        self._letters = [[row.encode() for row in BIG_LETTERS.get(char, BIG_LETTERS[' '])] for char in text]
+        self.height = len(BIG_LETTERS[' '])
+        self.width = sum(len(BIG_LETTERS.get(char, BIG_LETTERS[' '])[0]) + spacing for char in text)
+
+    def __call__(self, time_val, width, palette):
+        """
+        Args:
+            time_val (float): Время анимации в секундах
+            width (int): Ширина строки для центрирования
+            palette (HuePalette): Таблица цветов
+
+        Returns:
+            bytes: Строки текста через перевод строки
+        """
+        lines = [b""] * self.height
+        for i, letter in enumerate(self._letters):
+            color = palette.sequence((time_val * self.hue_speed + i / len(self._letters)) % 1.0)
+            for line, row in enumerate(letter):
+                # Цвет выводится один раз на строку буквы: пробелы его не меняют
+                lines[line] += (color + row + RESET if row.strip() else row) + b" " * self.spacing
+
+        padding = (width - self.width) // 2
+        result = []
+        for i, line in enumerate(lines):
+            # Волна сдвигает каждую строку на свою фазу
+            offset = int(self.wave * math.sin(time_val * 3 + i * 0.5)) if self.wave else 0
+            # Хвост прошлой строки стирается: волна сдвигает строку влево
+            result.append(b" " * max(0, padding + offset) + line + ERASE_LINE)
+        return b"\n".join(result)
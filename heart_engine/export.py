@@ -0,0 +1,389 @@
+"""
+Экспорт анимаций Heart-X без окна: кадры пулом процессов в GIF, APNG или PNG
+
+Скрипт Heart-X должен определять FRAMES (значения кадров) и для каждого способа растеризации:
+    agg   - create_animation() -> (фигура, animate), где animate(frame) обновляет
+            фигуру и возвращает изменившиеся объекты (или ничего, если
+            перерисовывает фигуру целиком); кадры рисует matplotlib (Agg)
+    splat - create_splat(dpi=...) -> (холст SplatCanvas, draw), где draw(frame)
+            рисует кадр на холсте; matplotlib не импортируется
+Если функция принимает seed, все процессы строят одинаковое облако точек.
+
+Запуск:
+    python -m heart_engine.export Heart-X/Heart-2X.py --output heart.gif
+    python -m heart_engine.export Heart-X/Heart-3X.py --output heart.png --dpi 50 --processes 8
+    python -m heart_engine.export Heart-X/Heart-3X.py --backend splat --output frames/
+    python -m heart_engine.export Heart-X/Heart-1X.py --output frames/ --timings timings.csv
+"""
+import argparse  # Разбор аргументов командной строки
+import importlib.util  # Загрузка скрипта анимации как модуля
+import inspect  # Проверка параметров create_animation
+import multiprocessing  # Пул процессов
+import os  # Пути к файлам
+import sys  # Системные операции
+import time  # Таймер perf_counter
+from collections import deque  # Очередь заданий в работе
+from multiprocessing import shared_memory  # Общая память процессов
+
+import numpy as np  # Математические операции и работа с массивами
+
+from .profiler import FrameProfiler
+from .splat import write_png
+
+# Зерно облака точек при экспорте: все процессы рисуют одно и то же сердце
+EXPORT_SEED = 0
+
+# Функция скрипта для каждого способа растеризации
+BACKENDS = {'agg': 'create_animation', 'splat': 'create_splat'}
+
+# Состояние процесса-исполнителя (заполняется в _init_worker)
+_worker = {}
+
+
+def load_animation(path, backend='agg'):
+    """
+    Загрузка скрипта Heart-X (окно не открывается)
+
+    Args:
+        path (str): Путь к скрипту
+        backend (str): Способ растеризации: 'agg' (matplotlib без окна) или 'splat' (без matplotlib)
+
+    Returns:
+        module: Модуль скрипта с FRAMES и функцией способа (см. BACKENDS)
+    """
+    if backend == 'agg':
+        import matplotlib
+        matplotlib.use('Agg')  # Кадры растеризуются в память, без окна
+    name = os.path.splitext(os.path.basename(path))[0].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not hasattr(module, BACKENDS[backend]) or not hasattr(module, 'FRAMES'):
+        raise ValueError(f"{path}: для способа {backend} нужны FRAMES и {BACKENDS[backend]}()")
+    return module
+
+
+def create_figure(module, dpi=None):
+    """
+    Фигура скрипта для экспорта
+
+    Args:
+        module (module): Скрипт Heart-X (см. load_animation)
+        dpi (float): Точек на дюйм (None - как у фигуры скрипта)
+
+    Returns:
+        tuple: Фигура и функция кадра animate(frame)
+    """
+    create = module.create_animation
+    kwargs = {'seed': EXPORT_SEED} if 'seed' in inspect.signature(create).parameters else {}
+    fig, animate = create(**kwargs)
+    if dpi:
+        fig.set_dpi(dpi)
+    return fig, animate
+
+
+def create_splat(module, dpi=None):
+    """
+    Растровый холст скрипта для экспорта без matplotlib
+
+    Args:
+        module (module): Скрипт Heart-X (см. load_animation)
+        dpi (float): Точек на дюйм (None - по умолчанию скрипта)
+
+    Returns:
+        tuple: Холст SplatCanvas и функция кадра draw(frame)
+    """
+    create = module.create_splat
+    kwargs = {'seed': EXPORT_SEED} if 'seed' in inspect.signature(create).parameters else {}
+    if dpi:
+        kwargs['dpi'] = dpi
+    return create(**kwargs)
+
+
+def frame_size(module, backend, dpi=None):
+    """
+    Размер кадра (ширина, высота) в пикселях
+    """
+    if backend == 'splat':
+        canvas, _ = create_splat(module, dpi)
+        return canvas.width, canvas.height
+    import matplotlib.pyplot as plt
+    fig, _ = create_figure(module, dpi)
+    size = fig.canvas.get_width_height()
+    plt.close(fig)
+    return size
+
+
+def _agg_renderer(module, dpi):
+    """
+    Кадр на холсте Agg: render(frame, out) копирует RGB из buffer_rgba в out
+    """
+    fig, animate = create_figure(module, dpi)
+    canvas = fig.canvas
+    # Как FuncAnimation(blit=True): если кадр возвращает изменившиеся объекты,
+    # фон без них рисуется один раз, а каждый кадр только восстанавливается
+    artists = animate(module.FRAMES[0])
+    background = None
+    if artists:
+        for artist in artists:
+            artist.set_animated(True)
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+
+    def render(frame, out):
+        if background is not None:
+            canvas.restore_region(background)
+            for artist in animate(frame):
+                fig.draw_artist(artist)
+        else:
+            animate(frame)
+            canvas.draw()
+        # buffer_rgba - представление буфера Agg без копии: копируется только RGB
+        out[:] = np.asarray(canvas.buffer_rgba())[:, :, :3]
+
+    return render
+
+
+def _splat_renderer(module, dpi):
+    """
+    Кадр на холсте SplatCanvas: render(frame, out) переводит RGBA float32 в RGB uint8 в out
+    """
+    canvas, draw = create_splat(module, dpi)
+
+    def render(frame, out):
+        draw(frame)
+        canvas.to_rgb(out=out)
+
+    return render
+
+
+def _init_worker(script, backend, dpi, frames_name, frames_shape):
+    """
+    Инициализация исполнителя: растеризация кадров скрипта и кадровые слоты из общей памяти
+    """
+    module = load_animation(script, backend)
+    create_renderer = _splat_renderer if backend == 'splat' else _agg_renderer
+    frames_memory = shared_memory.SharedMemory(name=frames_name)
+    _worker.update(
+        values=module.FRAMES,
+        render=create_renderer(module, dpi),
+        memory=frames_memory,  # Ссылку на общую память держим, пока живет процесс
+        frames=np.ndarray(frames_shape, dtype=np.uint8, buffer=frames_memory.buf),
+    )
+
+
+def _render_chunk(start, stop, slot):
+    """
+    Отрисовка кадров start..stop-1 в кадровый слот slot общей памяти (RGB)
+
+    Returns:
+        list: Время отрисовки каждого кадра, нс
+    """
+    render = _worker['render']
+    values = _worker['values']
+    records = _worker['frames'][slot]
+
+    durations = []
+    for index, frame in enumerate(range(start, stop)):
+        started = time.perf_counter_ns()
+        render(values[frame % len(values)], records[index])
+        durations.append(time.perf_counter_ns() - started)
+    return durations
+
+
+def render_export(script, frames, backend='agg', dpi=None, processes=None, chunk=8):
+    """
+    Отрисовка кадров анимации Heart-X пулом процессов
+
+    Каждый исполнитель один раз строит фигуру скрипта на холсте Agg (или
+    растровый холст SplatCanvas) и рисует части диапазона кадров прямо в кадровые слоты общей памяти
+    (H x W x 3 байт). Родительский процесс собирает части строго по порядку;
+    слотов вдвое больше, чем процессов, поэтому исполнители не ждут, пока
+    родитель кодирует готовые кадры.
+
+    Args:
+        script (str): Путь к скрипту Heart-X
+        frames (range): Номера кадров (подряд; больше len(FRAMES) - анимация по кругу)
+        backend (str): Способ растеризации: 'agg' или 'splat' (см. BACKENDS)
+        dpi (float): Точек на дюйм (None - как у фигуры скрипта)
+        processes (int): Количество процессов (None - по числу ядер)
+        chunk (int): Кадров в одном задании
+
+    Yields:
+        tuple: Номер кадра, кадр RGB (H, W, 3) uint8 (перезаписывается
+            следующим кадром) и время его отрисовки в нс
+    """
+    if frames.step != 1:
+        raise ValueError("Кадры должны идти подряд (range с шагом 1)")
+    processes = processes or os.cpu_count() or 1
+    # Размер кадра: холст строится в родителе только ради размера
+    width, height = frame_size(load_animation(script, backend), backend, dpi)
+    frame_shape = (height, width, 3)
+
+    slots = 2 * processes
+    frames_shape = (slots, chunk) + frame_shape
+    frames_memory = shared_memory.SharedMemory(create=True, size=int(np.prod(frames_shape)))
+    pool = records = None
+    try:
+        records = np.ndarray(frames_shape, dtype=np.uint8, buffer=frames_memory.buf)
+        pool = multiprocessing.Pool(processes, initializer=_init_worker,
+                                    initargs=(os.path.abspath(script), backend, dpi, frames_memory.name, frames_shape))
+
+        starts = iter(range(frames.start, frames.stop, chunk))
+        pending = deque()  # (начало, конец, слот, результат) в порядке кадров
+        free_slots = deque(range(slots))
+
+        def submit():
+            start = next(starts, None)
+            if start is None:
+                return
+            stop = min(start + chunk, frames.stop)
+            slot = free_slots.popleft()
+            pending.append((start, stop, slot, pool.apply_async(_render_chunk, (start, stop, slot))))
+
+        for _ in range(slots):
+            submit()
+
+        while pending:
+            start, stop, slot, result = pending.popleft()
+            durations = result.get()
+            for index, frame in enumerate(range(start, stop)):
+                yield frame, records[slot, index], durations[index]
+            free_slots.append(slot)
+            submit()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        # Представление общей памяти нужно отпустить до close()
+        records = None
+        frames_memory.close()
+        frames_memory.unlink()
+
+
+class AnimationWriter:
+    """
+    Анимированный GIF или APNG через Pillow
+
+    Кадры кодируются по мере поступления (для GIF - квантование в 256
+    цветов), а файл собирается в close(): Pillow пишет анимацию целиком.
+    """
+
+    def __init__(self, path, fps):
+        """
+        Args:
+            path (str): Файл .gif или .png (APNG)
+            fps (float): Частота кадров анимации
+        """
+        self.path = path
+        self.duration = 1000 / fps  # Длительность кадра, мс
+        self.gif = path.lower().endswith('.gif')
+        self.images = []
+
+    def write(self, rgb):
+        """
+        Кодирование кадра RGB (H, W, 3) uint8
+        """
+        from PIL import Image
+        image = Image.fromarray(rgb)  # Копия кадра: буфер перезаписывается следующим кадром
+        if self.gif:
+            image = image.quantize(256, method=Image.Quantize.FASTOCTREE)
+        self.images.append(image)
+
+    def close(self):
+        """
+        Запись файла анимации (бесконечный повтор)
+        """
+        if self.images:
+            first, *rest = self.images
+            first.save(self.path, save_all=True, append_images=rest, duration=self.duration, loop=0)
+        self.images = []
+
+
+class PNGSequenceWriter:
+    """
+    Кадры отдельными файлами PNG: каталог/heart-00000.png или шаблон с %d
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Каталог (с / в конце или существующий) или шаблон имени вида frames/heart-%05d.png
+        """
+        if '%' not in path:
+            path = os.path.join(path, 'heart-%05d.png')
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.pattern = path
+        self.index = 0
+
+    def write(self, rgb):
+        """
+        Кодирование и запись кадра RGB (H, W, 3) uint8
+        """
+        write_png(self.pattern % self.index, rgb)  # Только zlib, без Pillow
+        self.index += 1
+
+    def close(self):
+        pass
+
+
+def create_writer(path, fps):
+    """
+    Запись кадров по имени файла: .gif - GIF, .png - APNG, каталог или шаблон с %d - кадры PNG
+    """
+    if '%' in path or path.endswith(('/', os.sep)) or os.path.isdir(path):
+        return PNGSequenceWriter(path)
+    if path.lower().endswith(('.gif', '.png', '.apng')):
+        return AnimationWriter(path, fps)
+    raise ValueError(f"Неизвестный формат вывода: {path} (нужен .gif, .png, .apng или каталог)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Экспорт анимации Heart-X без окна пулом процессов")
+    parser.add_argument('script', help="Скрипт анимации (например, Heart-X/Heart-2X.py)")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='agg',
+                        help="Растеризация: agg - matplotlib, splat - NumPy без matplotlib (только точки)")
+    parser.add_argument('--output', help="heart.gif, heart.png (APNG) или каталог для кадров PNG; "
+                                         "без него кадры только рисуются")
+    parser.add_argument('--frames', type=int, default=None, help="Количество кадров (по умолчанию один цикл FRAMES)")
+    parser.add_argument('--fps', type=float, default=20, help="Частота кадров файла (интервал 50 мс, как в окне)")
+    parser.add_argument('--dpi', type=float, default=None, help="Точек на дюйм (по умолчанию как у фигуры скрипта)")
+    parser.add_argument('--processes', type=int, default=None, help="Количество процессов (по умолчанию по числу ядер)")
+    parser.add_argument('--chunk', type=int, default=8, help="Кадров в одном задании")
+    parser.add_argument('--timings', help="CSV со временем отрисовки и кодирования каждого кадра")
+    args = parser.parse_args()
+
+    count = args.frames or len(load_animation(args.script, args.backend).FRAMES)
+    writer = create_writer(args.output, args.fps) if args.output else None
+    profiler = FrameProfiler(capacity=count)  # Перцентили по всем кадрам
+    timings = [] if args.timings else None
+    started = time.perf_counter()
+    for frame, rgb, render_ns in render_export(args.script, range(count), args.backend, dpi=args.dpi,
+                                               processes=args.processes, chunk=args.chunk):
+        profiler.record('render', render_ns)
+        encode_ns = 0
+        if writer is not None:
+            encode_started = time.perf_counter_ns()
+            writer.write(rgb)
+            encode_ns = time.perf_counter_ns() - encode_started
+            profiler.record('encode', encode_ns)
+        if timings is not None:
+            timings.append((frame, render_ns / 1e6, encode_ns / 1e6))
+    if writer is not None:
+        with profiler.span('save'):
+            writer.close()  # Сборка файла анимации
+    elapsed = time.perf_counter() - started
+
+    if timings is not None:
+        with open(args.timings, 'w') as file:
+            file.write("frame,render_ms,encode_ms\n")
+            file.writelines(f"{frame},{render_ms:.3f},{encode_ms:.3f}\n" for frame, render_ms, encode_ms in timings)
+    print(profiler.report(), file=sys.stderr)
+    print(f"Кадров: {count} за {elapsed:.2f} с ({count / elapsed:.1f} кадров/с, "
+          f"{count / args.fps / elapsed:.2f}x реального времени при {args.fps:g} кадрах/с)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""
+Кадровый буфер из компактных числовых плоскостей
+"""
+import unicodedata  # Ширина символов в терминале
+
+import numpy as np  # Математические операции и работа с массивами
+
+from .raster import front_most_points, braille_patterns, BRAILLE_CHARS, HALF_BLOCK_CHARS
+
+# Сброс цвета и очистка строки от курсора до конца
+RESET = b"\033[0m"
+ERASE_LINE = b"\033[K"
+# Цвет символа и цвет фона по умолчанию (сбрасываются по отдельности)
+DEFAULT_FOREGROUND = b"\033[39m"
+DEFAULT_BACKGROUND = b"\033[49m"
+
+# Режимы растеризации
+RENDER_MODES = ('text', 'braille', 'halfblock')
+
+
+def char_columns(char):
+    """
+    Ширина символа в столбцах терминала: широкие символы (эмодзи, иероглифы) занимают два
+
+    Args:
+        char (str): Символ
+
+    Returns:
+        int: 1 или 2
+    """
+    return 2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1
+
+
+def cell_columns(shading_chars):
+    """
+    Ширина ячейки кадра в столбцах терминала для набора символов
+
+    Args:
+        shading_chars (str): Набор символов
+
+    Returns:
+        int: 2, если среди символов есть широкие, иначе 1
+    """
+    return max((char_columns(char) for char in shading_chars), default=1)
+
+
+class Framebuffer:
+    """
+    Кадровый буфер терминала
+
+    Вместо массива строк dtype=object кадр хранится в трех плоскостях:
+        glyph: индекс символа (0 - пустая ячейка, i - shading_chars[i - 1])
+        color: индекс цвета в палитре (0 - без цвета, i - palette[i - 1])
+        depth: глубина видимой точки
+    и, если задана палитра фона, в четвертой:
+        background: индекс цвета фона (0 - фон терминала, i - background_palette[i - 1])
+
+    Символы и цвета кодируются в UTF-8 один раз при создании буфера, поэтому
+    многобайтовые символы не перекодируются в каждом кадре.
+
+    Если среди символов есть широкие, ячейка занимает два столбца терминала
+    (cell_width), а узкие символы и пробел дополняются пробелом. Тогда любой
+    вывод ячейки перекрывает оба ее столбца, и вывод только изменившихся
+    ячеек не оставляет половин широких символов прошлого кадра.
+    """
+
+    def __init__(self, width, height, shading_chars, palette=(), background_palette=None):
+        """
+        Args:
+            width (int): Ширина экрана в символах
+            height (int): Высота экрана в символах
+            shading_chars (str): Набор символов для различной глубины
+            palette (list): Байтовые ANSI-префиксы цветов для индексов 1..len(palette)
+            background_palette (list): ANSI-префиксы цветов фона (None - без плоскости фона)
+        """
+        self.width = width
+        self.height = height
+        self.shading_chars = shading_chars
+        self.palette = list(palette)
+        self.cell_width = cell_columns(shading_chars)  # Столбцов терминала на ячейку
+        # Точек растеризации на символ по ширине и высоте (см. braille и half_blocks)
+        self.subcells = (1, 1)
+
+        # uint8 хватает для всех обычных наборов символов, для длинных берем uint16
+        glyph_dtype = np.uint8 if len(shading_chars) < 255 else np.uint16
+        self.glyph = np.zeros((height, width), dtype=glyph_dtype)
+        self.color = np.zeros((height, width), dtype=np.uint16)
+        self.depth = np.full((height, width), -np.inf, dtype=np.float32)
+        self.background = None
+        if background_palette is not None:
+            self.background = np.zeros((height, width), dtype=np.uint16)
+
+        # Таблица фрагментов вывода строится один раз: символы (0 - пробел),
+        # цвета символа (0 - по умолчанию) и цвета фона (0 - по умолчанию).
+        # Без плоскости фона цвет символа сбрасывается коротким RESET.
+        # Символы дополняются пробелами до ширины ячейки
+        pieces = [b' ' * self.cell_width]
+        pieces += [(char + ' ' * (self.cell_width - char_columns(char))).encode('utf-8') for char in shading_chars]
+        self._glyph_count = len(pieces)
+        pieces.append(RESET if self.background is None else DEFAULT_FOREGROUND)
+        pieces.extend(self.palette)
+        self._background_base = len(pieces)
+        if self.background is not None:
+            pieces.append(DEFAULT_BACKGROUND)
+            pieces.extend(background_palette)
+
+        self._piece_blob = np.frombuffer(b''.join(pieces), dtype=np.uint8)
+        self._piece_lengths = np.array([len(piece) for piece in pieces], dtype=np.int64)
+        self._piece_starts = np.cumsum(self._piece_lengths) - self._piece_lengths
+        # Длины символов для glyph_bytes: пустая ячейка может стираться очисткой строки
+        self._glyph_lengths = self._piece_lengths[:self._glyph_count].copy()
+        self._glyph_lengths[0] = 0
+
+    @classmethod
+    def braille(cls, width, height, palette=()):
+        """
+        Буфер для точек Брайля: 2x4 точки на символ (U+2800-U+28FF)
+
+        Индекс символа в этом режиме совпадает с битовой маской точек.
+
+        Args:
+            width (int): Ширина экрана в символах
+            height (int): Высота экрана в символах
+            palette (list): Байтовые ANSI-префиксы цветов
+
+        Returns:
+            Framebuffer: Буфер с разрешением (width * 2, height * 4) точек
+        """
+        framebuffer = cls(width, height, BRAILLE_CHARS, palette)
+        framebuffer.subcells = (2, 4)
+        return framebuffer
+
+    @classmethod
+    def half_blocks(cls, width, height, palette=(), background_palette=()):
+        """
+        Буфер для полублоков: 1x2 точки на символ, верхняя точка - цвет символа ▀,
+        нижняя - цвет фона
+
+        Args:
+            width (int): Ширина экрана в символах
+            height (int): Высота экрана в символах
+            palette (list): ANSI-префиксы цветов символа
+            background_palette (list): ANSI-префиксы тех же цветов для фона
+
+        Returns:
+            Framebuffer: Буфер с разрешением (width, height * 2) точек
+        """
+        framebuffer = cls(width, height, HALF_BLOCK_CHARS, palette, background_palette)
+        framebuffer.subcells = (1, 2)
+        return framebuffer
+
+    @property
+    def resolution(self):
+        """
+        Размер экрана в точках растеризации (ширина, высота)
+        """
+        return self.width * self.subcells[0], self.height * self.subcells[1]
+
+    @property
+    def planes(self):
+        """
+        Плоскости, по которым кодируется кадр (без буфера глубины)
+        """
+        if self.background is None:
+            return [self.glyph, self.color]
+        return [self.glyph, self.color, self.background]
+
+    def clear(self):
+        """
+        Очистка буфера перед новым кадром (без новых выделений памяти)
+        """
+        self.glyph.fill(0)
+        self.color.fill(0)
+        self.depth.fill(-np.inf)
+        if self.background is not None:
+            self.background.fill(0)
+
+    def plot(self, x, y, z, intensity):
+        """
+        Отрисовка точек с учетом глубины
+
+        Args:
+            x (np.array): Столбцы точек (уже в пределах экрана)
+            y (np.array): Строки точек (уже в пределах экрана)
+            z (np.array): Глубина точек
+            intensity (np.array): Индексы символов в shading_chars
+
+        Returns:
+            np.array: Индексы видимых точек, чтобы вызывающий код мог раскрасить только их
+        """
+        front = front_most_points(x, y, z, self.width)
+        rows, cols = y[front], x[front]
+        self.glyph[rows, cols] = intensity[front] + 1
+        self.depth[rows, cols] = z[front]
+        return front
+
+    def plot_subcells(self, x, y, z, colors=None):
+        """
+        Отрисовка точек в режимах с несколькими точками на символ
+
+        Символ ячейки собирается из всех попавших в нее точек, а цвет берется
+        у ближайшей к зрителю (в режиме полублоков - отдельно для каждой половины).
+
+        Args:
+            x (np.array): Столбцы точек в точках растеризации (в пределах resolution)
+            y (np.array): Строки точек в точках растеризации
+            z (np.array): Глубина точек
+            colors (np.array): Индексы цветов точек в палитре (None - без цвета)
+        """
+        if self.subcells == (2, 4):
+            occupied = np.zeros((self.height * 4, self.width * 2), dtype=bool)
+            occupied[y, x] = True
+            self.glyph[:] = braille_patterns(occupied)
+
+            front = front_most_points(x // 2, y // 4, z, self.width)
+            rows, cols = y[front] // 4, x[front] // 2
+            self.depth[rows, cols] = z[front]
+            if colors is not None:
+                self.color[rows, cols] = colors[front]
+        elif self.subcells == (1, 2):
+            # Ближайшая точка в каждой половине ячейки
+            front = front_most_points(x, y, z, self.width)
+            rows, cols = y[front], x[front]
+            lit = np.zeros((self.height * 2, self.width), dtype=bool)
+            lit[rows, cols] = True
+            halves = np.zeros((self.height * 2, self.width), dtype=np.uint16)
+            if colors is not None:
+                halves[rows, cols] = colors[front]
+            depth = np.full((self.height * 2, self.width), -np.inf, dtype=np.float32)
+            depth[rows, cols] = z[front]
+
+            # ▀ - верхняя половина (нижняя - цветом фона), ▄ - только нижняя
+            upper, lower = lit[0::2], lit[1::2]
+            self.glyph[:] = np.where(upper, 1, np.where(lower, 2, 0))
+            self.color[:] = np.where(upper, halves[0::2], halves[1::2])
+            self.background[:] = np.where(upper & lower, halves[1::2], 0)
+            np.maximum(depth[0::2], depth[1::2], out=self.depth)
+        else:
+            raise ValueError(f"Буфер с {self.subcells} точками на символ не поддерживает plot_subcells")
+
+    def cell_ids(self):
+        """
+        Индексы ячеек (символ, цвет и фон одним числом) для каждого места экрана
+
+        Returns:
+            np.array: Массив (height, width) с индексами ячеек
+        """
+        ids = self.color.astype(np.int64) * self._glyph_count + self.glyph
+        if self.background is not None:
+            ids += self.background.astype(np.int64) * ((len(self.palette) + 1) * self._glyph_count)
+        return ids
+
+    def glyph_bytes(self):
+        """
+        Нижняя граница длины полного кадра (encode): байты всех непустых символов
+
+        Полный кадр выводит каждый непустой символ, а кроме них - пробелы,
+        цвета и перемещения курсора, поэтому он не короче этой суммы.
+
+        Returns:
+            int: Сумма длин непустых символов в UTF-8
+        """
+        return int(self._glyph_lengths[self.glyph].sum())
+
+    def encode_runs(self, rows, starts, ends, top=0):
+        """
+        Кодирование участков строк с позиционированием курсора
+
+        Кодировщик помнит текущий цвет терминала и выводит ANSI-префикс только
+        на границе одноцветных участков: пробелы цвет символа не меняют, а сброс
+        цвета выводится только перед бесцветным символом и в конце вывода.
+        Цвет фона отслеживается отдельно и нужен каждой ячейке, в том числе пробелу.
+        Пропуски между участками одной строки заменяются сдвигом курсора (CSI n C),
+        хвост пробелов до конца строки - очисткой строки (CSI K).
+
+        Args:
+            rows (np.array): Строки участков
+            starts (np.array): Первые столбцы участков (в ячейках)
+            ends (np.array): Столбцы сразу за концом участков
+                (участки упорядочены по строкам и столбцам и не пересекаются)
+            top (int): Номер строки экрана (с 0), с которой начинается кадр
+
+        Returns:
+            bytes: Байты для вывода; в начале и в конце цвет терминала сброшен
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        starts = np.asarray(starts, dtype=np.int64)
+        ends = np.asarray(ends, dtype=np.int64)
+        if len(rows) == 0:
+            return b''
+
+        # Хвосты пробелов в конце строк дешевле стереть одной командой.
+        # Очистка закрашивает текущим фоном, поэтому при плоскости фона
+        # перед ней остается один пробел, который вернет фон по умолчанию
+        filled = self.glyph != 0
+        if self.background is not None:
+            filled |= self.background != 0
+        content_end = np.where(filled.any(axis=1), self.width - filled[:, ::-1].argmax(axis=1), 0)
+        if self.background is not None:
+            content_end = np.minimum(content_end + 1, self.width)
+        trimmed = np.clip(content_end[rows], starts, ends)
+        erase = (ends == self.width) & (ends - trimmed > len(ERASE_LINE))
+        ends = np.where(erase, trimmed, ends)
+
+        # Ячейки всех участков подряд
+        lengths = ends - starts
+        offsets = np.cumsum(lengths) - lengths
+        count = int(lengths.sum())
+        flat = np.arange(count) + np.repeat(rows * self.width + starts - offsets, lengths)
+        glyphs = self.glyph.ravel()[flat].astype(np.int64)
+        colors = self.color.ravel()[flat].astype(np.int64)
+
+        # Цвет меняется только у символа, цвет которого отличается от цвета
+        # предыдущего видимого символа (в начале вывода цвет сброшен)
+        visible = np.flatnonzero(glyphs)
+        visible_colors = colors[visible]
+        switch = visible[visible_colors != np.concatenate(([0], visible_colors[:-1]))]
+        extra = np.zeros(count + 1, dtype=np.int64)
+        extra[switch + 1] += 1
+        last_state = visible_colors[-1] if len(visible_colors) else 0
+
+        # Цвет фона нужен каждой ячейке, поэтому меняется на любой его границе
+        if self.background is not None:
+            backgrounds = self.background.ravel()[flat].astype(np.int64)
+            background_switch = np.flatnonzero(backgrounds != np.concatenate(([0], backgrounds[:-1])))
+            extra[background_switch + 1] += 1
+            last_state = last_state or (backgrounds[-1] if count else 0)
+        extra = np.cumsum(extra)
+
+        # Фрагменты вывода: перед символом при необходимости вставляются фон и цвет
+        glyph_positions = np.arange(count) + extra[1:]
+        pieces = np.empty(count + extra[-1], dtype=np.int64)
+        pieces[glyph_positions] = glyphs
+        pieces[glyph_positions[switch] - 1] = self._glyph_count + colors[switch]
+        if self.background is not None:
+            has_color = np.zeros(count, dtype=np.int64)
+            has_color[switch] = 1
+            pieces[glyph_positions[background_switch] - 1 - has_color[background_switch]] = (
+                self._background_base + backgrounds[background_switch])
+
+        # Все фрагменты склеиваются одним индексированием
+        piece_lengths = self._piece_lengths[pieces]
+        piece_offsets = np.concatenate(([0], np.cumsum(piece_lengths)))
+        source = np.arange(piece_offsets[-1]) - np.repeat(piece_offsets[:-1] - self._piece_starts[pieces], piece_lengths)
+        data = self._piece_blob[source].tobytes()
+        run_bounds = piece_offsets[offsets + extra[offsets]].tolist() + [len(data)]
+
+        parts = []
+        row, column = -2, 0  # Позиция курсора после предыдущего участка
+        for index, (run_row, start, end, run_erase) in enumerate(zip(
+                rows.tolist(), starts.tolist(), ends.tolist(), erase.tolist())):
+            if run_row == row and start > column:
+                parts.append(b'\033[%dC' % ((start - column) * self.cell_width))
+            elif run_row == row + 1 and start == 0:
+                parts.append(b'\n')
+            elif run_row != row or start != column:
+                parts.append(b'\033[%d;%dH' % (run_row + top + 1, start * self.cell_width + 1))
+            parts.append(data[run_bounds[index]:run_bounds[index + 1]])
+            if run_erase:
+                parts.append(ERASE_LINE)
+            row, column = run_row, end
+
+        if last_state != 0:
+            parts.append(RESET)
+        return b''.join(parts)
+
+    def encode(self, top=0):
+        """
+        Кодирование всего кадра с установкой курсора в его начало
+
+        Args:
+            top (int): Номер строки экрана (с 0), с которой начинается кадр
+
+        Returns:
+            bytes: Кадр, строки разделены переводом строки
+        """
+        rows = np.arange(self.height)
+        return self.encode_runs(rows, np.zeros_like(rows), np.full_like(rows, self.width), top)
+
+
+def create_framebuffer(mode, width, height, shading_chars, palette=None):
+    """
+    Создание кадрового буфера для выбранного режима растеризации
+
+    Args:
+        mode (str): 'text' - символ на точку, 'braille' - точки Брайля 2x4 на символ,
+            'halfblock' - полублоки 1x2 на символ с цветом символа и фона
+        width (int): Ширина экрана в символах
+        height (int): Высота экрана в символах
+        shading_chars (str): Набор символов для режима 'text'
+        palette (HuePalette): Таблица цветов (None - без цвета)
+
+    Returns:
+        Framebuffer: Кадровый буфер
+    """
+    sequences = palette.sequences if palette is not None else ()
+    if mode == 'text':
+        return Framebuffer(width, height, shading_chars, sequences)
+    if mode == 'braille':
+        return Framebuffer.braille(width, height, sequences)
+    if mode == 'halfblock':
+        backgrounds = palette.background_sequences if palette is not None else ()
+        return Framebuffer.half_blocks(width, height, sequences, backgrounds)
+    raise ValueError(f"Неизвестный режим растеризации: {mode} (доступны {', '.join(RENDER_MODES)})")
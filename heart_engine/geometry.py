@@ -0,0 +1,206 @@
+"""
+Генерация облака точек 3D сердца целыми массивами
+"""
+import numpy as np  # Математические операции и работа с массивами
+
+# Версия генератора: меняется при любом изменении получаемых точек
+GENERATOR_VERSION = 1
+
+# Тип координат облака в движке: облако хранится структурой массивов (3, N) -
+# непрерывные строки x, y и z в float32 (12 байт на точку вместо 24 у (N, 3) float64)
+POINT_DTYPE = np.float32
+
+# Порядок точек в облаке движка (см. pack_points): зерно перестановки и
+# число ячеек сетки по каждой оси, по которой точки расслаиваются
+POINT_ORDER_SEED = 0
+POINT_ORDER_GRID = 64
+
+
+def heart_contour(t, flip_y=False):
+    """
+    Параметрическое уравнение сердца
+
+    Args:
+        t (np.array): Параметр кривой (0..2pi)
+        flip_y (bool): Перевернуть сердце по вертикали
+
+    Returns:
+        tuple: Координаты x и y точек контура
+    """
+    x = 16 * np.sin(t)**3
+    y = 13 * np.cos(t) - 5 * np.cos(2*t) - 2 * np.cos(3*t) - np.cos(4*t)
+    return x, (-y if flip_y else y)
+
+
+def generate_heart_points(scale=5, num_points=1000, num_layers=30, layer_exponent=1.0,
+                          layer_spacing=2.0, layer_direction=-1, mirrored=False,
+                          interior_points=0, interior_radius=0.8, interior_depth=15,
+                          core_points=0, core_radius=0.5, core_depth=10,
+                          flip_y=False, seed=None):
+    """
+    Облако точек сердца: стопка сужающихся слоев контура и случайные точки внутри
+
+    Слои строятся одним broadcast-выражением (слой x точка контура), а случайные
+    точки - одной выборкой из numpy.random.Generator, поэтому при одинаковом seed
+    облако всегда одинаковое. Порядок точек такой же, как в исходных скриптах:
+    слои, внутренние точки, ядро, зеркальные слои.
+
+    Args:
+        scale (float): Масштаб сердца
+        num_points (int): Количество точек на контуре слоя
+        num_layers (int): Количество слоев
+        layer_exponent (float): Показатель сужения слоя: factor = 1 - (i / num_layers) ** layer_exponent
+        layer_spacing (float): Делитель глубины слоя: z = layer_direction * i / layer_spacing
+        layer_direction (int): Направление стопки слоев по оси Z (-1 или 1)
+        mirrored (bool): Добавить после внутренних точек такую же стопку с другой стороны (Heart-17)
+        interior_points (int): Количество случайных точек внутри объема
+        interior_radius (float): Наибольший относительный радиус внутренних точек
+        interior_depth (float): Глубина объема внутренних точек по оси Z
+        core_points (int): Количество точек плоского ядра (Heart-14)
+        core_radius (float): Наибольший относительный радиус точек ядра
+        core_depth (float): Ядро равномерно занимает z от -core_depth до core_depth
+        flip_y (bool): Перевернуть сердце по вертикали
+        seed (int | np.random.Generator): Зерно или генератор случайных чисел (None - случайное)
+
+    Returns:
+        np.array: Массив точек (N, 3)
+    """
+    rng = np.random.default_rng(seed)
+    x, y = heart_contour(np.linspace(0, 2*np.pi, num_points), flip_y)
+
+    # Все слои сразу: строка - слой, столбец - точка контура
+    layers = np.arange(num_layers)
+    factor = (1 - (layers / num_layers)**layer_exponent)[:, np.newaxis]
+    layer_x = (factor * x).ravel()
+    layer_y = (factor * y).ravel()
+    layer_z = np.repeat(layer_direction * (layers / layer_spacing), num_points)
+    parts = [np.column_stack((layer_x, layer_y, layer_z))]
+
+    if interior_points:
+        r = rng.random(interior_points) * interior_radius
+        theta = rng.random(interior_points) * 2 * np.pi
+        phi = rng.random(interior_points) * np.pi
+        inner_x, inner_y = heart_contour(theta, flip_y)
+        parts.append(np.column_stack((r * inner_x * np.sin(phi),
+                                      r * inner_y * np.sin(phi),
+                                      r * interior_depth * np.cos(phi))))
+
+    if core_points:
+        r = rng.random(core_points) * core_radius
+        theta = rng.random(core_points) * 2 * np.pi
+        core_x, core_y = heart_contour(theta, flip_y)
+        parts.append(np.column_stack((r * core_x, r * core_y,
+                                      rng.random(core_points) * 2 * core_depth - core_depth)))
+
+    if mirrored:
+        parts.append(np.column_stack((layer_x, layer_y, -layer_z)))
+
+    return scale * np.concatenate(parts)
+
+
+def stratified_order(points, grid=POINT_ORDER_GRID, seed=POINT_ORDER_SEED):
+    """
+    Стабильный расслоенный порядок точек облака
+
+    Облако делится сеткой grid x grid x grid по своим границам. Точки идут
+    кругами: сначала по одной случайной точке из каждой занятой ячейки, затем
+    по второй и так далее, внутри круга - в случайном порядке. Поэтому даже
+    небольшой префикс облака задевает все его части, а не только плотные.
+
+    Args:
+        points (np.array): Массив точек (N, 3)
+        grid (int): Число ячеек сетки по каждой оси
+        seed (int): Зерно случайного порядка
+
+    Returns:
+        np.array: Индексы точек в новом порядке
+    """
+    count = len(points)
+    order = np.random.default_rng(seed).permutation(count)
+    if not count:
+        return order
+    shuffled = points[order]
+    low = shuffled.min(axis=0)
+    span = shuffled.max(axis=0) - low
+    span[span == 0] = 1.0
+    voxels = np.minimum(((shuffled - low) / span * grid).astype(np.int64), grid - 1)
+    cells = (voxels[:, 0] * grid + voxels[:, 1]) * grid + voxels[:, 2]
+    # Номер точки внутри своей ячейки (в случайном порядке) - номер круга
+    by_cell = np.argsort(cells, kind='stable')
+    sorted_cells = cells[by_cell]
+    starts = np.flatnonzero(np.r_[True, sorted_cells[1:] != sorted_cells[:-1]])
+    rounds = np.empty(count, dtype=np.int64)
+    rounds[by_cell] = np.arange(count) - np.repeat(starts, np.diff(np.r_[starts, count]))
+    return order[np.argsort(rounds, kind='stable')]
+
+
+def pack_points(points, dtype=POINT_DTYPE, shuffle=True):
+    """
+    Облако (N, 3) в структуру массивов движка: непрерывные строки x, y и z
+
+    Точки переставляются в стабильном расслоенном порядке (см. stratified_order),
+    поэтому любые первые n точек равномерно покрывают все облако: на этом
+    построены уровни детализации (heart_engine.lod).
+
+    Args:
+        points (np.array): Массив точек (N, 3)
+        dtype (np.dtype): Тип координат (по умолчанию POINT_DTYPE)
+        shuffle (bool): Переставить точки в расслоенном порядке
+
+    Returns:
+        np.array: Массив (3, N): points[0] - x, points[1] - y, points[2] - z
+    """
+    points = np.asarray(points)
+    if shuffle:
+        points = points[stratified_order(points)]
+    packed = np.empty((3, len(points)), dtype=dtype)
+    packed[...] = points.T
+    return packed
+
+
+def heart_outline(scale=10, num_points=100):
+    """
+    Плоский контур сердца в плоскости z = 0 (Heart-1)
+
+    Args:
+        scale (float): Масштаб сердца
+        num_points (int): Количество точек контура
+
+    Returns:
+        np.array: Массив точек (N, 3)
+    """
+    x, y = heart_contour(np.linspace(0, 2*np.pi, num_points))
+    return scale * np.column_stack((x, y, np.zeros_like(x)))
+
+
+def heart_sphere(scale=15, u_steps=100, v_steps=50, noise=0.0, seed=None):
+    """
+    Сфера, сплющенная к полюсам и скошенная по оси Y (Heart-2, Heart-3, Heart-4)
+
+    Args:
+        scale (float): Радиус исходной сферы
+        u_steps (int): Количество шагов азимутального угла
+        v_steps (int): Количество шагов полярного угла
+        noise (float): Стандартное отклонение случайного сдвига x и y (0 - без шума)
+        seed (int | np.random.Generator): Зерно или генератор для шума (None - случайное)
+
+    Returns:
+        np.array: Массив точек (u_steps * v_steps, 3)
+    """
+    u = np.linspace(0, 2*np.pi, u_steps)[:, np.newaxis]  # Азимутальный угол
+    v = np.linspace(0, np.pi, v_steps)[np.newaxis, :]    # Полярный угол
+    x = scale * np.cos(u) * np.sin(v)
+    y = scale * np.sin(u) * np.sin(v)
+    z = scale * np.cos(v) * np.ones_like(u)
+
+    # Сужение к полюсам и наклон создают форму сердца
+    squeeze = 1 - 0.8 * np.abs(z) / scale
+    x = x * squeeze
+    y = y * squeeze - 0.3 * z
+    z = z * 0.8
+
+    if noise:
+        rng = np.random.default_rng(seed)
+        x = x + rng.normal(0, noise, x.shape)
+        y = y + rng.normal(0, noise, y.shape)
+    return np.column_stack((x.ravel(), y.ravel(), z.ravel()))
@@ -0,0 +1,104 @@
+"""
+Уровни детализации облака точек по размеру экрана
+
+Облако движка хранится в стабильном расслоенном порядке (geometry.pack_points),
+поэтому любые первые n точек равномерно покрывают все облако. Уровни
+детализации - такие префиксы, вдвое меньше друг друга: они не копируют
+облако, а только ссылаются на его начало.
+"""
+import numpy as np  # Математические операции и работа с массивами
+
+
+class LevelOfDetail:
+    """
+    Выбор наименьшего уровня детализации, который еще полностью покрывает экран
+
+    Для каждого размера экрана (в точках растеризации, то есть с учетом
+    режима Брайля и полублоков) уровни проверяются на нескольких пробных
+    ориентациях сердца: уровень подходит, если занимает не меньше coverage
+    от числа ячеек, занятых всем облаком. Выбор запоминается, поэтому при
+    обычной работе это один поиск в словаре на кадр, а после изменения
+    размера терминала уровень подбирается заново.
+
+    Использование:
+        lod = LevelOfDetail(heart_points, probes=[model_matrix((0, 0.5, 0))])
+        points = lod.select(framebuffer.resolution)
+    """
+
+    def __init__(self, points, probes=(), min_points=2000, factor=2, coverage=0.995):
+        """
+        Args:
+            points (np.array): Облако (3, N) в порядке geometry.pack_points
+            probes (list): Пробные матрицы кадра 3x4 (см. transform.model_matrix);
+                пустой список - одна ориентация без поворота
+            min_points (int): Наименьший уровень детализации
+            factor (int): Во сколько раз соседние уровни отличаются числом точек
+            coverage (float): Доля ячеек полного облака, которую должен занять уровень
+        """
+        self.points = points
+        self.probes = list(probes) or [np.hstack((np.eye(3), np.zeros((3, 1))))]
+        self.coverage = coverage
+        count = points.shape[1]
+        sizes = [count]
+        while sizes[-1] // factor >= min_points:
+            sizes.append(sizes[-1] // factor)
+        self.sizes = sizes[::-1]  # От меньшего уровня к полному облаку
+        # Уровни - префиксы облака (представления без копирования)
+        self.levels = {size: points[:, :size] for size in self.sizes}
+        self._choices = {}  # (разрешение, доли экрана) -> число точек
+        self.current = count  # Число точек последнего выбранного уровня
+
+    def select(self, resolution, extent=(2, 2), center=(2, 2)):
+        """
+        Уровень детализации для размера экрана
+
+        Args:
+            resolution (tuple): Размер экрана в точках растеризации (ширина, высота)
+            extent (tuple): Делители полуразмаха проекции по x и y
+            center (tuple): Делители центра экрана по x и y
+
+        Returns:
+            np.array: Облако уровня (3, n) - префикс исходного облака
+        """
+        key = (tuple(resolution), tuple(extent), tuple(center))
+        size = self._choices.get(key)
+        if size is None:
+            size = self._choices[key] = self._saturating_size(resolution, extent, center)
+        self.current = size
+        return self.levels[size]
+
+    def summary(self):
+        """
+        Строка состояния: точки выбранного уровня из всего облака
+        """
+        return f"Points: {self.current}/{self.points.shape[1]}"
+
+    def _saturating_size(self, resolution, extent, center):
+        """
+        Наименьший уровень, покрывающий не меньше coverage ячеек полного облака на всех пробах
+        """
+        full = [self._covered_cells(self.points, matrix, resolution, extent, center) for matrix in self.probes]
+        for size in self.sizes[:-1]:
+            level = self.levels[size]
+            if all(self._covered_cells(level, matrix, resolution, extent, center) >= self.coverage * cells
+                   for matrix, cells in zip(self.probes, full)):
+                return size
+        return self.sizes[-1]
+
+    @staticmethod
+    def _covered_cells(points, matrix, resolution, extent, center):
+        """
+        Количество ячеек экрана, в которые попадает хотя бы одна точка
+        """
+        width, height = resolution
+        frame = np.matmul(matrix[:, :3].astype(np.float32), points) + matrix[:, 3:].astype(np.float32)
+        cells = np.zeros(width * height, dtype=bool)
+        screen = []
+        for axis, size in ((0, width), (1, height)):
+            coordinate = frame[axis]
+            peak = np.max(np.abs(coordinate)) or 1.0
+            screen.append((coordinate / peak * (size // extent[axis]) + size // center[axis]).astype(int))
+        x, y = screen
+        inside = (0 <= x) & (x < width) & (0 <= y) & (y < height)
+        cells[y[inside] * width + x[inside]] = True
+        return int(np.count_nonzero(cells))
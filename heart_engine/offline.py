@@ -0,0 +1,246 @@
+"""
+Офлайн-рендер: кадры анимации считаются пулом процессов быстрее реального времени
+
+Скрипт анимации должен определять вариант PRESET (heart_engine.preset.HeartPreset):
+кадр варианта зависит только от номера шага, поэтому части анимации можно
+рисовать в разных процессах.
+
+Запуск:
+    python -m heart_engine.offline Heart-Terminal/Heart-13.py --frames 30000 --output heart.ans
+    python -m heart_engine.offline Heart-Terminal/Heart-12.py --mode braille --processes 32
+    python -m heart_engine.offline Heart-Terminal/Heart-13.py --frames 9000 --output heart.cast
+"""
+import argparse  # Разбор аргументов командной строки
+import importlib.util  # Загрузка скрипта анимации как модуля
+import multiprocessing  # Пул процессов
+import os  # Пути к файлам
+import sys  # Системные операции
+import time  # Замер скорости
+from collections import deque  # Очередь заданий в работе
+from multiprocessing import shared_memory  # Общая память процессов
+
+import numpy as np  # Математические операции и работа с массивами
+
+from .asciicast import AsciicastRecorder
+from .output import DiffWriter
+
+# Состояние процесса-исполнителя (заполняется в _init_worker)
+_worker = {}
+
+
+def load_script(path):
+    """
+    Загрузка варианта анимации из скрипта (анимация не запускается)
+
+    Returns:
+        HeartPreset: Вариант анимации PRESET из скрипта
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not hasattr(module, 'PRESET'):
+        raise ValueError(f"{path}: нужен вариант анимации PRESET (heart_engine.preset.HeartPreset)")
+    return module.PRESET
+
+
+def _frame_layout(framebuffer):
+    """
+    Расположение плоскостей кадрового буфера в байтовой записи кадра
+
+    Returns:
+        list: Границы (начало, конец) каждой плоскости в записи
+    """
+    bounds = []
+    offset = 0
+    for plane in framebuffer.planes:
+        bounds.append((offset, offset + plane.nbytes))
+        offset += plane.nbytes
+    return bounds
+
+
+def _init_worker(script, mode, size, points_name, points_shape, frames_name, frames_shape):
+    """
+    Инициализация исполнителя: скрипт, облако точек и кадровые слоты из общей памяти
+    """
+    preset = load_script(script)
+    # Исполнители пула делят resource_tracker с родителем, а удаляет память только родитель
+    points_memory = shared_memory.SharedMemory(name=points_name)
+    frames_memory = shared_memory.SharedMemory(name=frames_name)
+    palette = preset.create_palette()
+    framebuffer = preset.create_framebuffer(mode, palette, size)
+    _worker.update(
+        preset=preset,
+        palette=palette,
+        framebuffer=framebuffer,
+        layout=_frame_layout(framebuffer),
+        # Ссылки на общую память держим, пока живет процесс
+        memories=(points_memory, frames_memory),
+        points=np.ndarray(points_shape, dtype=np.float32, buffer=points_memory.buf),
+        frames=np.ndarray(frames_shape, dtype=np.uint8, buffer=frames_memory.buf),
+    )
+
+
+def _render_chunk(start, stop, slot, first, encode, blank):
+    """
+    Отрисовка шагов start..stop-1 в кадровый слот slot общей памяти
+
+    Если кадры кодируются, разница считается относительно прошлого шага,
+    поэтому сначала без вывода рисуется шаг start-1 (кроме самого первого
+    шага first) - байты на стыках частей совпадают с последовательным выводом.
+
+    Returns:
+        list: Байты кадров (пустой список, если encode=False)
+    """
+    preset = _worker['preset']
+    framebuffer = _worker['framebuffer']
+    palette = _worker['palette']
+    points = _worker['points']
+    records = _worker['frames'][slot]
+
+    writer = None
+    if encode:
+        writer = DiffWriter(blank=blank)
+        if start > first:
+            preset.draw_frame(start - 1, points, framebuffer, palette)
+            writer.encode(framebuffer)
+
+    encoded = []
+    for index, step in enumerate(range(start, stop)):
+        preset.draw_frame(step, points, framebuffer, palette)
+        record = records[index]
+        for plane, (begin, end) in zip(framebuffer.planes, _worker['layout']):
+            record[begin:end] = plane.view(np.uint8).reshape(-1)
+        if writer is not None:
+            encoded.append(writer.encode(framebuffer)[0])
+    return encoded
+
+
+def render_offline(script, steps, mode='text', size=None, processes=None, chunk=64, encode=True, blank=True):
+    """
+    Отрисовка кадров анимации пулом процессов
+
+    Облако точек один раз кладется в multiprocessing.shared_memory, и все
+    исполнители читают его оттуда, а не получают копию через pickle.
+    Исполнители получают части диапазона шагов и растеризуют их в кадровые
+    слоты общей памяти (байтовые записи плоскостей кадрового буфера), а при
+    encode=True еще и кодируют разницу кадров. Родительский процесс собирает
+    части строго по порядку; слотов вдвое больше, чем процессов, поэтому
+    исполнители не ждут, пока родитель разбирает готовые части.
+
+    Args:
+        script (str): Путь к скрипту анимации
+        steps (range): Шаги симуляции для отрисовки (подряд, с шагом 1)
+        mode (str): Режим растеризации: 'text', 'braille' или 'halfblock'
+        size (tuple): Размер экрана в символах (None - screen_size варианта)
+        processes (int): Количество процессов (None - по числу ядер)
+        chunk (int): Кадров в одном задании
+        encode (bool): Кодировать кадры в байты терминала (DiffWriter)
+        blank (bool): Экран перед первым кадром пуст (как DiffWriter(blank=True))
+
+    Yields:
+        tuple: Номер шага, кадровый буфер с этим кадром (перезаписывается
+            следующим кадром) и байты кадра (None, если encode=False)
+    """
+    if steps.step != 1:
+        raise ValueError("Шаги должны идти подряд (range с шагом 1)")
+    processes = processes or os.cpu_count() or 1
+    preset = load_script(script)
+    size = tuple(size or preset.screen_size)
+    palette = preset.create_palette()
+    framebuffer = preset.create_framebuffer(mode, palette, size)
+    layout = _frame_layout(framebuffer)
+    record_size = layout[-1][1]
+
+    points = np.ascontiguousarray(preset.load_points(), dtype=np.float32)
+    slots = 2 * processes
+    points_memory = shared_memory.SharedMemory(create=True, size=max(points.nbytes, 1))
+    frames_memory = shared_memory.SharedMemory(create=True, size=slots * chunk * record_size)
+    pool = frames = None
+    try:
+        np.ndarray(points.shape, dtype=np.float32, buffer=points_memory.buf)[:] = points
+        frames_shape = (slots, chunk, record_size)
+        frames = np.ndarray(frames_shape, dtype=np.uint8, buffer=frames_memory.buf)
+        pool = multiprocessing.Pool(processes, initializer=_init_worker,
+                                    initargs=(os.path.abspath(script), mode, size, points_memory.name,
+                                              points.shape, frames_memory.name, frames_shape))
+
+        starts = iter(range(steps.start, steps.stop, chunk))
+        pending = deque()  # (начало, конец, слот, результат) в порядке шагов
+        free_slots = deque(range(slots))
+
+        def submit():
+            start = next(starts, None)
+            if start is None:
+                return
+            stop = min(start + chunk, steps.stop)
+            slot = free_slots.popleft()
+            result = pool.apply_async(_render_chunk, (start, stop, slot, steps.start, encode, blank))
+            pending.append((start, stop, slot, result))
+
+        for _ in range(slots):
+            submit()
+
+        while pending:
+            start, stop, slot, result = pending.popleft()
+            encoded = result.get()
+            for index, step in enumerate(range(start, stop)):
+                record = frames[slot, index]
+                for plane, (begin, end) in zip(framebuffer.planes, layout):
+                    plane.view(np.uint8).reshape(-1)[:] = record[begin:end]
+                yield step, framebuffer, (encoded[index] if encode else None)
+            free_slots.append(slot)
+            submit()
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        # Представление общей памяти нужно отпустить до close()
+        frames = None
+        for memory in (points_memory, frames_memory):
+            memory.close()
+            memory.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Офлайн-рендер анимации сердца пулом процессов")
+    parser.add_argument('script', help="Скрипт анимации (например, Heart-Terminal/Heart-13.py)")
+    parser.add_argument('--frames', type=int, default=3000, help="Количество кадров")
+    parser.add_argument('--start', type=int, default=0, help="Первый шаг симуляции")
+    parser.add_argument('--mode', default='text', help="Режим растеризации: text, braille или halfblock")
+    parser.add_argument('--processes', type=int, default=None, help="Количество процессов (по умолчанию по числу ядер)")
+    parser.add_argument('--chunk', type=int, default=64, help="Кадров в одном задании")
+    parser.add_argument('--output', help="Файл для байтов кадров (.cast - запись asciicast v2; без него кадры только считаются)")
+    args = parser.parse_args()
+
+    preset = load_script(args.script)
+    fps = preset.fps
+    output = None
+    if args.output and args.output.endswith('.cast'):
+        # Время кадра в записи - номер шага, деленный на частоту кадров скрипта
+        width, height = preset.screen_size
+        output = AsciicastRecorder(args.output, width * preset.cell_columns(args.mode), height + 1, title=os.path.basename(args.script))
+    elif args.output:
+        output = open(args.output, 'wb')
+    total_bytes = 0
+    started = time.perf_counter()
+    try:
+        for step, framebuffer, data in render_offline(args.script, range(args.start, args.start + args.frames),
+                                                      mode=args.mode, processes=args.processes, chunk=args.chunk):
+            total_bytes += len(data)
+            if isinstance(output, AsciicastRecorder):
+                output.write(data, timestamp=(step - args.start) / fps)
+            elif output is not None:
+                output.write(data)
+    finally:
+        if output is not None:
+            output.close()
+    elapsed = time.perf_counter() - started
+
+    print(f"Кадров: {args.frames} за {elapsed:.2f} с ({args.frames / elapsed:.1f} кадров/с, "
+          f"в {args.frames / fps / elapsed:.1f} раз быстрее реального времени), "
+          f"{total_bytes / args.frames:.0f} байт/кадр", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
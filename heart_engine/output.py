@@ -0,0 +1,187 @@
+"""
+Вывод закодированных кадров в терминал
+"""
+import sys  # Системные операции
+
+import numpy as np  # Математические операции и работа с массивами
+
+
+def write_frame(data, stream=None):
+    """
+    Запись байтового кадра в терминал
+
+    Args:
+        data (bytes): Закодированный кадр вместе с управляющими последовательностями
+        stream: Текстовый поток вывода (по умолчанию sys.stdout)
+
+    Returns:
+        int: Количество записанных байт
+    """
+    stream = stream or sys.stdout
+    # Сначала сбрасываем текстовый буфер, чтобы не нарушить порядок вывода
+    stream.flush()
+    stream.buffer.write(data)
+    stream.buffer.flush()
+    return len(data)
+
+
+class DiffWriter:
+    """
+    Вывод кадров с перерисовкой только изменившихся ячеек
+
+    Хранит индексы ячеек последнего выведенного кадра и отправляет в терминал
+    только изменившиеся участки строк с позиционированием курсора. Если такой
+    вывод получается не меньше полного кадра, кадр перерисовывается целиком.
+    """
+
+    def __init__(self, stream=None, merge_gap=4, blank=False):
+        """
+        Args:
+            stream: Текстовый поток вывода (по умолчанию sys.stdout)
+            merge_gap (int): Участки, разделенные меньшим числом неизменных ячеек,
+                выводятся одним куском - это дешевле, чем сдвиг курсора
+            blank (bool): Экран под первым кадром уже очищен (\033[2J при запуске),
+                пустые ячейки первого кадра можно пропустить
+        """
+        self.stream = stream
+        self.merge_gap = merge_gap
+        self._blank = blank
+        self._previous = None
+        self._framebuffer = None
+        self._top = None
+
+        # Статистика вывода
+        self.last_bytes = 0
+        self.total_bytes = 0
+        self.frames = 0
+        self.full_redraws = 0
+
+    def invalidate(self, blank=False):
+        """
+        Следующий кадр будет выведен целиком
+
+        Args:
+            blank (bool): Экран только что очищен, выводить нужно только непустые ячейки
+        """
+        self._previous = None
+        self._blank = blank
+
+    def encode(self, framebuffer, top=0):
+        """
+        Кодирование кадра без вывода: разница с прошлым кадром или полный кадр
+
+        Кадр запоминается как выведенный, поэтому результат нужно передать в send.
+
+        Выбирается более короткий вывод. Полный кадр кодируется для сравнения,
+        только если разница длиннее его нижней границы (glyph_bytes - байты
+        непустых символов): иначе разница заведомо не длиннее. Поэтому
+        разбросанные короткие участки, у которых перемещения курсора дороже
+        самих символов, выводятся полным кадром при любой доле изменившихся
+        ячеек, а обычный кадр не кодируется дважды.
+
+        Args:
+            framebuffer (Framebuffer): Кадровый буфер с готовым кадром
+            top (int): Номер строки экрана (с 0), с которой начинается кадр
+
+        Returns:
+            tuple: Байты кадра и признак полной перерисовки
+                (такие байты можно вывести поверх любого кадра)
+        """
+        ids = framebuffer.cell_ids()
+        if (self._previous is not None and self._framebuffer is framebuffer
+                and self._top == top and self._previous.shape == ids.shape):
+            previous = self._previous
+        elif self._blank:
+            previous = np.zeros_like(ids)
+        else:
+            previous = None
+
+        data = full = None
+        if previous is not None:
+            data = self._encode_diff(framebuffer, ids, previous, top)
+            # Полный кадр не короче своих символов: сравнение нужно только с более длинной разницей
+            if len(data) > framebuffer.glyph_bytes():
+                full = framebuffer.encode(top)
+                if len(full) > len(data):
+                    full = None
+        else:
+            full = framebuffer.encode(top)
+
+        if full is not None:
+            data = full
+            self.full_redraws += 1
+
+        self._previous = ids
+        self._framebuffer = framebuffer
+        self._top = top
+        self._blank = False
+        return data, full is not None
+
+    def send(self, data, framebuffer, footer=b'', top=0):
+        """
+        Вывод закодированного кадра и строк под ним
+
+        Args:
+            data (bytes): Байты кадра (из encode или из кэша)
+            framebuffer (Framebuffer): Кадровый буфер, для которого закодирован кадр
+            footer (bytes): Строки под кадром (статус, текст), выводятся всегда
+            top (int): Номер строки экрана (с 0), с которой начинается кадр
+
+        Returns:
+            int: Количество записанных байт
+        """
+        data += b'\033[%d;1H' % (top + framebuffer.height + 1) + footer
+        self.last_bytes = write_frame(data, self.stream)
+        self.total_bytes += self.last_bytes
+        self.frames += 1
+        return self.last_bytes
+
+    def write(self, framebuffer, footer=b'', top=0):
+        """
+        Вывод кадра
+
+        Args:
+            framebuffer (Framebuffer): Кадровый буфер с готовым кадром
+            footer (bytes): Строки под кадром (статус, текст), выводятся всегда
+            top (int): Номер строки экрана (с 0), с которой начинается кадр
+
+        Returns:
+            int: Количество записанных байт
+        """
+        data, _ = self.encode(framebuffer, top)
+        return self.send(data, framebuffer, footer, top)
+
+    def replay(self, data, framebuffer, footer=b'', top=0):
+        """
+        Вывод готовых байт кадра (например, из кэша кадров)
+
+        Содержимое кадра писателю неизвестно, поэтому следующий кадр
+        из буфера будет выведен целиком.
+
+        Returns:
+            int: Количество записанных байт
+        """
+        self.invalidate()
+        return self.send(data, framebuffer, footer, top)
+
+    def _encode_diff(self, framebuffer, ids, previous, top):
+        """
+        Кодирование изменившихся участков строк
+
+        Returns:
+            bytes: Байты для вывода
+        """
+        # Границы участков изменившихся ячеек в каждой строке
+        changed = np.zeros((framebuffer.height, framebuffer.width + 2), dtype=np.int8)
+        changed[:, 1:-1] = ids != previous
+        edges = np.diff(changed, axis=1)
+        rows, starts = np.nonzero(edges == 1)
+        _, ends = np.nonzero(edges == -1)
+        if len(rows) == 0:
+            return b''
+
+        # Объединяем близкие участки одной строки
+        joined = (rows[1:] == rows[:-1]) & (starts[1:] - ends[:-1] < self.merge_gap)
+        first = np.concatenate(([True], ~joined))
+        last = np.concatenate((~joined, [True]))
+        return framebuffer.encode_runs(rows[first], starts[first], ends[last], top)
@@ -0,0 +1,227 @@
+"""
+Конвейер кадров: подготовка следующего кадра в фоновом потоке во время вывода текущего
+"""
+import queue  # Ограниченная очередь готовых кадров
+import threading  # Фоновый поток подготовки кадров
+import time  # Таймер perf_counter
+from collections import deque  # История задержек для статистики
+
+import numpy as np  # Перцентили задержек
+
+
+class FramePipeline:
+    """
+    Производитель и потребитель кадров
+
+    Фоновый поток вызывает render(step) для шагов симуляции по порядку и кладет
+    результат в очередь глубиной depth, а главный поток забирает готовые кадры
+    и пишет их в терминал. Пока терминал принимает кадр N, NumPy считает
+    кадр N+1 (тяжелые операции NumPy отпускают GIL). Кадры выводятся строго
+    в порядке подготовки, поэтому render может кодировать разницу с прошлым
+    кадром (DiffWriter.encode), а главный поток - только выводить (DiffWriter.send).
+
+    depth=0 отключает поток: render вызывается прямо в get(), как в обычном
+    последовательном цикле, а счетчики остаются сравнимыми.
+
+    Использование в цикле анимации:
+        pipeline = FramePipeline(render, clock=lambda: scheduler.frame)
+        with pipeline:
+            while True:
+                step, frame = pipeline.get()
+                writer.send(frame, framebuffer)
+                pipeline.written()
+                scheduler.wait()
+    """
+
+    def __init__(self, render, depth=1, clock=None, history=120):
+        """
+        Args:
+            render (callable): Подготовка кадра по номеру шага: render(step) -> кадр
+            depth (int): Сколько готовых кадров может ждать вывода (0 - без потока)
+            clock (callable): Текущий шаг симуляции (например, scheduler.frame);
+                если вывод отстал и шаги пропущены, следующий кадр готовится для
+                этого шага, а не для следующего по порядку
+            history (int): Сколько последних кадров учитывать в статистике
+        """
+        self.render = render
+        self.depth = depth
+        self.clock = clock
+
+        self._queue = queue.Queue(maxsize=max(depth, 1))
+        self._stop = threading.Event()
+        self._thread = None
+        self._next_step = 0
+
+        # Занятость производителя для расчета перекрытия: время завершенных
+        # кадров и начало текущего (None - поток ждет)
+        self._busy_lock = threading.Lock()
+        self._busy_total = 0.0
+        self._busy_since = None
+
+        # Статистика
+        self.frames = 0  # Выведенных кадров
+        self._render_times = deque(maxlen=history)
+        self._write_times = deque(maxlen=history)
+        self._latencies = deque(maxlen=history)
+        self._overlaps = deque(maxlen=history)  # Время вывода, перекрытое подготовкой
+        self._stalls = deque(maxlen=history)  # Ожидание главного потока в get()
+        self._written = deque(maxlen=history)  # Моменты окончания вывода
+        self._current = None  # Начало подготовки, начало вывода и занятость производителя на начало вывода
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    def start(self):
+        """
+        Запуск фонового потока подготовки кадров
+        """
+        if self.depth > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._produce, name='frame-producer', daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """
+        Остановка фонового потока (готовые, но не выведенные кадры отбрасываются)
+        """
+        self._stop.set()
+        if self._thread is not None:
+            # Освобождаем место в очереди, чтобы поток не завис на put
+            while self._thread.is_alive():
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+                self._thread.join(timeout=0.01)
+            self._thread = None
+
+    def get(self):
+        """
+        Следующий готовый кадр (ждет, если производитель еще не успел)
+
+        Returns:
+            tuple: Номер шага симуляции и результат render(step)
+        """
+        waited = time.perf_counter()
+        if self._thread is None:
+            step, frame, started = self._render_next()
+        else:
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                raise item
+            step, frame, started = item
+        now = time.perf_counter()
+        self._stalls.append(now - waited)
+        self._current = (started, now, self._busy_at(now))
+        return step, frame
+
+    def written(self):
+        """
+        Отметка окончания вывода кадра, полученного из get()
+        """
+        if self._current is None:
+            return
+        now = time.perf_counter()
+        started, write_start, busy_start = self._current
+        self._current = None
+        write_time = now - write_start
+        self.frames += 1
+        self._write_times.append(write_time)
+        self._latencies.append(now - started)
+        self._written.append(now)
+        self._overlaps.append(min(write_time, self._busy_at(now) - busy_start))
+
+    def stats(self):
+        """
+        Статистика конвейера по последним кадрам
+
+        Returns:
+            dict: fps - выведенных кадров в секунду, render_ms и write_ms - среднее
+                время подготовки и вывода кадра, latency_p50/latency_p95 - от начала
+                подготовки кадра до конца его вывода (мс), stall_ms - среднее ожидание
+                главного потока в get(), overlap - доля времени вывода, во время
+                которой фоновый поток считал следующий кадр (0..1)
+        """
+        result = {
+            'fps': 0.0,
+            'render_ms': 0.0,
+            'write_ms': 0.0,
+            'latency_p50': 0.0,
+            'latency_p95': 0.0,
+            'stall_ms': 0.0,
+            'overlap': 0.0,
+        }
+        if len(self._written) > 1:
+            span = self._written[-1] - self._written[0]
+            result['fps'] = (len(self._written) - 1) / span if span > 0 else 0.0
+        if self._latencies:
+            # Время подготовки дописывает фоновый поток, поэтому берем копию
+            render_times = list(self._render_times)
+            result['render_ms'] = float(np.mean(render_times)) * 1000 if render_times else 0.0
+            result['write_ms'] = float(np.mean(self._write_times)) * 1000
+            result['latency_p50'], result['latency_p95'] = (float(value) * 1000 for value in np.percentile(self._latencies, [50, 95]))
+            result['stall_ms'] = float(np.mean(self._stalls)) * 1000
+        total = sum(self._write_times)
+        if total > 0:
+            result['overlap'] = sum(self._overlaps) / total
+        return result
+
+    def summary(self):
+        """
+        Короткая строка статистики для строки состояния
+        """
+        stats = self.stats()
+        return f"Latency: {stats['latency_p95']:.1f} ms | Overlap: {stats['overlap']:.0%}"
+
+    def _render_next(self):
+        """
+        Подготовка кадра для следующего шага симуляции
+        """
+        step = self._next_step
+        if self.clock is not None:
+            step = max(step, self.clock())
+        self._next_step = step + 1
+
+        started = time.perf_counter()
+        with self._busy_lock:
+            self._busy_since = started
+        try:
+            frame = self.render(step)
+        finally:
+            finished = time.perf_counter()
+            with self._busy_lock:
+                self._busy_total += finished - started
+                self._busy_since = None
+        self._render_times.append(finished - started)
+        return step, frame, started
+
+    def _produce(self):
+        """
+        Цикл фонового потока: подготовка кадров, пока есть место в очереди
+        """
+        try:
+            while not self._stop.is_set():
+                item = self._render_next()
+                while not self._stop.is_set():
+                    try:
+                        self._queue.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        pass
+        except BaseException as error:
+            # Ошибка передается главному потоку и поднимается в get()
+            self._queue.put(error)
+
+    def _busy_at(self, moment):
+        """
+        Суммарное время работы производителя к моменту moment
+        """
+        with self._busy_lock:
+            busy = self._busy_total
+            if self._busy_since is not None and moment > self._busy_since:
+                busy += moment - self._busy_since
+            return busy
@@ -0,0 +1,186 @@
+"""
+Кэш облаков точек на диске: файлы .npy, открываемые с отображением в память
+"""
+import hashlib  # Ключ кэша по параметрам генерации
+import inspect  # Параметры генератора со значениями по умолчанию
+import os  # Пути и атомарная замена файлов
+import re  # Имя файла из названия варианта
+import tempfile  # Временный файл для атомарной записи
+
+import numpy as np  # Чтение и запись .npy
+
+from .geometry import GENERATOR_VERSION, POINT_DTYPE, pack_points
+
+
+def default_cache_dir():
+    """
+    Каталог кэша: HEART_CACHE_DIR, иначе $XDG_CACHE_HOME/heart или ~/.cache/heart
+    """
+    directory = os.environ.get('HEART_CACHE_DIR')
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'heart')
+
+
+class PointCloudCache:
+    """
+    Кэш результатов create_heart_points в каталоге на диске
+
+    Облако хранится в раскладке движка: структура массивов (3, N) float32
+    в стабильном расслоенном порядке (см. geometry.pack_points), поэтому файл
+    вдвое меньше и отображается в память без преобразования.
+
+    Ключ файла - хэш названия варианта, всех параметров генерации (scale,
+    num_points, num_layers, seed и т.д.) и GENERATOR_VERSION, поэтому при
+    изменении любого из них берется другой файл. Файл открывается через
+    np.load(mmap_mode='r'): при запуске читаются только те страницы, которые
+    реально нужны, а массив доступен только для чтения.
+
+    Запись атомарная: массив сохраняется во временный файл в том же каталоге
+    и переименовывается через os.replace. Несколько одновременно запущенных
+    процессов могут сгенерировать облако параллельно, но каждый читатель видит
+    либо старый файл, либо новый целиком, и никогда - недописанный.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Args:
+            directory (str): Каталог кэша (None - default_cache_dir())
+        """
+        self.directory = directory or default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, variant, params):
+        """
+        Ключ кэша для варианта и параметров генерации
+
+        Args:
+            variant (str): Название варианта (обычно имя скрипта)
+            params (dict): Все параметры генератора, включая seed
+
+        Returns:
+            str: Шестнадцатеричный хэш
+        """
+        description = repr((variant, sorted(params.items()), GENERATOR_VERSION, np.dtype(POINT_DTYPE).str, 'xyz-rows-stratified'))
+        return hashlib.sha1(description.encode('utf-8')).hexdigest()[:16]
+
+    def path(self, variant, key):
+        """
+        Путь к файлу кэша
+        """
+        return os.path.join(self.directory, f"{self._prefix(variant)}-{key}.npy")
+
+    def load(self, variant, generate, seed, **params):
+        """
+        Облако точек из кэша или новое, сохраненное в кэш
+
+        Args:
+            variant (str): Название варианта (обычно имя скрипта)
+            generate (callable): Генератор точек, например create_heart_points(scale, ..., seed)
+            seed (int): Зерно генератора (None - облако каждый раз новое и не кэшируется)
+            **params: Остальные параметры генератора
+
+        Returns:
+            np.array: Массив (3, N) float32, отображенный из файла только для чтения
+        """
+        if seed is None:
+            return pack_points(generate(seed=None, **params))
+
+        # В ключ попадают и параметры, оставленные по умолчанию
+        bound = inspect.signature(generate).bind(seed=seed, **params)
+        bound.apply_defaults()
+        path = self.path(variant, self.key(variant, bound.arguments))
+
+        points = self._open(path)
+        if points is not None:
+            self.hits += 1
+            return points
+
+        self.misses += 1
+        points = pack_points(generate(seed=seed, **params))
+        try:
+            self._store(path, points)
+        except OSError:
+            # Каталог недоступен для записи: работаем без кэша
+            return points
+        self._prune(variant, path)
+        # Тот же массив, но отображенный из файла (как и при попадании в кэш)
+        cached = self._open(path)
+        return points if cached is None else cached
+
+    def clear(self, variant=None):
+        """
+        Удаление файлов кэша (всех или одного варианта)
+
+        Args:
+            variant (str): Название варианта (None - все варианты)
+        """
+        for path in self._files(variant):
+            self._remove(path)
+
+    @staticmethod
+    def _prefix(variant):
+        return re.sub(r'[^\w.-]', '_', variant)
+
+    @staticmethod
+    def _open(path):
+        """
+        Открытие файла кэша; поврежденный или чужой файл считается отсутствующим
+        """
+        try:
+            points = np.load(path, mmap_mode='r', allow_pickle=False)
+        except (OSError, ValueError, EOFError):
+            return None
+        if points.ndim != 2 or points.shape[0] != 3 or points.dtype != POINT_DTYPE:
+            return None
+        return points
+
+    def _store(self, path, points):
+        """
+        Атомарная запись массива: временный файл, fsync и os.replace
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as temp_file:
+                np.save(temp_file, np.ascontiguousarray(points), allow_pickle=False)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            # mkstemp создает файл только для владельца, а кэш читают и другие пользователи
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            self._remove(temp_path)
+            raise
+
+    def _files(self, variant=None):
+        """
+        Файлы кэша варианта (или всех вариантов), включая брошенные временные файлы
+
+        Имя сверяется целиком, чтобы кэш Heart-1 не задевал файлы Heart-12.
+        """
+        prefix = re.escape(self._prefix(variant)) if variant else r'.+'
+        pattern = re.compile(prefix + r'-[0-9a-f]{16}\.npy(\..+\.tmp)?')
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if pattern.fullmatch(name)]
+
+    def _prune(self, variant, keep):
+        """
+        Удаление файлов этого варианта с другими ключами (устаревших после смены параметров)
+        """
+        for path in self._files(variant):
+            if path != keep and path.endswith('.npy'):
+                self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        # Файл мог удалить другой процесс, а в Windows открытый файл не удаляется
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,498 @@
+"""
+Вариант анимации как набор параметров и эффектов над общим движком
+
+Все скрипты Heart-Terminal и I-love-mom описывают только свой вариант:
+облако точек, вращение, эффекты, символы, цвет и размер экрана. Поворот,
+растеризация, уровни детализации, вывод, темп кадров, конвейер, кэш кадров,
+профилировщик и запись в файл общие, поэтому каждое ускорение движка сразу
+попадает во все варианты.
+"""
+import inspect  # Проверка параметров генератора облака точек
+import math  # Математические функции
+import sys  # Системные операции
+import time  # Временные метки для счетчика FPS
+from collections import deque  # Очередь временных меток для расчета FPS
+
+from .asciicast import AsciicastRecorder
+from .cache import AnimationCycle, FrameCache, BLANK_SCREEN
+from .color import HuePalette
+from .framebuffer import ERASE_LINE, cell_columns, create_framebuffer
+from .geometry import generate_heart_points, pack_points
+from .lod import LevelOfDetail
+from .output import DiffWriter
+from .pipeline import FramePipeline
+from .pointcache import PointCloudCache
+from .profiler import FrameProfiler, NULL_PROFILER
+from .raster import depth_shading, rasterize
+from .resize import ScreenLayout, TerminalResize
+from .scheduler import FrameScheduler, calculate_fps
+from .transform import PointTransform, model_matrix
+
+
+class HeartPreset:
+    """
+    Параметры одного варианта анимации сердца
+
+    Кадр зависит только от номера шага симуляции (FPS шагов в секунду):
+    углы вращения растут на spin за шаг, а пульсация, покачивание, движение
+    и цвет берут время шага. Поэтому кадры можно рисовать в любом порядке и
+    в разных процессах (heart_engine.offline), а для кэша кадров все движения
+    подгоняются под общий период (AnimationCycle).
+
+    Использование в скрипте варианта:
+        PRESET = HeartPreset('Heart-12', points=dict(scale=8), pulse=Pulse(0.05, 2), color=Rainbow())
+        if __name__ == "__main__":
+            PRESET.run()
+    """
+
+    def __init__(self, name, points=None, generator=generate_heart_points, shading_chars=" .:!*OQ#",
+                 screen_size=(80, 40), fit_terminal=None, fps=30, spin=(0.0, 0.05, 0.0), rotation_order='xyz',
+                 sway=None, pulse=None, motion=None, flip_y=False, extent=(2, 2), center=(2, 2),
+                 shading=depth_shading, color=None, banner=None, seed=0, render_mode='text',
+                 frame_cache=False, pipeline_depth=1, profile=False, record_path=None, resize_terminal=False,
+                 level_of_detail=True):
+        """
+        Args:
+            name (str): Название варианта (ключ кэша облака точек и заголовок записи)
+            points (dict): Параметры генератора облака точек
+            generator (callable): Генератор облака точек (generate_heart_points, heart_sphere, heart_outline)
+            shading_chars (str): Набор символов от дальних точек к ближним
+            screen_size (tuple): Размер экрана в символах (ширина, высота)
+            fit_terminal (tuple): Экран по размеру терминала за вычетом (столбцов, строк);
+                None - постоянный screen_size (уменьшается, только если не помещается в терминал)
+            fps (float): Частота кадров (шагов симуляции в секунду)
+            spin (tuple): Приращение углов вокруг осей X, Y и Z за шаг, радианы
+            rotation_order (str): Порядок поворотов ('xyz' или 'zyx', см. transform.ROTATION_ORDERS)
+            sway (Sway): Покачивание вокруг осей X и Z (None - без покачивания)
+            pulse (Pulse): Пульсация масштаба (None - без пульсации)
+            motion (VerticalMotion): Сдвиг сердца (None - на месте)
+            flip_y (bool): Отразить ось Y после поворота
+            extent (tuple): Делители полуразмаха проекции по x и y (см. raster.project_points)
+            center (tuple): Делители центра экрана по x и y
+            shading (callable): Выбор символа: shading(points, depth, levels) -> индексы
+            color (Rainbow | Flicker | Shade): Цвет по глубине (None - без цвета)
+            banner (Banner): Текст под сердцем (None - без текста)
+            seed (int): Зерно облака точек (None - новое облако при каждом запуске, без кэша)
+            render_mode (str): Режим растеризации ('text', 'braille', 'halfblock');
+                можно передать первым аргументом командной строки
+            frame_cache (bool): Кэш кадров одного цикла анимации (флаг --cache)
+            pipeline_depth (int): Глубина конвейера кадров (0 - без фонового потока, флаг --serial)
+            profile (bool): Замер этапов кадра (флаг --profile)
+            record_path (str): Файл записи asciicast v2 (флаг --record=heart.cast)
+            resize_terminal (bool): Попросить терминал принять размер экрана при запуске
+            level_of_detail (bool): Рисовать наименьшую часть облака, которая покрывает
+                экран так же, как все облако (флаг --full - все облако)
+        """
+        self.name = name
+        self.points = dict(points or {})
+        self.generator = generator
+        self.shading_chars = shading_chars
+        self.screen_size = tuple(screen_size)
+        self.fit_terminal = fit_terminal
+        self.fps = fps
+        self.spin = tuple(spin)
+        self.rotation_order = rotation_order
+        self.sway = sway
+        self.pulse = pulse
+        self.motion = motion
+        self.flip_y = flip_y
+        self.extent = extent
+        self.center = center
+        self.shading = shading
+        self.color = color
+        self.banner = banner
+        self.seed = seed
+        self.render_mode = render_mode
+        self.frame_cache = frame_cache
+        self.pipeline_depth = pipeline_depth
+        self.profile = profile
+        self.record_path = record_path
+        self.resize_terminal = resize_terminal
+        self.level_of_detail = level_of_detail
+        self._frame = None  # Буферы преобразования кадра (PointTransform) для текущего облака
+        self._detail = None  # Уровни детализации (LevelOfDetail) для текущего облака
+
+        # Движения анимации: (название, приращение за шаг, период) - из них
+        # собираются часы кадра и общий цикл для кэша кадров
+        self._motions = []
+        for axis, rate in zip('xyz', self.spin):
+            if rate:
+                self._motions.append(('angle_' + axis, abs(rate), 2 * math.pi))
+        for motion_name, effect in (('pulse', pulse), ('motion', motion), ('color', color)):
+            if effect is not None and effect.period:
+                self._motions.append((motion_name, 1 / fps, effect.period))
+        if sway is not None:
+            self._motions.append(('sway_x', 1 / fps, sway.periods[0]))
+            self._motions.append(('sway_z', 1 / fps, sway.periods[1]))
+
+    def load_points(self):
+        """
+        Облако точек варианта (из кэша на диске, если генератор случайный и задан seed)
+
+        Returns:
+            np.array: Облако (3, N) float32 - строки x, y и z (см. geometry.pack_points)
+        """
+        if 'seed' in inspect.signature(self.generator).parameters:
+            return PointCloudCache().load(self.name, self.generator, self.seed, **self.points)
+        return pack_points(self.generator(**self.points))
+
+    def create_palette(self):
+        """
+        Таблица цветов варианта (None - вариант без цвета)
+        """
+        if self.color is not None:
+            return self.color.palette()
+        if self.banner is not None:
+            return HuePalette()
+        return None
+
+    def create_framebuffer(self, mode=None, palette=None, size=None):
+        """
+        Кадровый буфер варианта
+
+        Args:
+            mode (str): Режим растеризации (None - render_mode варианта)
+            palette (HuePalette): Таблица цветов
+            size (tuple): Размер экрана в символах (None - screen_size варианта)
+        """
+        return create_framebuffer(mode or self.render_mode, *(size or self.screen_size), self.shading_chars, palette)
+
+    def cell_columns(self, mode=None):
+        """
+        Столбцов терминала на ячейку кадра (2 - в наборе символов есть широкие)
+
+        Args:
+            mode (str): Режим растеризации (None - render_mode варианта)
+        """
+        if (mode or self.render_mode) != 'text':
+            return 1  # Символы Брайля и полублоки узкие
+        return cell_columns(self.shading_chars)
+
+    def footer_lines(self):
+        """
+        Количество строк под кадром: строка состояния и текст с пустыми строками вокруг
+        """
+        return 1 + (self.banner.height + 2 if self.banner is not None else 0)
+
+    def terminal_size(self, mode=None):
+        """
+        Размер терминала, на который рассчитан вариант (столбцы, строки) - если вывод не в терминал
+
+        Args:
+            mode (str): Режим растеризации (None - render_mode варианта)
+        """
+        columns = self.screen_size[0] * self.cell_columns(mode)
+        if self.fit_terminal is not None:
+            return columns + self.fit_terminal[0], self.screen_size[1] + self.fit_terminal[1]
+        return columns, self.screen_size[1] + self.footer_lines()
+
+    def screen_layout(self, columns, lines, mode=None):
+        """
+        Расположение кадра для размера терминала
+
+        Экран fit_terminal занимает терминал за вычетом полей, а постоянный
+        screen_size уменьшается, только если не помещается в терминал.
+        Сердце вместе с текстом и строкой состояния стоит по центру по вертикали.
+
+        Args:
+            columns (int): Ширина терминала в символах
+            lines (int): Высота терминала в строках
+            mode (str): Режим растеризации (None - render_mode варианта)
+
+        Returns:
+            ScreenLayout: Размер кадрового буфера и строка начала кадра
+        """
+        footer_lines = self.footer_lines()
+        cell_width = self.cell_columns(mode)  # Ширина кадра в ячейках, а терминала - в столбцах
+        if self.fit_terminal is not None:
+            width, height = (columns - self.fit_terminal[0]) // cell_width, lines - self.fit_terminal[1]
+        else:
+            width, height = min(self.screen_size[0], columns // cell_width), min(self.screen_size[1], lines - footer_lines)
+        width, height = max(1, width), max(1, height)
+        top = max(0, (lines - height - footer_lines) // 2)  # Сердце с текстом по центру терминала
+        return ScreenLayout(columns, lines, width, height, top)
+
+    def status_line(self, text, columns):
+        """
+        Строка состояния, обрезанная по ширине терминала
+
+        Строка состояния выводится без перевода строки и часто попадает на
+        последнюю строку терминала. Не поместившись, она перенеслась бы и
+        прокрутила экран, и каждый следующий кадр с адресацией курсора лег
+        бы на строку выше.
+
+        Args:
+            text (str): Текст строки состояния (ASCII)
+            columns (int): Ширина терминала в символах
+
+        Returns:
+            bytes: Строка состояния с очисткой остатка строки
+        """
+        text = text[:max(columns - 1, 0)]  # Последний столбец свободен: курсор не встает в позицию переноса
+        return f"\033[1m{text}\033[0m".encode() + ERASE_LINE
+
+    def create_cycle(self):
+        """
+        Общий период всех движений для кэша кадров
+        """
+        return AnimationCycle(steps=[step for _, step, _ in self._motions],
+                              periods=[period for _, _, period in self._motions])
+
+    def clock(self, step, cycle=None):
+        """
+        Значения движений для шага симуляции
+
+        Args:
+            step (int): Номер шага симуляции
+            cycle (AnimationCycle): Цикл анимации для кэша кадров (None - без цикла)
+
+        Returns:
+            dict: Углы вращения (радианы) и время каждого эффекта (секунды)
+        """
+        if cycle is None:
+            values = [increment * step for _, increment, _ in self._motions]
+        else:
+            # Движения подогнаны под общий период цикла
+            values = cycle.values(step % cycle.frames)
+        return dict(zip([motion_name for motion_name, _, _ in self._motions], values))
+
+    def model_matrix(self, clock):
+        """
+        Матрица кадра 3x4: пульсация, сдвиг, поворот и отражение оси Y
+
+        Args:
+            clock (dict): Значения движений кадра (см. clock)
+        """
+        angles = [math.copysign(clock.get('angle_' + axis, 0.0), rate) for axis, rate in zip('xyz', self.spin)]
+        if self.sway is not None:
+            sway_x, sway_z = self.sway(clock['sway_x'], clock['sway_z'])
+            angles[0] += sway_x
+            angles[2] += sway_z
+        scale = self.pulse(clock['pulse']) if self.pulse is not None else 1.0
+        offset = self.motion(clock['motion']) if self.motion is not None else None
+        return model_matrix(angles, scale, offset, self.rotation_order, self.flip_y)
+
+    def transform(self, points, clock):
+        """
+        Преобразование облака точек для кадра одним умножением на матрицу 3x4
+
+        Буферы кадра выделяются один раз для облака и переиспользуются.
+
+        Args:
+            points (np.array): Облако точек сердца (3, N) (см. load_points)
+            clock (dict): Значения движений кадра (см. clock)
+
+        Returns:
+            PointTransform: Точки кадра в переиспользуемом буфере (frame.points)
+        """
+        if self._frame is None or self._frame.source is not points:
+            self._frame = PointTransform(points)
+        self._frame.apply(self.model_matrix(clock))
+        return self._frame
+
+    def detail_points(self, points, resolution):
+        """
+        Уровень детализации облака для размера экрана
+
+        Уровень проверяется на ориентациях за один оборот сердца и
+        запоминается для размера экрана, поэтому подбирается заново только
+        при изменении размера терминала или режима растеризации.
+
+        Args:
+            points (np.array): Облако точек сердца (3, N) (см. load_points)
+            resolution (tuple): Размер экрана в точках растеризации (ширина, высота)
+
+        Returns:
+            np.array: Первые n точек облака (3, n) - представление без копирования
+        """
+        if self._detail is None or self._detail.points is not points:
+            self._detail = LevelOfDetail(points, self.detail_probes())
+        return self._detail.select(resolution, self.extent, self.center)
+
+    def detail_probes(self, count=4):
+        """
+        Пробные матрицы кадра за один оборот сердца для выбора уровня детализации
+
+        Args:
+            count (int): Количество проб (без вращения - одна проба)
+        """
+        rate = max(abs(rate) for rate in self.spin)
+        if not rate:
+            return [self.model_matrix(self.clock(0))]
+        period = 2 * math.pi / rate  # Шагов на оборот
+        return [self.model_matrix(self.clock(int(period * i / count))) for i in range(count)]
+
+    def rasterize(self, frame, framebuffer, palette, clock):
+        """
+        Проекция точек кадра и отрисовка в кадровый буфер
+
+        Args:
+            frame (PointTransform): Точки кадра (см. transform)
+            framebuffer (Framebuffer): Кадровый буфер
+            palette (HuePalette): Таблица цветов
+            clock (dict): Значения движений кадра
+        """
+        columns, rows, mask = frame.project(framebuffer.resolution, self.extent, self.center)
+        return rasterize(frame.points[:, mask], columns[mask], rows[mask], framebuffer, palette,
+                         self.color, clock.get('color', 0.0), self.shading)
+
+    def draw_frame(self, step, heart_points, framebuffer, palette, cycle=None, profiler=NULL_PROFILER):
+        """
+        Отрисовка кадра анимации для шага симуляции
+
+        Args:
+            step (int): Номер шага симуляции
+            heart_points (np.array): Облако точек сердца (3, N) (см. load_points)
+            framebuffer (Framebuffer): Кадровый буфер
+            palette (HuePalette): Таблица цветов
+            cycle (AnimationCycle): Цикл анимации для кэша кадров (None - без цикла)
+            profiler (FrameProfiler): Замер этапов поворота и растеризации
+        """
+        clock = self.clock(step, cycle)
+        with profiler.span('transform'):
+            frame = self.transform(heart_points, clock)
+        with profiler.span('raster'):
+            self.rasterize(frame, framebuffer, palette, clock)
+
+    def run(self, argv=None):
+        """
+        Запуск анимации в терминале до Ctrl+C
+
+        Args:
+            argv (list): Аргументы командной строки (None - sys.argv[1:]):
+                режим растеризации, --cache, --serial, --profile, --full, --record=FILE
+        """
+        argv = sys.argv[1:] if argv is None else argv
+        try:
+            if self.resize_terminal:
+                # Размер экрана и строка состояния
+                sys.stdout.write('\x1b[8;%d;%dt' % (self.screen_size[1] + 2, self.screen_size[0] * self.cell_columns()))
+            self._animate(argv)
+        except KeyboardInterrupt:
+            print('\033[?25h')  # Показать курсор
+            print("\nProgram terminated")
+        except Exception as e:
+            print('\033[?25h')  # Показать курсор
+            print(f"\nAn error occurred: {str(e)}")
+        finally:
+            print('\033[0m')  # Сброс цветовых настроек
+
+    def _animate(self, argv):
+        """
+        Цикл анимации: кадры готовит фоновый поток конвейера, главный поток выводит их по дедлайнам
+        """
+        profiler = FrameProfiler(enabled=self.profile or '--profile' in argv)  # Замер этапов кадра
+        with profiler.span('points'):
+            heart_points = self.load_points()  # Облако точек сердца
+        palette = self.create_palette()  # Таблица цветов строится один раз
+        render_mode = next((arg for arg in argv if not arg.startswith('--')), self.render_mode)  # Режим растеризации
+
+        # Расположение кадра пересчитывается по SIGWINCH, а кадровый буфер и
+        # уровень детализации - только при новом размере экрана
+        resize = TerminalResize(lambda columns, lines: self.screen_layout(columns, lines, render_mode),
+                                fallback=self.terminal_size(render_mode))
+        layout = resize.poll()
+        top = layout.top
+        terminal = layout.terminal  # Размер терминала для строки состояния и записи
+        framebuffer = self.create_framebuffer(render_mode, palette, layout.size)
+        detail = self.level_of_detail and '--full' not in argv  # Уровни детализации по размеру экрана
+        points = self.detail_points(heart_points, framebuffer.resolution) if detail else heart_points
+
+        record_path = next((arg.split('=', 1)[1] for arg in argv if arg.startswith('--record=')), self.record_path)
+        recorder = None
+        if record_path:
+            recorder = AsciicastRecorder(record_path, *terminal, tee=sys.stdout, title=self.name)  # Кадры пишутся в файл и в терминал
+        writer = DiffWriter(recorder, blank=True)  # Вывод только изменившихся ячеек
+
+        # Кэш кадров: все движения подогнаны под общий период
+        cycle = cache = None
+        if self.frame_cache or '--cache' in argv:
+            cycle = self.create_cycle()
+            cache = FrameCache(cycle.frames)
+        previous_index = BLANK_SCREEN  # Номер прошлого кадра в цикле (экран очищается при запуске)
+
+        print('\033[2J')  # Очистка экрана
+        print('\033[?25l')  # Скрытие курсора
+
+        fps_counter = deque(maxlen=30)  # Очередь для расчета FPS
+        scheduler = FrameScheduler(fps=self.fps)  # Темп кадров по дедлайнам perf_counter
+
+        def render_frame(step):
+            """
+            Подготовка кадра для шага симуляции (в фоновом потоке конвейера, пока выводится прошлый кадр)
+
+            Returns:
+                tuple: Байты кадра, кадровый буфер, строка экрана, с которой выводится кадр,
+                    и размер терминала (столбцы, строки)
+            """
+            nonlocal framebuffer, points, previous_index, top, terminal
+            prefix = b''
+            layout = resize.poll()  # Новое расположение только после затихших SIGWINCH
+            if layout is not None:
+                top = layout.top
+                terminal = layout.terminal
+                if layout.size != (framebuffer.width, framebuffer.height):
+                    framebuffer = self.create_framebuffer(render_mode, palette, layout.size)
+                    if detail:
+                        points = self.detail_points(heart_points, framebuffer.resolution)
+                writer.invalidate(blank=True)
+                prefix = b'\033[2J'  # Терминал мог переложить строки прошлого кадра: экран очищается
+                if cache is not None:
+                    cache.clear()
+                    previous_index = BLANK_SCREEN
+
+            frame = index = None
+            if cache is not None:
+                # В режиме кэша кадр определяется номером в цикле
+                index = step % cycle.frames
+                frame = cache.get(index, previous_index)
+
+            if frame is not None:
+                writer.invalidate()  # Содержимое кадра из кэша писателю неизвестно: следующий кадр выводится целиком
+            else:
+                self.draw_frame(step, points, framebuffer, palette, cycle, profiler)  # Отрисовка сердца
+                with profiler.span('encode'):
+                    frame, full = writer.encode(framebuffer, top)  # Кодирование кадра
+                if cache is not None:
+                    cache.put(index, frame, None if full else previous_index)
+            previous_index = index
+            return prefix + frame, framebuffer, top, terminal
+
+        depth = 0 if '--serial' in argv else self.pipeline_depth  # Глубина конвейера (0 - без фонового потока)
+        pipeline = FramePipeline(render_frame, depth=depth, clock=lambda: scheduler.frame)  # При отставании кадр готовится сразу для текущего шага
+
+        recorded_terminal = terminal  # Размер терминала в записи (заголовок и события "r")
+        try:
+            with resize, pipeline:
+                while True:
+                    _, (frame, frame_buffer, frame_top, frame_terminal) = pipeline.get()  # Готовый кадр из фонового потока
+
+                    fps_counter.append(time.time())  # Добавление временной метки в очередь
+                    fps = calculate_fps(fps_counter)  # Расчет FPS
+
+                    cache_status = f" | {cache.summary()}" if cache is not None else ""  # Попадания в кэш и занятая память
+                    profile_status = f" | {profiler.summary()}" if profiler.enabled else ""  # Перцентили этапов кадра
+                    detail_status = f" | {self._detail.summary()}" if detail else ""  # Точки уровня детализации
+                    status = f"FPS: {fps:.1f} | Bytes/frame: {writer.last_bytes:6d} | {scheduler.summary()}{cache_status}{detail_status} | {pipeline.summary()}{profile_status} | Press Ctrl+C to exit"
+                    footer = self.status_line(status, frame_terminal[0])  # Строка состояния по ширине терминала
+                    if self.banner is not None:
+                        # Под сердцем: пустая строка, текст, пустая строка и строка состояния
+                        footer = b'\n' + self.banner(scheduler.time, frame_buffer.width * frame_buffer.cell_width, palette) + b'\n\n' + footer
+                    if recorder is not None and frame_terminal != recorded_terminal:
+                        # Кадр нового размера: событие в записи перед ним, чтобы плеер сменил размер терминала
+                        recorder.resize(*frame_terminal)
+                        recorded_terminal = frame_terminal
+                    with profiler.span('write'):
+                        writer.send(frame, frame_buffer, footer=footer, top=frame_top)  # Обновление экрана
+                    pipeline.written()  # Отметка окончания вывода для счетчиков конвейера
+
+                    scheduler.wait()  # Ожидание дедлайна следующего кадра
+
+        except KeyboardInterrupt:
+            print('\033[?25h')  # Показать курсор
+            print("\nProgram terminated")  # Завершение программы
+            if profiler.enabled:
+                print(profiler.report())  # Таблица перцентилей этапов кадра
+        finally:
+            if recorder is not None:
+                recorder.close()  # Дописываем файл записи
@@ -0,0 +1,198 @@
+"""
+Замер этапов кадра: интервалы perf_counter_ns в кольцевых буферах и перцентили задержек
+"""
+import threading  # Замеры пишут и главный, и фоновый поток
+import time  # Таймер perf_counter_ns
+
+import numpy as np  # Кольцевые буферы и перцентили
+
+
+class _Ring:
+    """
+    Кольцевой буфер фиксированного размера для длительностей одного этапа (нс)
+    """
+
+    __slots__ = ('values', 'index', 'count', 'peak')
+
+    def __init__(self, capacity):
+        self.values = np.zeros(capacity, dtype=np.int64)
+        self.index = 0
+        self.count = 0
+        self.peak = 0  # Наибольшая длительность за все время, а не только в окне
+
+    def append(self, value):
+        self.values[self.index] = value
+        self.index = (self.index + 1) % len(self.values)
+        if self.count < len(self.values):
+            self.count += 1
+        if value > self.peak:
+            self.peak = value
+
+
+class _Span:
+    """
+    Контекстный менеджер замера одного этапа
+    """
+
+    __slots__ = ('profiler', 'stage', 'started')
+
+    def __init__(self, profiler, stage):
+        self.profiler = profiler
+        self.stage = stage
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.stage, time.perf_counter_ns() - self.started)
+        return False
+
+
+class _NullSpan:
+    """
+    Пустой замер для выключенного профилировщика
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class FrameProfiler:
+    """
+    Длительности этапов кадра (генерация, поворот, растеризация, кодирование, вывод)
+
+    Каждый этап пишет длительность в свой кольцевой буфер из capacity
+    последних значений, поэтому память не растет, а запись - это одно
+    присваивание в массив NumPy. Перцентили считаются только при запросе
+    статистики, а строка состояния обновляется не чаще раза в refresh секунд,
+    так что замер занимает доли процента времени кадра. Выключенный
+    профилировщик возвращает пустые замеры.
+
+    Использование в цикле анимации:
+        profiler = FrameProfiler()
+        with profiler.span('raster'):
+            draw_heart(points, framebuffer, palette)
+        print(profiler.summary())  # raster 4.1/7.9 ms ... (p50/p99)
+    """
+
+    def __init__(self, enabled=True, capacity=256, refresh=0.5):
+        """
+        Args:
+            enabled (bool): Записывать замеры (False - все замеры пустые)
+            capacity (int): Сколько последних замеров хранить для каждого этапа
+            refresh (float): Как часто пересчитывать строку summary(), в секундах
+        """
+        self.enabled = enabled
+        self.capacity = capacity
+        self.refresh = refresh
+        self._rings = {}  # Этап -> кольцевой буфер, в порядке первого замера
+        self._lock = threading.Lock()
+        self._summary = ''
+        self._summary_at = None
+
+    def span(self, stage):
+        """
+        Замер этапа: with profiler.span('encode'): ...
+
+        Args:
+            stage (str): Название этапа
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, stage)
+
+    def record(self, stage, duration_ns):
+        """
+        Запись длительности этапа, замеренной снаружи
+
+        Args:
+            stage (str): Название этапа
+            duration_ns (int): Длительность в наносекундах
+        """
+        if not self.enabled:
+            return
+        ring = self._rings.get(stage)
+        if ring is None:
+            with self._lock:
+                ring = self._rings.setdefault(stage, _Ring(self.capacity))
+        ring.append(duration_ns)
+
+    def stages(self):
+        """
+        Названия этапов в порядке первого замера
+        """
+        return list(self._rings)
+
+    def stats(self, stage=None):
+        """
+        Статистика этапов по последним замерам
+
+        Args:
+            stage (str): Один этап (None - все этапы)
+
+        Returns:
+            dict: count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms (в окне) и
+                peak_ms (за все время); без stage - словарь таких словарей по этапам
+        """
+        if stage is None:
+            return {name: self.stats(name) for name in self.stages()}
+        ring = self._rings.get(stage)
+        if ring is None or ring.count == 0:
+            return {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0, 'peak_ms': 0.0}
+        # Копия окна: буфер может дописываться другим потоком
+        values = ring.values[:ring.count].copy() / 1e6
+        p50, p95, p99 = np.percentile(values, [50, 95, 99])
+        return {
+            'count': ring.count,
+            'mean_ms': float(values.mean()),
+            'p50_ms': float(p50),
+            'p95_ms': float(p95),
+            'p99_ms': float(p99),
+            'max_ms': float(values.max()),
+            'peak_ms': ring.peak / 1e6,
+        }
+
+    def summary(self):
+        """
+        Короткая строка для строки состояния: p50/p99 каждого этапа в миллисекундах
+        """
+        if not self.enabled:
+            return ''
+        now = time.perf_counter()
+        if self._summary_at is None or now - self._summary_at >= self.refresh:
+            parts = [f"{name} {stats['p50_ms']:.1f}/{stats['p99_ms']:.1f}" for name, stats in self.stats().items()]
+            self._summary = ' | '.join(parts) + ' ms (p50/p99)' if parts else ''
+            self._summary_at = now
+        return self._summary
+
+    def report(self):
+        """
+        Таблица статистики всех этапов (для вывода после завершения анимации)
+        """
+        lines = [f"{'stage':<12}{'count':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'peak':>9}  ms"]
+        for name, stats in self.stats().items():
+            lines.append(f"{name:<12}{stats['count']:>7}{stats['mean_ms']:>9.2f}{stats['p50_ms']:>9.2f}{stats['p95_ms']:>9.2f}"
+                         f"{stats['p99_ms']:>9.2f}{stats['max_ms']:>9.2f}{stats['peak_ms']:>9.2f}")
+        return '\n'.join(lines)
+
+    def reset(self):
+        """
+        Очистка всех замеров
+        """
+        with self._lock:
+            self._rings = {}
+        self._summary = ''
+        self._summary_at = None
+
+
+# Выключенный профилировщик для функций, которым замер передается необязательно
+NULL_PROFILER = FrameProfiler(enabled=False)
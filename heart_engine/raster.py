@@ -0,0 +1,189 @@
+"""
+Растеризация точек сердца в ячейки экрана
+"""
+import numpy as np  # Математические операции и работа с массивами
+
+
+def front_most_points(x, y, z, width):
+    """
+    Векторный z-буфер: выбор ближайшей точки для каждой ячейки экрана
+    
+    Args:
+        x (np.array): Столбцы точек на экране
+        y (np.array): Строки точек на экране
+        z (np.array): Глубина точек
+        width (int): Ширина экрана
+    
+    Returns:
+        np.array: Индексы видимых точек (по одной на ячейку)
+    """
+    # Линейный индекс ячейки экрана для каждой точки
+    cells = y * width + x
+    # Сортировка по ячейке, внутри ячейки - по убыванию глубины.
+    # Сортировка устойчивая, поэтому при равной глубине побеждает более ранняя точка, как в цикле с z-буфером
+    order = np.lexsort((-z, cells))
+    sorted_cells = cells[order]
+    # Первая точка в каждой группе - ближайшая к зрителю
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_cells[1:] != sorted_cells[:-1]
+    return order[first]
+
+
+def depth_shading(points, depth, levels):
+    """
+    Символ по глубине: дальние точки - первые символы набора, ближние - последние
+
+    Args:
+        points (np.array): Видимые на экране точки после поворота (3, N) - строки x, y и z
+        depth (np.array): Глубина точек, нормализованная в 0..1
+        levels (int): Количество символов в наборе
+
+    Returns:
+        np.array: Индексы символов
+    """
+    return (depth * (levels - 1)).astype(int)
+
+
+def shadow_shading(points, depth, levels):
+    """
+    Символ по глубине на ступень темнее (эффект тени, Heart-16)
+    """
+    return np.maximum(depth_shading(points, depth, levels) - 1, 0)
+
+
+def lighting_shading(points, depth, levels):
+    """
+    Символ по освещенности: косинус угла между направлением на точку и светом
+    от зрителя (источник на оси Z, Heart-4)
+    """
+    norms = np.sqrt(np.einsum('ij,ij->j', points, points))
+    cosines = np.divide(points[2], norms, out=np.zeros(points.shape[1], dtype=norms.dtype), where=norms > 0)
+    return np.clip(((cosines + 1) / 2 * (levels - 1)).astype(int), 0, levels - 1)
+
+
+def random_shading(points, depth, levels):
+    """
+    Случайный символ для каждой точки в каждом кадре (эмодзи Heart-1)
+    """
+    return np.random.randint(levels, size=points.shape[1])
+
+
+def project_points(points, resolution, extent=(2, 2), center=(2, 2)):
+    """
+    Проекция точек на экран: координаты делятся на наибольшую по модулю и
+    растягиваются на долю экрана
+
+    Args:
+        points (np.array): Точки (N, 3)
+        resolution (tuple): Размер экрана в точках растеризации (ширина, высота)
+        extent (tuple): Делители полуразмаха: x занимает width // extent[0] в каждую сторону от центра
+        center (tuple): Делители центра: центр экрана в (width // center[0], height // center[1])
+
+    Returns:
+        tuple: Столбцы и строки видимых точек и маска видимых точек
+    """
+    width, height = resolution
+    x_peak = np.max(np.abs(points[:, 0]))
+    y_peak = np.max(np.abs(points[:, 1]))
+    x = (points[:, 0] / (x_peak or 1) * (width // extent[0]) + width // center[0]).astype(int)
+    y = (points[:, 1] / (y_peak or 1) * (height // extent[1]) + height // center[1]).astype(int)
+    mask = (0 <= x) & (x < width) & (0 <= y) & (y < height)
+    return x[mask], y[mask], mask
+
+
+def draw_heart(points, framebuffer, palette=None, color=None, time_val=0.0,
+               shading=depth_shading, extent=(2, 2), center=(2, 2)):
+    """
+    Отрисовка сердца в кадровый буфер с z-буфером, символами и цветом
+
+    Общий растеризатор всех вариантов: отличия вариантов задаются долей
+    экрана, функцией выбора символа и функцией цвета.
+
+    Args:
+        points (np.array): Точки сердца после поворота (N, 3)
+        framebuffer (Framebuffer): Кадровый буфер, переиспользуемый между кадрами
+        palette (HuePalette): Таблица цветов (None - без цвета)
+        color (callable): color(depth, time_val) -> (оттенок, насыщенность, яркость)
+            для нормализованной глубины точек (None - без цвета)
+        time_val (float): Время анимации цвета в секундах
+        shading (callable): shading(points, depth, levels) -> индексы символов
+        extent (tuple): Делители полуразмаха по x и y (см. project_points)
+        center (tuple): Делители центра экрана по x и y
+
+    Returns:
+        Framebuffer: Кадровый буфер с отрисованным сердцем
+    """
+    if len(points) == 0:
+        framebuffer.clear()
+        return framebuffer
+    x, y, mask = project_points(points, framebuffer.resolution, extent, center)
+    return rasterize(points[mask].T, x, y, framebuffer, palette, color, time_val, shading)
+
+
+def rasterize(points, x, y, framebuffer, palette=None, color=None, time_val=0.0, shading=depth_shading):
+    """
+    Отрисовка уже спроецированных видимых точек (см. draw_heart)
+
+    Args:
+        points (np.array): Видимые точки кадра (3, N) - строки x, y и z
+        x (np.array): Столбцы видимых точек
+        y (np.array): Строки видимых точек
+        framebuffer (Framebuffer): Кадровый буфер
+        palette (HuePalette): Таблица цветов (None - без цвета)
+        color (callable): Цвет по нормализованной глубине (None - без цвета)
+        time_val (float): Время анимации цвета в секундах
+        shading (callable): shading(points, depth, levels) -> индексы символов
+
+    Returns:
+        Framebuffer: Кадровый буфер с отрисованным сердцем
+    """
+    framebuffer.clear()
+    if len(x) == 0:
+        return framebuffer
+
+    z = points[2]
+    # Нормализация глубины для выбора символов и цвета (плоское сердце - одна глубина)
+    z_min, z_max = np.min(z), np.max(z)
+    depth = (z - z_min) / (z_max - z_min) if z_max > z_min else np.zeros_like(z)
+    colored = color is not None and palette is not None
+
+    if framebuffer.subcells == (1, 1):
+        intensity = shading(points, depth, len(framebuffer.shading_chars))
+        front = framebuffer.plot(x, y, z, intensity)
+        if colored:
+            # Цвет считается только для видимых ячеек, ANSI-код берется из таблицы
+            framebuffer.color[y[front], x[front]] = palette.codes(*color(depth[front], time_val))
+    else:
+        # Режимы Брайля и полублоков: символ собирается из нескольких точек
+        framebuffer.plot_subcells(x, y, z, palette.codes(*color(depth, time_val)) if colored else None)
+    return framebuffer
+
+
+# Символы Брайля для масок 1..255 (маска 0 - пустая ячейка)
+BRAILLE_CHARS = ''.join(chr(0x2800 + mask) for mask in range(1, 256))
+# Бит точки Брайля для каждой позиции (строка, столбец) внутри символа 2x4
+BRAILLE_BITS = np.array([
+    [0x01, 0x08],
+    [0x02, 0x10],
+    [0x04, 0x20],
+    [0x40, 0x80]
+], dtype=np.uint8)
+
+# Полублоки: верхняя и нижняя половина символа
+HALF_BLOCK_CHARS = '▀▄'
+
+
+def braille_patterns(occupied):
+    """
+    Векторная упаковка точек в маски символов Брайля
+    
+    Args:
+        occupied (np.array): Занятые точки, массив (height * 4, width * 2)
+    
+    Returns:
+        np.array: Маски точек (height, width), 0 - пустая ячейка
+    """
+    height, width = occupied.shape[0] // 4, occupied.shape[1] // 2
+    # Каждая ячейка - блок 4x2, биты разных точек не пересекаются, поэтому сумма равна OR
+    cells = occupied.reshape(height, 4, width, 2) * BRAILLE_BITS[:, np.newaxis, :]
+    return cells.sum(axis=(1, 3), dtype=np.uint8)
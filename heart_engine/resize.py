@@ -0,0 +1,156 @@
+"""
+Изменение размера терминала: SIGWINCH, подавление дребезга и расположение кадра
+"""
+import shutil  # Размер терминала
+import signal  # Сигнал SIGWINCH об изменении размера терминала
+import threading  # Обработчик сигнала ставится только из главного потока
+import time  # Таймер perf_counter
+
+
+class ScreenLayout:
+    """
+    Расположение кадра в терминале для одного размера терминала
+
+    Считается один раз на изменение размера: размер кадрового буфера (его
+    ширина - и ширина строки, по которой центрируется текст под сердцем) и
+    строка начала кадра (сердце с текстом под ним по центру по вертикали).
+    """
+
+    def __init__(self, columns, lines, width, height, top=0):
+        """
+        Args:
+            columns (int): Ширина терминала в символах
+            lines (int): Высота терминала в строках
+            width (int): Ширина кадрового буфера в символах
+            height (int): Высота кадрового буфера в строках
+            top (int): Номер строки терминала (с 0), с которой начинается кадр
+        """
+        self.columns = columns
+        self.lines = lines
+        self.width = width
+        self.height = height
+        self.top = top
+
+    @property
+    def terminal(self):
+        return self.columns, self.lines
+
+    @property
+    def size(self):
+        return self.width, self.height
+
+    def __eq__(self, other):
+        return isinstance(other, ScreenLayout) and vars(self) == vars(other)
+
+    def __repr__(self):
+        return f"ScreenLayout(terminal={self.columns}x{self.lines}, frame={self.width}x{self.height}, top={self.top})"
+
+
+class TerminalResize:
+    """
+    Отслеживание размера терминала по сигналу SIGWINCH с подавлением дребезга
+
+    Обработчик сигнала только запоминает время последнего события, а размер
+    терминала читается в poll() - один раз, когда события затихли на debounce
+    секунд. Поэтому при перетаскивании края окна расположение кадра
+    пересчитывается один раз, а не на каждый из десятков сигналов. Без
+    SIGWINCH (Windows) или вне главного потока размер опрашивается раз в
+    poll_interval секунд.
+
+    Использование в цикле анимации:
+        resize = TerminalResize(lambda columns, lines: ScreenLayout(...), fallback=(80, 42))
+        with resize:
+            while True:
+                layout = resize.poll()
+                if layout is not None:
+                    ...  # Новый кадровый буфер, очистка экрана
+    """
+
+    def __init__(self, layout, fallback=(80, 24), debounce=0.1, poll_interval=0.5):
+        """
+        Args:
+            layout (callable): Расположение кадра по размеру терминала:
+                layout(columns, lines) -> ScreenLayout
+            fallback (tuple): Размер, если вывод не в терминал (столбцы, строки)
+            debounce (float): Сколько секунд после последнего SIGWINCH ждать перед пересчетом
+            poll_interval (float): Период опроса размера без SIGWINCH, секунды
+        """
+        self.layout = layout
+        self.fallback = fallback
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.current = None  # Текущее расположение кадра
+        self.events = 0  # Полученных сигналов SIGWINCH
+        self.resizes = 0  # Пересчетов расположения после запуска
+        self._pending = None  # Время последнего необработанного сигнала
+        self._next_poll = 0.0  # Время следующего опроса без SIGWINCH
+        self._previous_handler = None
+        self._installed = False
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.uninstall()
+        return False
+
+    def install(self):
+        """
+        Установка обработчика SIGWINCH (если сигнал есть и это главный поток)
+        """
+        if (not self._installed and hasattr(signal, 'SIGWINCH')
+                and threading.current_thread() is threading.main_thread()):
+            self._previous_handler = signal.signal(signal.SIGWINCH, self._on_resize)
+            self._installed = True
+
+    def uninstall(self):
+        """
+        Возврат прежнего обработчика SIGWINCH
+        """
+        if self._installed:
+            signal.signal(signal.SIGWINCH, self._previous_handler or signal.SIG_DFL)
+            self._installed = False
+
+    def _on_resize(self, signum, frame):
+        self.events += 1
+        self._pending = time.perf_counter()
+
+    def measure(self):
+        """
+        Расположение кадра для текущего размера терминала (без учета событий)
+        """
+        columns, lines = shutil.get_terminal_size(self.fallback)
+        return self.layout(columns, lines)
+
+    def poll(self, now=None):
+        """
+        Новое расположение кадра, если размер терминала изменился
+
+        Первый вызов всегда возвращает расположение для текущего размера.
+
+        Args:
+            now (float): Текущее время perf_counter (None - взять сейчас)
+
+        Returns:
+            ScreenLayout: Новое расположение или None, если пересчитывать нечего
+        """
+        now = time.perf_counter() if now is None else now
+        if self.current is not None:
+            if self._installed:
+                # Ждем, пока события затихнут
+                if self._pending is None or now - self._pending < self.debounce:
+                    return None
+                self._pending = None
+            else:
+                if now < self._next_poll:
+                    return None
+                self._next_poll = now + self.poll_interval
+
+        layout = self.measure()
+        if layout == self.current:
+            return None
+        if self.current is not None:
+            self.resizes += 1
+        self.current = layout
+        return layout
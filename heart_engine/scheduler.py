@@ -0,0 +1,160 @@
+"""
+Темп кадров по абсолютным дедлайнам
+"""
+import time  # Таймер perf_counter и сон
+from collections import deque  # История опозданий для статистики
+
+import numpy as np  # Перцентили опозданий
+
+# Политики для опоздавших кадров
+SKIP = 'skip'  # Пропустить просроченные шаги: симуляция перепрыгивает вперед
+RENDER_LATE = 'late'  # Рисовать каждый шаг, догоняя расписание без сна
+
+
+class FrameScheduler:
+    """
+    Планировщик кадров с фиксированной частотой
+
+    Дедлайны считаются от момента запуска как start + n * period, поэтому
+    ошибки сна не накапливаются (в отличие от sleep(period - frame_time)).
+    До дедлайна поток спит, а последние spin секунд ждет в активном цикле,
+    чтобы пересып системного таймера не сдвигал кадр.
+
+    Использование в цикле анимации:
+        scheduler = FrameScheduler(fps=30)
+        while True:
+            draw(scheduler.time)
+            steps = scheduler.wait()  # Шагов симуляции с прошлого кадра
+    """
+
+    def __init__(self, fps=30, late_policy=SKIP, spin=0.002, max_backlog=5, history=120):
+        """
+        Args:
+            fps (float): Целевая частота кадров
+            late_policy (str): SKIP - пропускать просроченные шаги, RENDER_LATE - рисовать их с опозданием
+            spin (float): Сколько секунд перед дедлайном ждать активно, а не во сне
+            max_backlog (int): При RENDER_LATE отставание больше стольких кадров
+                сбрасывается (например, после остановки процесса)
+            history (int): Сколько последних кадров учитывать в статистике
+        """
+        if late_policy not in (SKIP, RENDER_LATE):
+            raise ValueError(f"Неизвестная политика опоздавших кадров: {late_policy}")
+        self.period = 1.0 / fps
+        self.late_policy = late_policy
+        self.spin = spin
+        self.max_backlog = max_backlog
+
+        self.frame = 0  # Номер шага симуляции
+        self.late_frames = 0  # Кадров, начатых после своего дедлайна
+        self.skipped_frames = 0  # Шагов симуляции, пропущенных политикой SKIP
+        self._lateness = deque(maxlen=history)
+        self._intervals = deque(maxlen=history)
+        self._deadline = None
+        self._last_start = None
+
+    @property
+    def time(self):
+        """
+        Время анимации в секундах: номер шага, умноженный на период кадра
+        """
+        return self.frame * self.period
+
+    def start(self):
+        """
+        Начало отсчета дедлайнов (вызывается автоматически при первом wait)
+        """
+        self._deadline = time.perf_counter()
+        self._last_start = self._deadline
+
+    def wait(self):
+        """
+        Ожидание дедлайна следующего кадра
+
+        Returns:
+            int: На сколько шагов продвинулась симуляция (больше 1 - кадры пропущены)
+        """
+        if self._deadline is None:
+            self.start()
+
+        deadline = self._deadline + self.period
+        now = time.perf_counter()
+        steps = 1
+
+        if now < deadline:
+            # Сон до момента чуть раньше дедлайна, остаток - активное ожидание
+            if deadline - now > self.spin:
+                time.sleep(deadline - now - self.spin)
+            while time.perf_counter() < deadline:
+                pass
+        else:
+            self.late_frames += 1
+            missed = int((now - deadline) // self.period)
+            if self.late_policy == SKIP:
+                # Переходим к последнему просроченному дедлайну
+                deadline += missed * self.period
+                steps += missed
+                self.skipped_frames += missed
+            elif missed > self.max_backlog:
+                # Слишком большое отставание не догнать: начинаем расписание заново
+                deadline += missed * self.period
+
+        started = time.perf_counter()
+        self._lateness.append(started - deadline)
+        self._intervals.append(started - self._last_start)
+        self._last_start = started
+        self._deadline = deadline
+        self.frame += steps
+        return steps
+
+    def stats(self):
+        """
+        Статистика темпа по последним кадрам
+
+        Returns:
+            dict: fps - фактическая частота, jitter_p50/jitter_p95/jitter_max - опоздание
+                начала кадра относительно дедлайна (секунды), interval_std - разброс
+                интервалов между кадрами, late_frames и skipped_frames - счетчики
+        """
+        result = {
+            'fps': 0.0,
+            'jitter_p50': 0.0,
+            'jitter_p95': 0.0,
+            'jitter_max': 0.0,
+            'interval_std': 0.0,
+            'late_frames': self.late_frames,
+            'skipped_frames': self.skipped_frames,
+        }
+        if self._lateness:
+            lateness = np.array(self._lateness)
+            intervals = np.array(self._intervals)
+            result['fps'] = float(len(intervals) / intervals.sum()) if intervals.sum() > 0 else 0.0
+            result['jitter_p50'], result['jitter_p95'] = (float(value) for value in np.percentile(lateness, [50, 95]))
+            result['jitter_max'] = float(lateness.max())
+            result['interval_std'] = float(intervals.std())
+        return result
+
+    def summary(self):
+        """
+        Короткая строка статистики для строки состояния
+        """
+        stats = self.stats()
+        return (f"Jitter: {stats['jitter_p95'] * 1000:.2f} ms | "
+                f"Late: {stats['late_frames']} | Skip: {stats['skipped_frames']}")
+
+
+def calculate_fps(fps_counter):
+    """
+    Расчет кадров в секунду (FPS) по временным меткам последних кадров
+
+    Args:
+        fps_counter (deque): Очередь временных меток кадров
+
+    Returns:
+        float: Количество кадров в секунду
+    """
+    if len(fps_counter) < 2:
+        return 0.0
+    time_diff = fps_counter[-1] - fps_counter[0]
+    if time_diff <= 0:
+        return 0.0
+    return len(fps_counter) / time_diff
@@ -0,0 +1,248 @@
+"""
+Растровый вывод точек без matplotlib: диски точек в изображение RGBA float32 и PNG через zlib
+"""
+import struct  # Заголовки чанков PNG
+import zlib  # Сжатие данных и контрольные суммы PNG
+
+import numpy as np  # Математические операции и работа с массивами
+
+# Подвыборка пикселя при расчете покрытия диска (сглаживание краев)
+COVERAGE_SAMPLES = 8
+
+
+def marker_diameter(size, dpi=100, linewidth=1.5):
+    """
+    Диаметр точки в пикселях по размеру matplotlib
+
+    Args:
+        size (float): Размер точки scatter(s=...) - площадь в квадратных пунктах
+        dpi (float): Точек на дюйм (в дюйме 72 пункта)
+        linewidth (float): Толщина обводки в пунктах (scatter обводит точку цветом
+            заливки линией lines.linewidth = 1.5)
+
+    Returns:
+        float: Диаметр в пикселях
+    """
+    return (np.sqrt(size) + linewidth) * dpi / 72
+
+
+def disc_footprint(diameter):
+    """
+    Пиксели диска с центром в центре пикселя и доля покрытия каждого пикселя
+
+    Args:
+        diameter (float): Диаметр диска в пикселях
+
+    Returns:
+        tuple: Смещения строк и столбцов (K,) и покрытие 0..1 (K,)
+    """
+    radius = diameter / 2
+    reach = int(np.ceil(radius - 0.5))  # Сколько пикселей диск задевает от центрального
+    offsets = np.arange(-reach, reach + 1)
+    # Центры подпикселей относительно центра пикселя
+    samples = (np.arange(COVERAGE_SAMPLES) + 0.5) / COVERAGE_SAMPLES - 0.5
+    positions = (offsets[:, np.newaxis] + samples).ravel()
+    inside = positions[:, np.newaxis] ** 2 + positions ** 2 <= radius ** 2
+    side = len(offsets)
+    coverage = inside.reshape(side, COVERAGE_SAMPLES, side, COVERAGE_SAMPLES).mean(axis=(1, 3))
+    if not coverage.any():
+        # Диск меньше подпикселя: его площадь целиком в центральном пикселе
+        coverage[reach, reach] = min(np.pi * radius ** 2, 1.0)
+    rows, columns = np.nonzero(coverage)
+    return rows - reach, columns - reach, coverage[rows, columns]
+
+
+class SplatCanvas:
+    """
+    Изображение RGBA float32 для точек-дисков с наложением по альфа-каналу
+
+    Пиксели хранятся плоскостями R, G, B, A (4, H, W) с умноженной на альфу
+    яркостью. Точка одного цвета с прозрачностью a, покрывающая долю w
+    пикселя, накладывается оператором over: P = (цвет, 1) * a*w + P * (1 - a*w).
+    Для n точек одного цвета это P = (цвет, 1) * (1 - T) + P * T, где T -
+    произведение (1 - a*w_i), поэтому слой накладывается одним проходом:
+    логарифмы (1 - a*w) суммируются по пикселям через np.bincount. Результат
+    совпадает с поочередным рисованием точек, как у scatter в matplotlib.
+    """
+
+    def __init__(self, width, height, background=(0, 0, 0)):
+        """
+        Args:
+            width (int): Ширина в пикселях
+            height (int): Высота в пикселях
+            background (tuple): Цвет фона RGB или RGBA в 0..1 (без альфы - непрозрачный)
+        """
+        self.width = width
+        self.height = height
+        red, green, blue, alpha = (tuple(background) + (1.0,))[:4]
+        self.background = np.array([red * alpha, green * alpha, blue * alpha, alpha], dtype=np.float32)
+        self.image = np.empty((4, height, width), dtype=np.float32)  # Плоскости R, G, B, A
+        self._footprints = {}  # Диаметр -> смещения и покрытие диска
+        self._cells = np.empty(0, dtype=np.intp)  # Пиксели дисков всех точек кадра (растет по мере нужды)
+        self._weights = np.empty(0)  # log(1 - a*w) для каждого пикселя диска
+        self.set_view((0, width), (0, height))
+        self.clear()
+
+    def set_view(self, xlim, ylim):
+        """
+        Видимая область данных: вписывается в изображение по центру с равным масштабом осей
+        (как set_aspect('equal', adjustable='box')); ось Y направлена вверх
+
+        Args:
+            xlim (tuple): Границы по X
+            ylim (tuple): Границы по Y
+        """
+        self.scale = min(self.width / (xlim[1] - xlim[0]), self.height / (ylim[1] - ylim[0]))
+        self.origin = (self.width / 2 - (xlim[0] + xlim[1]) / 2 * self.scale,
+                       self.height / 2 + (ylim[0] + ylim[1]) / 2 * self.scale)
+
+    def clear(self):
+        """
+        Заливка фоном
+        """
+        for plane, value in zip(self.image, self.background):
+            plane.fill(value)
+
+    def splat(self, points, color, alpha=1.0, diameter=1.0):
+        """
+        Наложение слоя точек одного цвета, прозрачности и размера
+
+        Args:
+            points (np.array): Координаты точек в данных (N, 2)
+            color (tuple): Цвет RGB в 0..1
+            alpha (float): Прозрачность слоя
+            diameter (float): Диаметр точки в пикселях (см. marker_diameter)
+        """
+        self.splat_layers([(points, alpha, diameter)], color)
+
+    def splat_layers(self, layers, color):
+        """
+        Наложение нескольких слоев точек одного цвета за один проход
+
+        Наложения точек одного цвета перестановочны, поэтому слои с разной
+        прозрачностью и размером точек дают тот же результат, что и
+        поочередные вызовы splat, но пропускание всех слоев копится в одном
+        массиве и изображение обновляется один раз.
+
+        Args:
+            layers (list): Слои (координаты точек (N, 2), прозрачность, диаметр в пикселях)
+            color (tuple): Цвет RGB в 0..1
+        """
+        stamps = []  # (пиксели центров x, y, смещения строк и столбцов диска, log(1 - a*w))
+        left = top = np.iinfo(np.intp).max
+        right = bottom = np.iinfo(np.intp).min
+        for points, alpha, diameter in layers:
+            rows, columns, coverage = self._footprint(diameter)
+            reach = int(np.max(np.abs(rows)))
+            # Пиксель центра каждой точки; остаются точки, диск которых задевает изображение
+            x = np.floor(points[:, 0] * self.scale + self.origin[0]).astype(np.intp)
+            y = np.floor(self.origin[1] - points[:, 1] * self.scale).astype(np.intp)
+            near = (x >= -reach) & (x < self.width + reach) & (y >= -reach) & (y < self.height + reach)
+            if not near.all():
+                x, y = x[near], y[near]
+            if not len(x):
+                continue
+            stamps.append((x, y, rows, columns, np.log1p(-np.minimum(alpha * coverage, 1 - 1e-7))))
+            # Прямоугольник всех слоев с полями под диски: проверка каждого пикселя диска не нужна
+            left, right = min(left, x.min() - reach), max(right, x.max() + reach + 1)
+            top, bottom = min(top, y.min() - reach), max(bottom, y.max() + reach + 1)
+        if not stamps:
+            return
+
+        box_width = right - left
+        total = sum(len(x) * len(rows) for x, _, rows, _, _ in stamps)
+        if len(self._cells) < total:
+            self._cells = np.empty(total, dtype=np.intp)
+            self._weights = np.empty(total)
+        position = 0
+        for x, y, rows, columns, opacity in stamps:
+            end = position + len(x) * len(rows)
+            cells = self._cells[position:end].reshape(len(x), len(rows))
+            np.add(((y - top) * box_width + (x - left))[:, np.newaxis], rows * box_width + columns, out=cells)
+            self._weights[position:end].reshape(len(x), len(rows))[:] = opacity
+            position = end
+        # Сумма log(1 - a*w) по пикселю - логарифм доли, пропущенной всеми слоями
+        log_transmission = np.bincount(self._cells[:total], weights=self._weights[:total],
+                                       minlength=box_width * (bottom - top)).reshape(bottom - top, box_width)
+
+        # Наложение на видимую часть прямоугольника
+        visible = (slice(max(top, 0), min(bottom, self.height)), slice(max(left, 0), min(right, self.width)))
+        log_transmission = log_transmission[visible[0].start - top:visible[0].stop - top,
+                                            visible[1].start - left:visible[1].stop - left]
+        transmission = np.exp(log_transmission, dtype=np.float32)
+        source = tuple(color)[:3] + (1.0,)
+        for plane, value in zip(self.image, source):
+            pixels = plane[visible]
+            pixels -= value
+            pixels *= transmission
+            pixels += value  # (P - цвет) * T + цвет = цвет * (1 - T) + P * T
+
+    def _footprint(self, diameter):
+        """
+        Диск диаметра diameter (кэшируется: у слоев постоянные размеры точек)
+        """
+        footprint = self._footprints.get(diameter)
+        if footprint is None:
+            footprint = self._footprints[diameter] = disc_footprint(diameter)
+        return footprint
+
+    def to_rgb(self, out=None):
+        """
+        Изображение RGB uint8 (H, W, 3) поверх черного
+
+        Args:
+            out (np.array): Массив (H, W, 3) uint8 для результата (None - новый)
+
+        Returns:
+            np.array: Изображение RGB
+        """
+        if out is None:
+            out = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        channel = np.empty((self.height, self.width), dtype=np.float32)
+        for index in range(3):
+            np.multiply(self.image[index], 255, out=channel)
+            channel += 0.5
+            np.clip(channel, 0, 255, out=channel)
+            out[:, :, index] = channel  # Приведение к uint8 отбрасывает дробную часть: с +0.5 это округление
+        return out
+
+
+def _png_chunk(kind, data):
+    """
+    Чанк PNG: длина, тип, данные и CRC32 типа с данными
+    """
+    return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+
+
+def encode_png(rgb, level=6):
+    """
+    Кодирование изображения в PNG только средствами zlib
+
+    Каждая строка кодируется фильтром Up (разность с предыдущей строкой):
+    у гладких изображений разности в основном нулевые и сжимаются лучше.
+
+    Args:
+        rgb (np.array): Изображение (H, W, 3) RGB или (H, W, 4) RGBA uint8
+        level (int): Уровень сжатия zlib 0..9
+
+    Returns:
+        bytes: Файл PNG
+    """
+    height, width, channels = rgb.shape
+    color_type = {3: 2, 4: 6}[channels]  # 2 - RGB, 6 - RGBA
+    rows = np.empty((height, 1 + width * channels), dtype=np.uint8)
+    rows[:, 0] = 2  # Фильтр Up; для первой строки предыдущая - нулевая
+    flat = rgb.reshape(height, width * channels)
+    rows[0, 1:] = flat[0]
+    np.subtract(flat[1:], flat[:-1], out=rows[1:, 1:])  # Разность по модулю 256
+    header = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n' + _png_chunk(b'IHDR', header)
+            + _png_chunk(b'IDAT', zlib.compress(rows.tobytes(), level)) + _png_chunk(b'IEND', b''))
+
+
+def write_png(path, rgb, level=6):
+    """
+    Запись изображения RGB или RGBA uint8 в файл PNG (см. encode_png)
+    """
+    with open(path, 'wb') as file:
+        file.write(encode_png(rgb, level))
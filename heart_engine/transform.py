@@ -0,0 +1,210 @@
+"""
+Поворот, пульсация и отражение облака точек
+"""
+import numpy as np  # Математические операции и работа с массивами
+
+# Порядок поворотов вокруг осей:
+#   'xyz' - сначала вокруг X, затем Y, затем Z (R = Rz·Ry·Rx, как в Heart-4, Heart-10 и Heart-13)
+#   'zyx' - сначала вокруг Z, затем Y, затем X (R = Rx·Ry·Rz, как в Heart-6..Heart-9)
+ROTATION_ORDERS = ('xyz', 'zyx')
+
+
+def rotation_matrix(angle_x=0.0, angle_y=0.0, angle_z=0.0, order='xyz'):
+    """
+    Матрица поворота вокруг трех осей
+
+    Args:
+        angle_x (float): Угол поворота вокруг оси X
+        angle_y (float): Угол поворота вокруг оси Y
+        angle_z (float): Угол поворота вокруг оси Z
+        order (str): Порядок поворотов ('xyz' или 'zyx', см. ROTATION_ORDERS)
+
+    Returns:
+        np.array: Матрица 3x3 (точка-столбец умножается слева)
+    """
+    cos_x, sin_x = np.cos(angle_x), np.sin(angle_x)
+    cos_y, sin_y = np.cos(angle_y), np.sin(angle_y)
+    cos_z, sin_z = np.cos(angle_z), np.sin(angle_z)
+    Rx = np.array([
+        [1, 0, 0],
+        [0, cos_x, -sin_x],
+        [0, sin_x, cos_x]
+    ])
+    Ry = np.array([
+        [cos_y, 0, sin_y],
+        [0, 1, 0],
+        [-sin_y, 0, cos_y]
+    ])
+    Rz = np.array([
+        [cos_z, -sin_z, 0],
+        [sin_z, cos_z, 0],
+        [0, 0, 1]
+    ])
+    if order == 'xyz':
+        return Rz @ Ry @ Rx
+    if order == 'zyx':
+        return Rx @ Ry @ Rz
+    raise ValueError(f"Неизвестный порядок поворотов: {order} (доступны {', '.join(ROTATION_ORDERS)})")
+
+
+def rotate_points(points, angle_x=0.0, angle_y=0.0, angle_z=0.0, order='xyz'):
+    """
+    Поворот точек вокруг трех осей
+
+    Args:
+        points (np.array): Массив точек (N, 3)
+        angle_x (float): Угол поворота вокруг оси X
+        angle_y (float): Угол поворота вокруг оси Y
+        angle_z (float): Угол поворота вокруг оси Z
+        order (str): Порядок поворотов ('xyz' или 'zyx')
+
+    Returns:
+        np.array: Повернутые точки
+    """
+    return np.dot(points, rotation_matrix(angle_x, angle_y, angle_z, order).T)
+
+
+def model_matrix(angles=(0.0, 0.0, 0.0), scale=1.0, offset=None, order='xyz', flip_y=False):
+    """
+    Матрица кадра 3x4: масштаб, сдвиг, поворот и отражение оси Y одним умножением
+
+    Точка в однородных координатах (x, y, z, 1) умножается на матрицу слева:
+    p' = F·R·(s·p + d) = (s·F·R)·p + F·R·d.
+
+    Args:
+        angles (tuple): Углы поворота вокруг осей X, Y и Z
+        scale (float): Масштаб (пульсация)
+        offset (np.array): Сдвиг точек перед поворотом (None - без сдвига)
+        order (str): Порядок поворотов ('xyz' или 'zyx')
+        flip_y (bool): Отразить ось Y после поворота (строки экрана идут сверху вниз)
+
+    Returns:
+        np.array: Матрица 3x4
+    """
+    rotation = rotation_matrix(*angles, order)
+    if flip_y:
+        rotation[1] *= -1
+    matrix = np.zeros((3, 4))
+    matrix[:, :3] = rotation * scale
+    if offset is not None:
+        # Сдвиг поворачивается вместе с точками
+        matrix[:, 3] = rotation @ np.asarray(offset, dtype=float)
+    return matrix
+
+
+def transform_points(points, angles=(0.0, 0.0, 0.0), scale=1.0, offset=None, order='xyz', flip_y=False):
+    """
+    Кадр облака точек: масштаб, сдвиг, поворот и отражение оси Y
+
+    Масштаб, поворот и отражение собираются в одну матрицу, поэтому
+    облако умножается на матрицу один раз, без промежуточных копий.
+    Для покадровой анимации без выделения памяти см. PointTransform.
+
+    Args:
+        points (np.array): Массив точек (N, 3)
+        angles (tuple): Углы поворота вокруг осей X, Y и Z
+        scale (float): Масштаб (пульсация)
+        offset (np.array): Сдвиг точек перед поворотом (None - без сдвига)
+        order (str): Порядок поворотов ('xyz' или 'zyx')
+        flip_y (bool): Отразить ось Y после поворота (строки экрана идут сверху вниз)
+
+    Returns:
+        np.array: Новый массив точек (N, 3)
+    """
+    matrix = model_matrix(angles, scale, offset, order, flip_y)
+    return np.dot(points, matrix[:, :3].T) + matrix[:, 3]
+
+
+class PointTransform:
+    """
+    Покадровое преобразование облака точек в координаты экрана без выделения памяти
+
+    Облако хранится структурой массивов (3, N) float32 (см. geometry.pack_points):
+    строки x, y и z непрерывны, поэтому каждый проход по координате читает
+    подряд идущую память, а облако занимает 12 байт на точку. Каждый кадр
+    облако умножается на матрицу кадра (model_matrix) одним вызовом BLAS прямо
+    в переиспользуемый буфер, сдвиг из последнего столбца матрицы добавляется
+    на месте. Проекция на экран (project) тоже пишет в заранее выделенные
+    массивы столбцов, строк и маски видимых точек.
+
+    Использование:
+        frame = PointTransform(pack_points(heart_points))
+        frame.apply(model_matrix(angles, scale, flip_y=True))
+        columns, rows, mask = frame.project((80, 40))
+    """
+
+    def __init__(self, points):
+        """
+        Args:
+            points (np.array): Облако точек сердца (3, N) - строки x, y и z
+        """
+        self.source = points  # Исходное облако (по нему вариант узнает свой буфер)
+        # Облако из кэша уже float32 со сплошными строками: копии нет, страницы читаются
+        # из файла. Уровни детализации (префиксы облака) тоже используются без копии
+        if points.dtype == np.float32 and points.strides[1] == points.itemsize:
+            self.coordinates = points
+        else:
+            self.coordinates = np.ascontiguousarray(points, dtype=np.float32)
+        count = self.coordinates.shape[1]
+        self.points = np.zeros((3, count), dtype=np.float32)  # Точки кадра: строки x, y и z
+        self.columns = np.zeros(count, dtype=np.intp)  # Столбцы экрана
+        self.rows = np.zeros(count, dtype=np.intp)  # Строки экрана
+        self.mask = np.zeros(count, dtype=bool)  # Точки внутри экрана
+        self._rotation = np.empty((3, 3), dtype=np.float32)  # Поворот с масштабом
+        self._offset = np.empty((3, 1), dtype=np.float32)  # Сдвиг кадра
+        self._scratch = np.empty(count, dtype=np.float32)
+        self._inside = np.empty(count, dtype=bool)
+
+    def __len__(self):
+        return self.points.shape[1]
+
+    def apply(self, matrix):
+        """
+        Преобразование облака матрицей кадра 3x4
+
+        Args:
+            matrix (np.array): Матрица 3x4 (см. model_matrix)
+
+        Returns:
+            np.array: Точки кадра (3, N) float32 - буфер перезаписывается следующим кадром
+        """
+        np.copyto(self._rotation, matrix[:, :3])
+        np.copyto(self._offset, matrix[:, 3:])
+        if len(self):
+            # matmul, в отличие от dot, не копирует строки префикса облака перед BLAS
+            np.matmul(self._rotation, self.coordinates, out=self.points)
+            if self._offset.any():
+                self.points += self._offset
+        return self.points
+
+    def project(self, resolution, extent=(2, 2), center=(2, 2)):
+        """
+        Проекция точек кадра на экран (как raster.project_points)
+
+        Координаты делятся на наибольшую по модулю в кадре, поэтому этот
+        множитель известен только после apply и применяется к тому же
+        буферу на месте.
+
+        Args:
+            resolution (tuple): Размер экрана в точках растеризации (ширина, высота)
+            extent (tuple): Делители полуразмаха по x и y
+            center (tuple): Делители центра экрана по x и y
+
+        Returns:
+            tuple: Столбцы, строки и маска видимых точек (все N точек; буферы перезаписываются)
+        """
+        if not len(self):
+            return self.columns, self.rows, self.mask
+        self.mask.fill(True)
+        for axis, size, target in ((0, resolution[0], self.columns), (1, resolution[1], self.rows)):
+            coordinate = self.points[axis]
+            peak = max(float(coordinate.max()), -float(coordinate.min())) or 1.0
+            np.multiply(coordinate, (size // extent[axis]) / peak, out=self._scratch)
+            np.add(self._scratch, size // center[axis], out=self._scratch)
+            # Отбрасывание дробной части к нулю, как astype(int)
+            np.copyto(target, self._scratch, casting='unsafe')
+            np.greater_equal(target, 0, out=self._inside)
+            self.mask &= self._inside
+            np.less(target, size, out=self._inside)
+            self.mask &= self._inside
+        return self.columns, self.rows, self.mask
@@ -0,0 +1,8 @@
+"""
+Общие настройки тестов: корень репозитория в пути импорта, чтобы импортировать heart_engine
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
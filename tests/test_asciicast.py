@@ -0,0 +1,104 @@
+"""
+Запись asciicast: события вывода и изменения размера терминала
+"""
+import json
+
+import heart_engine.preset as preset_module
+from heart_engine import AsciicastPlayer, AsciicastRecorder, HeartPreset, heart_outline
+from heart_engine.asciicast import CLEAR_SCREEN
+
+
+def read_events(path):
+    with open(path, encoding='utf-8') as file:
+        header = json.loads(file.readline())
+        return header, [json.loads(line) for line in file if line.strip()]
+
+
+def test_recorder_writes_resize_event(tmp_path):
+    path = tmp_path / 'heart.cast'
+    with AsciicastRecorder(str(path), 80, 24, clock=lambda: 1.5) as recorder:
+        recorder.write(b'a\nb')
+        recorder.resize(100, 30)
+        recorder.write(b'c')
+
+    header, events = read_events(path)
+    assert (header['width'], header['height']) == (80, 24)
+    assert events == [[0.0, 'o', CLEAR_SCREEN], [1.5, 'o', 'a\r\nb'], [1.5, 'r', '100x30'], [1.5, 'o', 'c']]
+
+    # Плеер выводит только события вывода
+    with AsciicastPlayer(str(path)) as player:
+        assert [data for _, data in player.events()] == [CLEAR_SCREEN.encode(), b'a\r\nb', b'c']
+
+
+class FakeScheduler:
+    """
+    Темп без ожидания: шаг за шагом до FRAMES кадров
+    """
+    FRAMES = 12
+    period = 1 / 30
+
+    def __init__(self, fps=30):
+        self.frame = 0
+
+    @property
+    def time(self):
+        return self.frame * self.period
+
+    def wait(self):
+        self.frame += 1
+        if self.frame >= self.FRAMES:
+            raise KeyboardInterrupt
+        return 1
+
+    def summary(self):
+        return ''
+
+
+class FakeResize:
+    """
+    Терминал 80x24, после шестого кадра - 100x30
+    """
+    scheduler = None
+
+    def __init__(self, layout, fallback=(80, 24)):
+        self.layout = layout
+        self.measured = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def poll(self):
+        step = FakeResize.scheduler.frame if FakeResize.scheduler is not None else 0
+        terminal = (80, 24) if step < 6 else (100, 30)
+        if terminal == self.measured:
+            return None
+        self.measured = terminal
+        return self.layout(*terminal)
+
+
+def test_resize_during_recording(tmp_path, monkeypatch):
+    def scheduler(fps=30):
+        FakeResize.scheduler = FakeScheduler(fps)
+        return FakeResize.scheduler
+
+    monkeypatch.setenv('HEART_CACHE_DIR', str(tmp_path / 'points'))
+    monkeypatch.setattr(preset_module, 'FrameScheduler', scheduler)
+    monkeypatch.setattr(preset_module, 'TerminalResize', FakeResize)
+    FakeResize.scheduler = None
+
+    path = tmp_path / 'heart.cast'
+    preset = HeartPreset('Test', generator=heart_outline, points=dict(scale=10, num_points=100),
+                         screen_size=(120, 40), extent=(3, 3))
+    preset._animate(['--serial', f'--record={path}'])
+
+    header, events = read_events(path)
+    assert (header['width'], header['height']) == (80, 24)
+    resizes = [index for index, event in enumerate(events) if event[1] == 'r']
+    assert [events[index][2] for index in resizes] == ['100x30']
+    # Сразу после события размера - кадр нового размера с очисткой экрана
+    frame = events[resizes[0] + 1]
+    assert frame[1] == 'o' and frame[2].startswith('\033[2J')
+    assert len([event for event in events if event[1] == 'o']) == FakeScheduler.FRAMES + 1
@@ -0,0 +1,43 @@
+"""
+DiffWriter: выбор между разницей с прошлым кадром и полным кадром
+"""
+import numpy as np
+
+from heart_engine import DiffWriter, Framebuffer
+
+
+def test_scattered_runs_fall_back_to_full_frame():
+    # Узкий кадр: в каждой строке меняется одна ячейка из четырех (25% - меньше половины),
+    # и каждое изменение стоит перемещения курсора дороже всей строки
+    framebuffer = Framebuffer(4, 20, '#@')
+    framebuffer.glyph[:] = 1
+    writer = DiffWriter()
+    writer.encode(framebuffer)
+
+    framebuffer.glyph[:, 2] = 2
+    diff_bytes = sum(len(b'\033[%d;3H@' % (row + 1)) for row in range(20))  # Разница: курсор и символ в каждой строке
+    full = framebuffer.encode()
+    assert diff_bytes > len(full)
+
+    data, is_full = writer.encode(framebuffer)
+    assert is_full and data == full
+
+
+def test_small_change_is_sent_as_diff():
+    framebuffer = Framebuffer(40, 20, '#@')
+    framebuffer.glyph[5:15, 10:30] = 1
+    writer = DiffWriter()
+    writer.encode(framebuffer)
+
+    framebuffer.glyph[10, 20] = 2
+    data, is_full = writer.encode(framebuffer)
+    assert not is_full
+    assert data == b'\033[11;21H@'
+
+
+def test_glyph_bytes_is_lower_bound_of_full_frame():
+    rng = np.random.default_rng(1)
+    framebuffer = Framebuffer(30, 10, '.:❤💗', palette=[b'\033[31m', b'\033[32m'])
+    framebuffer.glyph[:] = rng.integers(0, 5, size=(10, 30))
+    framebuffer.color[:] = rng.integers(0, 3, size=(10, 30))
+    assert 0 < framebuffer.glyph_bytes() <= len(framebuffer.encode())
@@ -0,0 +1,52 @@
+"""
+Варианты анимации сохраняют наборы символов исходных скриптов
+"""
+import os
+
+import pytest
+
+from heart_engine.offline import load_script
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Исходные наборы символов в записи исходных скриптов (до перехода на HeartPreset)
+ASCII_RAMP = " .'`^\",:;Il!i><~+_-?][}{1)(|/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
+ORIGINAL_RAMPS = {
+    'Heart-Terminal/Heart-1.py': ''.join(['❤', '💗', '💕', '💖', '💘', '💝', '💞', '💓']),
+    'Heart-Terminal/Heart-2.py': '░▒▓█',
+    'Heart-Terminal/Heart-3.py': ' .:-=+*#%@',
+    'Heart-Terminal/Heart-4.py': ASCII_RAMP[:30],  # create_shading_chars(30)
+    'Heart-Terminal/Heart-5.py': ' .:!*oe%&#@',
+    'Heart-Terminal/Heart-6.py': ' .:!*oe%&#@',
+    'Heart-Terminal/Heart-7.py': ' .:!*oe%&#@jhbkvnaihnvaqupanmbbnzsx48918046`4',
+    'Heart-Terminal/Heart-8.py': ' .:!*oe%&#@jhbkvnaihnvaqupanmbbnzsx48918046`4',
+    'Heart-Terminal/Heart-9.py': ''.join(chr(i) for i in range(32, 127)) * 8,
+    'Heart-Terminal/Heart-10.py': '.:-=+*#%@',
+    'Heart-Terminal/Heart-11.py': " .'`^\",:;Il!i><~+_-?][}{1)(|/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$",
+    'Heart-Terminal/Heart-12.py': ' .:!*OQ#',
+    'Heart-Terminal/Heart-13.py': ".:!*OQ#•●~`08'°></|Оо⊖⊘⊙⊚⊛⊜⊝◉○◌◍◎●◐◑◒⬬⬭⬮⬯",
+    'Heart-Terminal/Heart-14.py': " .'`^\",:;Il!i><~+_-?][}{1)(|/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$",
+    'Heart-Terminal/Heart-15(h-12).py': ' .:!*OQ#',
+    'Heart-Terminal/Heart-16(h-12).py': ' .:!*OQ#',
+    'Heart-Terminal/Heart-17.py': ' .:!*OQ#',
+    'Heart-Terminal/Heart-18(h-12).py': ' .:!*OQ#',
+    'Heart-Terminal/Heart-19(h-13).py': ' .:-=+*#%@',
+    'Heart-Terminal/Heart-20(h-13).py': ' .:-=+*#%@',
+    'Heart-Terminal/Heart-21(h-13).py': ".:!*OQ#•●~`08'°></|Оо⊖⊘⊙⊚⊛⊜⊝◉○◌◍◎●◐◑◒⬬⬭⬮⬯",
+    'Heart-Terminal/Heart-22(h-10).py': '.:-=+*#%@',
+    'Heart-Terminal/Heart-23(h-10).py': '.:-=+*#%@',
+    'I-love-mom/I-LOVE-MOM.py': ' .:!*OQ#',
+    'I-love-mom/I-LOVE-MOM-1.py': ' .:!*OQ#',
+}
+
+
+@pytest.mark.parametrize('script', sorted(ORIGINAL_RAMPS))
+def test_shading_chars_match_original(script):
+    preset = load_script(os.path.join(ROOT, script))
+    assert preset.shading_chars == ORIGINAL_RAMPS[script]
+
+
+def test_ascii_ramp_has_no_stray_backslash():
+    # Одна кавычка без обратной косой черты: 69 символов, как в исходных скриптах
+    assert len(ASCII_RAMP) == 69
+    assert '\\' not in ASCII_RAMP